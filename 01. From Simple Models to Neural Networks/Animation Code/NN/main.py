@@ -1,5 +1,13 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import SeededSceneMixin, proxy
+from nnseries.activations import sigmoid
+from nnseries.datasets import rings, shells, split, wavy_halves
+from nnseries.plotting import axes_dots, plot
 
 class DecisionBoundary(Scene):
     def construct(self):
@@ -29,8 +37,8 @@ class DecisionBoundary(Scene):
         low_risk = [(50, 150), (55, 160), (65, 155), (70, 165)]
 
         # Plot points
-        high_dots = VGroup(*[Dot(axes.c2p(x, y), color=RED) for x, y in high_risk])
-        low_dots = VGroup(*[Dot(axes.c2p(x, y), color=BLUE) for x, y in low_risk])
+        high_dots = axes_dots(axes, high_risk, color=RED)
+        low_dots = axes_dots(axes, low_risk, color=BLUE)
         
         # Add labels
         high_label = Text("High Risk", color=RED).next_to(high_dots, RIGHT)
@@ -46,8 +54,8 @@ class DecisionBoundary(Scene):
 
         # Animate decision boundary (model learning)
         # Start with a random line
-        final_line = axes.plot(lambda x: -0.3 * x + 200, color=YELLOW)
-        start_line = axes.plot(lambda x: 0.5 * x + 135, color=YELLOW)
+        final_line = plot(axes, lambda x: -0.3 * x + 200, color=YELLOW)
+        start_line = plot(axes, lambda x: 0.5 * x + 135, color=YELLOW)
 
 
         self.play(Create(start_line))
@@ -274,8 +282,8 @@ class SimpleCase(ThreeDScene):
         points_class2_coords = [(90, 180), (100, 190), (85, 175)]
 
         # Convert to Dots
-        points_class1 = VGroup(*[Dot(axes.c2p(x, y), color=BLUE) for x, y in points_class1_coords])
-        points_class2 = VGroup(*[Dot(axes.c2p(x, y), color=RED) for x, y in points_class2_coords])
+        points_class1 = axes_dots(axes, points_class1_coords, color=BLUE)
+        points_class2 = axes_dots(axes, points_class2_coords, color=RED)
 
         # Linear separator line
         line = axes.plot_line_graph(
@@ -292,7 +300,7 @@ class SimpleCase(ThreeDScene):
         self.wait(2)
 
         # Add "misplaced" points that break the line
-        extra_points = VGroup(*[Dot(axes.c2p(x, y), color=BLUE) for x, y in [(95, 155), (70, 145)]]) 
+        extra_points = axes_dots(axes, [(95, 155), (70, 145)], color=BLUE)
 
         new_title = Text("Not Always Linearly Separable").scale(0.7).to_edge(UP)
 
@@ -312,12 +320,8 @@ class SimpleCase(ThreeDScene):
 
         # 2D points
         points2d = VGroup(
-            Dot(axes2d.c2p(50, 150), color=BLUE),
-            Dot(axes2d.c2p(60, 160), color=BLUE),
-            Dot(axes2d.c2p(55, 170), color=BLUE),
-            Dot(axes2d.c2p(90, 180), color=RED),
-            Dot(axes2d.c2p(100, 190), color=RED),
-            Dot(axes2d.c2p(85, 175), color=RED)
+            *axes_dots(axes2d, [(50, 150), (60, 160), (55, 170)], color=BLUE),
+            *axes_dots(axes2d, [(90, 180), (100, 190), (85, 175)], color=RED),
         )
 
         # Show 2D plot
@@ -342,13 +346,14 @@ class ComplexCase(ThreeDScene):
         ).to_edge(DOWN)
 
         # 3D points
+        sphere_resolution = proxy.resolution((24, 12))
         points3d = VGroup(
-            Sphere(radius=0.05, color=BLUE).move_to(axes3d.c2p(50, 150, 30)),
-            Sphere(radius=0.05, color=BLUE).move_to(axes3d.c2p(60, 160, 40)),
-            Sphere(radius=0.05, color=BLUE).move_to(axes3d.c2p(55, 170, 35)),
-            Sphere(radius=0.05, color=RED).move_to(axes3d.c2p(90, 180, 50)),
-            Sphere(radius=0.05, color=RED).move_to(axes3d.c2p(100, 190, 60)),
-            Sphere(radius=0.05, color=RED).move_to(axes3d.c2p(85, 175, 45))
+            Sphere(radius=0.05, color=BLUE, resolution=sphere_resolution).move_to(axes3d.c2p(50, 150, 30)),
+            Sphere(radius=0.05, color=BLUE, resolution=sphere_resolution).move_to(axes3d.c2p(60, 160, 40)),
+            Sphere(radius=0.05, color=BLUE, resolution=sphere_resolution).move_to(axes3d.c2p(55, 170, 35)),
+            Sphere(radius=0.05, color=RED, resolution=sphere_resolution).move_to(axes3d.c2p(90, 180, 50)),
+            Sphere(radius=0.05, color=RED, resolution=sphere_resolution).move_to(axes3d.c2p(100, 190, 60)),
+            Sphere(radius=0.05, color=RED, resolution=sphere_resolution).move_to(axes3d.c2p(85, 175, 45))
         )
 
         # Labels
@@ -374,7 +379,7 @@ class ComplexCase(ThreeDScene):
         surface = Surface(
             lambda u, v: axes3d.c2p(u, v, 40 + 10 * np.sin(u/10) * np.cos(v/20)),
             u_range=[40, 120], v_range=[140, 200],
-            resolution=(12, 12),
+            resolution=proxy.resolution((12, 12)),
             fill_opacity=0.4,
             checkerboard_colors=[PURPLE, PURPLE],
         )
@@ -462,7 +467,7 @@ class NeuronVisualization(Scene):
             y_range=[-1,1,0.5],
             x_length=4, y_length=2
         ).shift(RIGHT*5)
-        sigmoid_graph = axes.plot(lambda x: 1/(1+np.exp(-x)), color=YELLOW)
+        sigmoid_graph = sigmoid.plot(axes, color=YELLOW)
         axes_labels = axes.get_axis_labels(x_label="z", y_label="Activation")
         self.play(Create(axes), Write(axes_labels))
         self.play(Create(sigmoid_graph))
@@ -534,23 +539,14 @@ class OutroNextVideo(Scene):
         self.play(FadeIn(teaser))
         self.wait(7)
 
-class CircularPattern(Scene):
+class CircularPattern(SeededSceneMixin, Scene):
     def construct(self):
         # --- Part 1: Circular pattern data ---
-        inner_points = VGroup(*[
-            Dot([0.3*np.cos(a) + 0.2*np.random.randn(),
-                 0.3*np.sin(a) + 0.2*np.random.randn(), 0], 
-                 color=BLUE)
-            for a in np.linspace(0, 2*np.pi, 20)
-        ])
+        inner, outer = split(*rings(counts=(20, 40), radii=(0.3, 1.5), noise=(0.2, 0.3), seed=self.seed), classes=(0, 1))
+        inner_points = VGroup(*[Dot(point, color=BLUE) for point in inner])
 
         # Outer cluster (red, noisy ring)
-        outer_points = VGroup(*[
-            Dot([1.5*np.cos(a) + 0.3*np.random.randn(),
-                 1.5*np.sin(a) + 0.3*np.random.randn(), 0], 
-                 color=RED)
-            for a in np.linspace(0, 2*np.pi, 40)
-        ])
+        outer_points = VGroup(*[Dot(point, color=RED) for point in outer])
 
         self.play(FadeIn(inner_points), FadeIn(outer_points))
         self.wait(5)
@@ -600,18 +596,12 @@ class NonLinear3D(ThreeDScene):
         self.move_camera(phi=65 * DEGREES, theta=-45 * DEGREES)
 
         # Define nonlinear clusters
-        np.random.seed(1)
-        inner_points = np.random.randn(20, 3) * 0.5   # cluster near origin
-        outer_points = np.array([
-            [2*np.cos(a) + 0.3*np.random.randn(),
-             2*np.sin(a) + 0.3*np.random.randn(),
-             np.sin(2*a) + 0.3*np.random.randn()]
-            for a in np.linspace(0, 2*np.pi, 30)
-        ])
+        # cluster near origin inside a wavy ring
+        inner_points, outer_points = split(*shells(counts=(20, 30), noise=0.3, seed=1, legacy=True), classes=(0, 1))
 
         # Convert to Dots
-        inner_group = VGroup(*[Dot3D(point, color=BLUE, radius=0.05) for point in inner_points])
-        outer_group = VGroup(*[Dot3D(point, color=RED, radius=0.05) for point in outer_points])
+        inner_group = VGroup(*[Dot3D(point, color=BLUE, radius=0.05) for point in proxy.subsample(inner_points)])
+        outer_group = VGroup(*[Dot3D(point, color=RED, radius=0.05) for point in proxy.subsample(outer_points)])
 
         self.play(LaggedStartMap(FadeIn, inner_group, lag_ratio=0.1, run_time=2))
         self.play(LaggedStartMap(FadeIn, outer_group, lag_ratio=0.1, run_time=2))
@@ -622,6 +612,7 @@ class NonLinear3D(ThreeDScene):
             lambda u, v: axes.c2p(u, v, 0),  # z = 0
             u_range=[-3, 3],
             v_range=[-3, 3],
+            resolution=proxy.resolution(32),
             fill_opacity=0.3,
             checkerboard_colors=[YELLOW, YELLOW]
         )
@@ -638,23 +629,11 @@ class NonLinear3D(ThreeDScene):
 class NonLinearBoundary(Scene):
     def construct(self):
         # Generate data points in circular halves
-        np.random.seed(1)
-        n_points = 600
-        radius = 3
-        
-        # Define wavy boundary function
-        def boundary(x):
-            return 0.7 * np.sin(1.5 * x)
-
-        blue_points, orange_points = [], []
-        while len(blue_points) + len(orange_points) < n_points:
-            x, y = np.random.uniform(-radius, radius, 2)
-            if x**2 + y**2 <= radius**2:  # inside circle
-                if y < boundary(x):
-                    blue_points.append([x, y, 0])
-                else:
-                    orange_points.append([x, y, 0])
-        
+        # Points in a disc, split by the wavy boundary y = 0.7 sin(1.5x)
+        blue_points, orange_points = split(*wavy_halves(
+            count=proxy.samples(600), radius=3, amplitude=0.7, frequency=1.5, seed=1, legacy=True
+        ), classes=(0, 1))
+
         blue_dots = VGroup(*[Dot(point, radius=0.04, color=BLUE) for point in blue_points])
         orange_dots = VGroup(*[Dot(point, radius=0.04, color=ORANGE) for point in orange_points])
 
@@ -673,7 +652,7 @@ class NonLinearBoundary(Scene):
 
         wavy_points = [
             [x, wavy_function(x), 0]
-            for x in np.linspace(-3.5, 3.5, 100)
+            for x in np.linspace(-3.5, 3.5, proxy.samples(100))
         ]
         
         wavy_curve = VMobject(color=RED, stroke_width=6)
@@ -698,29 +677,23 @@ class CurvedGlassLayers(ThreeDScene):
         self.play(Create(axes), run_time=2)
 
         # --- Step 1: Non-linear data points ---
-        np.random.seed(2)
-        # Inner cluster
-        inner = np.random.randn(20, 3) * 0.5
-        # Outer cluster (non-linear)
-        outer = np.array([
-            [2*np.cos(a) + 0.2*np.random.randn(),
-             2*np.sin(a) + 0.2*np.random.randn(),
-             np.sin(2*a) + 0.2*np.random.randn()]
-            for a in np.linspace(0, 2*np.pi, 30)
-        ])
+        # Inner cluster and outer (non-linear) ring
+        inner, outer = split(*shells(counts=(20, 30), noise=0.2, seed=2, legacy=True), classes=(0, 1))
 
-        inner_dots = VGroup(*[Dot3D(pt, color=BLUE, radius=0.05) for pt in inner])
-        outer_dots = VGroup(*[Dot3D(pt, color=RED, radius=0.05) for pt in outer])
+        inner_dots = VGroup(*[Dot3D(pt, color=BLUE, radius=0.05) for pt in proxy.subsample(inner)])
+        outer_dots = VGroup(*[Dot3D(pt, color=RED, radius=0.05) for pt in proxy.subsample(outer)])
 
         self.play(LaggedStartMap(FadeIn, inner_dots, lag_ratio=0.05), 
                   LaggedStartMap(FadeIn, outer_dots, lag_ratio=0.05), run_time=3)
         self.wait(1)
 
         # --- Step 2: Flat plane (linear model) ---
+        mesh = proxy.resolution(32)
         plane = Surface(
             lambda u, v: axes.c2p(u, v, 0),
             u_range=[-3, 3],
             v_range=[-3, 3],
+            resolution=mesh,
             checkerboard_colors=[YELLOW, YELLOW],
             fill_opacity=0.3,
         )
@@ -732,6 +705,7 @@ class CurvedGlassLayers(ThreeDScene):
             lambda u, v: axes.c2p(u, v, 0.3*np.sin(u)*np.cos(v)),
             u_range=[-3, 3],
             v_range=[-3, 3],
+            resolution=mesh,
             fill_opacity=0.25,
             checkerboard_colors=[GREEN, GREEN],
         )
@@ -739,6 +713,7 @@ class CurvedGlassLayers(ThreeDScene):
             lambda u, v: axes.c2p(u, v, 0.5*np.sin(u+v)),
             u_range=[-3, 3],
             v_range=[-3, 3],
+            resolution=mesh,
             fill_opacity=0.25,
             checkerboard_colors=[TEAL, TEAL],
         )
@@ -746,6 +721,7 @@ class CurvedGlassLayers(ThreeDScene):
             lambda u, v: axes.c2p(u, v, 0.7*np.cos(u)*np.sin(v)),
             u_range=[-3, 3],
             v_range=[-3, 3],
+            resolution=mesh,
             fill_opacity=0.25,
             checkerboard_colors=[PURPLE, PURPLE],
         )
@@ -808,21 +784,10 @@ class NeuralNetworkLayers(Scene):
 
 class NeuralNetworkCircularBoundary(Scene):
     def construct(self):
-        np.random.seed(4)
         # --- Data points ---
-        inner_points = VGroup(*[
-            Dot([0.3*np.cos(a) + 0.2*np.random.randn(),
-                 0.3*np.sin(a) + 0.2*np.random.randn(), 0], 
-                 color=BLUE)
-            for a in np.linspace(0, 2*np.pi, 20)
-        ])
-
-        outer_points = VGroup(*[
-            Dot([1.5*np.cos(a) + 0.3*np.random.randn(),
-                 1.5*np.sin(a) + 0.3*np.random.randn(), 0], 
-                 color=RED)
-            for a in np.linspace(0, 2*np.pi, 40)
-        ])
+        inner, outer = split(*rings(counts=(20, 40), radii=(0.3, 1.5), noise=(0.2, 0.3), seed=4, legacy=True), classes=(0, 1))
+        inner_points = VGroup(*[Dot(point, color=BLUE) for point in inner])
+        outer_points = VGroup(*[Dot(point, color=RED) for point in outer])
 
         self.play(LaggedStartMap(FadeIn, inner_points, lag_ratio=0.05),
                   LaggedStartMap(FadeIn, outer_points, lag_ratio=0.03), run_time=3)
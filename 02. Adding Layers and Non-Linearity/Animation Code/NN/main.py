@@ -1,5 +1,13 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import BatchedGrowArrow, SeededSceneMixin, proxy, shared_copy
+from nnseries.datasets import disc_and_ring, rings, split
+from nnseries.activations import gaussian, relu, sigmoid, tanh
+from nnseries.plotting import axes_dots, coords_to_points, smooth_curve
 
 class LinearBoundaryDemo(Scene):
     def construct(self):
@@ -29,11 +37,8 @@ class LinearBoundaryDemo(Scene):
 
         # First: Linearly separable points
         np.random.seed(0)
-        blue_points = [axes.c2p(x, y) for x, y in np.random.randn(10, 2) + np.array([-2, -2])]
-        red_points = [axes.c2p(x, y) for x, y in np.random.randn(10, 2) + np.array([2, 2])]
-
-        blue_dots = VGroup(*[Dot(p, color=BLUE) for p in blue_points])
-        red_dots = VGroup(*[Dot(p, color=RED) for p in red_points])
+        blue_dots = axes_dots(axes, np.random.randn(10, 2) + np.array([-2, -2]), color=BLUE)
+        red_dots = axes_dots(axes, np.random.randn(10, 2) + np.array([2, 2]), color=RED)
 
         self.play(FadeIn(blue_dots), FadeIn(red_dots))
         self.wait(1)
@@ -53,11 +58,9 @@ class LinearBoundaryDemo(Scene):
 
         # New data: Blue in a circle, red outside
         theta = np.linspace(0, 2 * np.pi, 20)
-        blue_circle = [axes.c2p(np.cos(t), np.sin(t)) for t in theta]
-        red_outside = [axes.c2p(r*np.cos(t), r*np.sin(t)) for t in theta for r in [2]]
-
-        blue_dots2 = VGroup(*[Dot(p, color=BLUE) for p in blue_circle])
-        red_dots2 = VGroup(*[Dot(p, color=RED) for p in red_outside])
+        circle = np.column_stack([np.cos(theta), np.sin(theta)])
+        blue_dots2 = axes_dots(axes, circle, color=BLUE)
+        red_dots2 = axes_dots(axes, 2 * circle, color=RED)
 
         self.play(FadeIn(blue_dots2), FadeIn(red_dots2))
         self.wait(1)
@@ -104,12 +107,9 @@ class ActivationDemo(Scene):
         self.wait(0.2)
 
         # --- Data (blue inside, red outside) ---
-        theta = np.linspace(0, 2 * np.pi, 24)
-        blue_pts = [axes.c2p(np.cos(t), np.sin(t)) for t in theta]
-        red_pts = [axes.c2p(2 * np.cos(t), 2 * np.sin(t)) for t in theta]
-
-        blue_dots = VGroup(*[Dot(p, color=BLUE) for p in blue_pts])
-        red_dots = VGroup(*[Dot(p, color=RED) for p in red_pts])
+        blue_xy, red_xy = split(*rings(counts=(24, 24), radii=(1, 2)), classes=(0, 1))
+        blue_dots = axes_dots(axes, blue_xy[:, :2], color=BLUE)
+        red_dots = axes_dots(axes, red_xy[:, :2], color=RED)
 
         self.play(FadeIn(blue_dots), FadeIn(red_dots), run_time=1)
         self.wait(0.2)
@@ -123,24 +123,17 @@ class ActivationDemo(Scene):
         factor = ValueTracker(0.0)
 
         # Helper that returns an always_redraw VMobject representing one side (top or bottom).
-        def make_bending_mobject(sign=1, samples=120):
+        def make_bending_mobject(sign=1, samples=proxy.samples(120)):
+            s_vals = np.linspace(-1.5, 1.5, samples)
+            # final curve (circle of radius 1.5): y = ±sqrt(1.5 - s^2)
+            p_final = coords_to_points(axes, np.column_stack([s_vals, sign * np.sqrt(np.maximum(0.0, 1.5**2 - s_vals**2))]))
+            # initial vertical segment points (x = 0, y = s)
+            p_initial = coords_to_points(axes, np.column_stack([np.zeros_like(s_vals), s_vals]))
+
             def _mobject():
-                s_vals = np.linspace(-1.5, 1.5, samples)
-                pts = []
-                for s in s_vals:
-                    # final curve (circle of radius 1.5): y = ±sqrt(1.5 - s^2)
-                    y_final = sign * np.sqrt(max(0.0, 1.5**2 - s * s))
-                    p_final = np.array(axes.c2p(s, y_final))
-                    # initial vertical segment point (x = 0, y = s)
-                    p_initial = np.array(axes.c2p(0.0, s))
-                    t = factor.get_value()
-                    p = (1 - t) * p_initial + t * p_final
-                    pts.append(p)
-                vm = VMobject()
-                # create a smooth curve through the sampled points
-                vm.set_points_smoothly(pts)
-                vm.set_color(YELLOW)
-                return vm
+                t = factor.get_value()
+                # smooth curve through the blended sample points
+                return smooth_curve((1 - t) * p_initial + t * p_final, color=YELLOW)
             return always_redraw(_mobject)
 
         top_curve = make_bending_mobject(sign=1)
@@ -149,7 +142,7 @@ class ActivationDemo(Scene):
         # Replace the initial line with the top curve object (at factor=0 they coincide),
         # add the bottom curve (it will also coincide at factor=0).
         # We call Transform with the current top_curve state (factor=0) so the morph looks natural.
-        static_top = top_curve.copy()
+        static_top = shared_copy(top_curve)
         self.play(Transform(initial_line, static_top), run_time=1)
 
         # Now replace static_top with the real updating top_curve
@@ -207,12 +200,12 @@ class StepFunctionDemo(Scene):
 
         # 5. Highlight above the threshold: x>=0
         above_line = axes.plot(lambda x: 1, x_range=[0, 4], color=GREEN, stroke_width=6)
-        self.play(ReplacementTransform(right_line.copy(), above_line), run_time=1)
+        self.play(ReplacementTransform(shared_copy(right_line), above_line), run_time=1)
         self.wait(0.5)
 
         # 6. Highlight below the threshold: x<0
         below_line = axes.plot(lambda x: -1, x_range=[-4, 0], color=RED, stroke_width=6)
-        self.play(ReplacementTransform(left_line.copy(), below_line), run_time=1)
+        self.play(ReplacementTransform(shared_copy(left_line), below_line), run_time=1)
         self.wait(0.5)
 
         # 7. Display "Hard to learn"
@@ -241,26 +234,22 @@ class SigmoidFunctionDemo(Scene):
         ).shift(DOWN * 0.5)
         self.play(Create(axes), run_time=1.5)
 
-        # 4. Define sigmoid function
-        def sigmoid(x):
-            return 1 / (1 + np.exp(-x))
-
-        # 5. Plot sigmoid curve
-        sigmoid_graph = axes.plot(sigmoid, x_range=[-6, 6], color=YELLOW)
+        # 4. Plot sigmoid curve
+        sigmoid_graph = sigmoid.plot(axes, x_range=[-6, 6], color=YELLOW)
         self.play(Create(sigmoid_graph), run_time=1.5)
 
-        # 6. Highlight middle steep part
-        steep_part = axes.plot(sigmoid, x_range=[-2, 2], color=GREEN, stroke_width=6)
-        self.play(ReplacementTransform(sigmoid_graph.copy(), steep_part), run_time=1)
+        # 5. Highlight middle steep part
+        steep_part = sigmoid.plot(axes, x_range=[-2, 2], color=GREEN, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(sigmoid_graph), steep_part), run_time=1)
 
-        # 7. Highlight squashing regions
-        left_squash = axes.plot(sigmoid, x_range=[-6, -3], color=BLUE, stroke_width=6)
-        right_squash = axes.plot(sigmoid, x_range=[3, 6], color=BLUE, stroke_width=6)
-        self.play(ReplacementTransform(sigmoid_graph.copy(), left_squash), run_time=0.8)
-        self.play(ReplacementTransform(sigmoid_graph.copy(), right_squash), run_time=0.8)
+        # 6. Highlight squashing regions
+        left_squash = sigmoid.plot(axes, x_range=[-6, -3], color=BLUE, stroke_width=6)
+        right_squash = sigmoid.plot(axes, x_range=[3, 6], color=BLUE, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(sigmoid_graph), left_squash), run_time=0.8)
+        self.play(ReplacementTransform(shared_copy(sigmoid_graph), right_squash), run_time=0.8)
         self.wait(0.5)
 
-        # 8. Text: Perfect for probabilities
+        # 7. Text: Perfect for probabilities
         prob_text = Text("Perfect for probabilities", color=YELLOW, font_size=32)
         prob_text.next_to(axes, DOWN, buff=0.5)
         self.play(Write(prob_text), run_time=1.5)
@@ -287,25 +276,21 @@ class TanhFunctionDemo(Scene):
         ).shift(DOWN * 0.5)
         self.play(Create(axes), run_time=1.5)
 
-        # 4. Define tanh function
-        def tanh_fn(x):
-            return np.tanh(x)
-
-        # 5. Plot tanh curve
-        tanh_graph = axes.plot(tanh_fn, x_range=[-6, 6], color=YELLOW)
+        # 4. Plot tanh curve
+        tanh_graph = tanh.plot(axes, x_range=[-6, 6], color=YELLOW)
         self.play(Create(tanh_graph), run_time=1.5)
 
-        # 6. Highlight center steep region
-        center_region = axes.plot(tanh_fn, x_range=[-2, 2], color=GREEN, stroke_width=6)
-        self.play(ReplacementTransform(tanh_graph.copy(), center_region), run_time=1)
+        # 5. Highlight center steep region
+        center_region = tanh.plot(axes, x_range=[-2, 2], color=GREEN, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(tanh_graph), center_region), run_time=1)
 
-        # 7. Highlight squashing regions
-        left_squash = axes.plot(tanh_fn, x_range=[-6, -3], color=BLUE, stroke_width=6)
-        right_squash = axes.plot(tanh_fn, x_range=[3, 6], color=BLUE, stroke_width=6)
-        self.play(ReplacementTransform(tanh_graph.copy(), left_squash), run_time=0.8)
-        self.play(ReplacementTransform(tanh_graph.copy(), right_squash), run_time=0.8)
+        # 6. Highlight squashing regions
+        left_squash = tanh.plot(axes, x_range=[-6, -3], color=BLUE, stroke_width=6)
+        right_squash = tanh.plot(axes, x_range=[3, 6], color=BLUE, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(tanh_graph), left_squash), run_time=0.8)
+        self.play(ReplacementTransform(shared_copy(tanh_graph), right_squash), run_time=0.8)
 
-        # 8. Add explanatory text
+        # 7. Add explanatory text
         text = Text("Centered at zero → helps learning smoothly", font_size=32, color=YELLOW)
         text.next_to(axes, DOWN)
         self.play(Write(text), run_time=1.5)
@@ -333,26 +318,22 @@ class ReLUFunctionDemo(Scene):
         self.play(Create(axes), run_time=1.5)
         self.wait(0.5)
 
-        # 4. Define ReLU function
-        def relu_fn(x):
-            return np.maximum(0, x)
-
-        # 5. Plot ReLU curve
-        relu_graph = axes.plot(relu_fn, x_range=[-4, 4], color=YELLOW)
+        # 4. Plot ReLU curve
+        relu_graph = relu.plot(axes, x_range=[-4, 4], color=YELLOW)
         self.play(Create(relu_graph), run_time=1.5)
         self.wait(0.5)
 
-        # 6. Highlight zero region (negative x)
-        zero_region = axes.plot(relu_fn, x_range=[-4, 0], color=BLUE, stroke_width=6)
-        self.play(ReplacementTransform(relu_graph.copy(), zero_region), run_time=1)
+        # 5. Highlight zero region (negative x)
+        zero_region = relu.plot(axes, x_range=[-4, 0], color=BLUE, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(relu_graph), zero_region), run_time=1)
         self.wait(0.5)
 
-        # 7. Highlight linear growth region (positive x)
-        linear_region = axes.plot(relu_fn, x_range=[0, 4], color=GREEN, stroke_width=6)
-        self.play(ReplacementTransform(relu_graph.copy(), linear_region), run_time=1)
+        # 6. Highlight linear growth region (positive x)
+        linear_region = relu.plot(axes, x_range=[0, 4], color=GREEN, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(relu_graph), linear_region), run_time=1)
         self.wait(0.5)
 
-        # 8. Add explanatory text
+        # 7. Add explanatory text
         text = Text("Simple, efficient, and powerful", font_size=32, color=YELLOW)
         text.next_to(axes, DOWN)
         self.play(Write(text), run_time=1.5)
@@ -378,19 +359,15 @@ class GaussianFunctionDemo(Scene):
         ).shift(DOWN * 0.5)
         self.play(Create(axes), run_time=1)
 
-        # 4. Define Gaussian function
-        def gaussian_fn(x):
-            return np.exp(-x**2)
-
-        # 5. Plot Gaussian curve
-        gaussian_graph = axes.plot(gaussian_fn, x_range=[-4, 4], color=YELLOW)
+        # 4. Plot Gaussian curve
+        gaussian_graph = gaussian.plot(axes, x_range=[-4, 4], color=YELLOW)
         self.play(Create(gaussian_graph), run_time=1)
 
-        # 6. Highlight main peak around x = 0
-        peak_region = axes.plot(gaussian_fn, x_range=[-1, 1], color=GREEN, stroke_width=6)
-        self.play(ReplacementTransform(gaussian_graph.copy(), peak_region), run_time=1)
+        # 5. Highlight main peak around x = 0
+        peak_region = gaussian.plot(axes, x_range=[-1, 1], color=GREEN, stroke_width=6)
+        self.play(ReplacementTransform(shared_copy(gaussian_graph), peak_region), run_time=1)
 
-        # 7. Add explanatory text
+        # 6. Add explanatory text
         text = Text("Great for detecting localized patterns", font_size=32, color=YELLOW)
         text.next_to(axes, DOWN)
         self.play(Write(text), run_time=1.5)
@@ -424,7 +401,7 @@ class NeuralNetworkStackDemo(Scene):
         for node in input_nodes:
             arr = Arrow(start=node.get_right(), end=single_neuron.get_left(), buff=0.05, color=WHITE)
             arrows.add(arr)
-        self.play(*[GrowArrow(a) for a in arrows], run_time=2)
+        self.play(BatchedGrowArrow(*arrows), run_time=2)
         self.wait(0.5)
 
         # 5. Text: Single neuron bends decision boundary
@@ -454,7 +431,7 @@ class NeuralNetworkStackDemo(Scene):
             for src in layers[i]:
                 for dst in layers[i+1]:
                     arrows_layers.add(Arrow(src.get_right(), dst.get_left(), buff=0.05, color=WHITE))
-        self.play(*[GrowArrow(a) for a in arrows_layers], run_time=3)
+        self.play(BatchedGrowArrow(*arrows_layers), run_time=3)
         self.wait(0.5)
 
         # 9. Text explanation
@@ -643,15 +620,16 @@ class GaussianActivationDemo(Scene):
         self.play(Write(explanation), run_time=1.5)
         self.wait(2) 
 
-class CircularDatasetDemo(Scene):
+class CircularDatasetDemo(SeededSceneMixin, Scene):
     def construct(self):
         # 2. Generate circular dataset
         n_points = 40
         radius = 2
-        inner_points = [Dot(point=np.array([np.random.uniform(-1, 1)*radius*0.5,
-                                           np.random.uniform(-1, 1)*radius*0.5, 0]), color=BLUE) for _ in range(n_points//2)]
-        outer_points = [Dot(point=np.array([np.random.uniform(-1, 1)*radius*1.5,
-                                           np.random.uniform(-1, 1)*radius*1.5, 0]), color=RED) for _ in range(n_points//2)]
+        inner, outer = split(*disc_and_ring(
+            counts=(n_points//2, n_points//2), inner_radius=radius*0.7, outer_radius=radius*1.3, noise=0.15, seed=self.seed
+        ), classes=(0, 1))
+        inner_points = [Dot(point=p, color=BLUE) for p in inner]
+        outer_points = [Dot(point=p, color=RED) for p in outer]
         dataset = VGroup(*inner_points, *outer_points)
         self.play(FadeIn(dataset), run_time=2)
         self.wait(0.5)
@@ -732,7 +710,7 @@ class NeuralNetworkDepthSummary(Scene):
         self.play(*[FadeIn(h) for h in highlights], run_time=2)
         self.wait(2)
 
-class ActivationDepthDemo(Scene):
+class ActivationDepthDemo(SeededSceneMixin, Scene):
     def construct(self):
         # 1. Title
         title = Text("Stacking Layers for Non-Linearity", font_size=36).to_edge(UP)
@@ -740,8 +718,11 @@ class ActivationDepthDemo(Scene):
 
         # 2. Circular dataset
         n_points = 30
-        inner_points = [Dot(point=0.8*UP*np.random.rand() + 0.8*RIGHT*np.random.rand(), color=BLUE) for _ in range(n_points//2)]
-        outer_points = [Dot(point=1.5*UP*np.random.rand() + 1.5*RIGHT*np.random.rand(), color=RED) for _ in range(n_points//2)]
+        inner, outer = split(*disc_and_ring(
+            counts=(n_points//2, n_points//2), inner_radius=0.8, outer_radius=1.6, noise=0.1, seed=self.seed
+        ), classes=(0, 1))
+        inner_points = [Dot(point=p, color=BLUE) for p in inner]
+        outer_points = [Dot(point=p, color=RED) for p in outer]
         dataset = VGroup(*inner_points, *outer_points)
         self.play(FadeIn(dataset), run_time=2)
 
@@ -1,7 +1,14 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
 
-class NeuronLinearBehavior(Scene):
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import BatchedFadeOut, DirtyRegionMixin, PruneInvisibleMixin, RetimeMixin, SeededSceneMixin, TaggedSceneMixin, lazy
+from nnseries.activations import sigmoid
+from nnseries.counter import GlyphCounter
+
+class NeuronLinearBehavior(SeededSceneMixin, Scene):
     def construct(self):
         # Title
         title = Text("A Neuron Behaves Like Linear Regression", font_size=36)
@@ -152,7 +159,7 @@ class NeuronLinearBehavior(Scene):
         )
         
         # Fade out neural network visualization
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         
         # Create regression line visualization
         axes = Axes(
@@ -183,7 +190,7 @@ class NeuronLinearBehavior(Scene):
         
         # Intercept label
         intercept_label = MathTex("b = ", color=PURPLE).scale(0.9)
-        intercept_value = DecimalNumber(2, num_decimal_places=1, color=PURPLE).scale(0.9)
+        intercept_value = GlyphCounter(2, num_decimal_places=1, color=PURPLE).scale(0.9)
         intercept_value.next_to(intercept_label, RIGHT, buff=0.1)
         intercept_group = VGroup(intercept_label, intercept_value)
         intercept_group.to_corner(UR, buff=0.5)
@@ -197,17 +204,17 @@ class NeuronLinearBehavior(Scene):
             new_line = get_line(b)
             self.play(
                 Transform(regression_line, new_line),
-                intercept_value.animate.set_value(b),
+                intercept_value.tracker.animate.set_value(b),
                 run_time=0.8
             )
             self.wait(0.3)
         
         self.wait(1)
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(1)
 
-class WeightsAsVolumeKnobs(Scene):
+class WeightsAsVolumeKnobs(DirtyRegionMixin, Scene):
     def construct(self):
         
         # Volume knob graphic
@@ -220,7 +227,7 @@ class WeightsAsVolumeKnobs(Scene):
         
         # Weight value
         weight_label = MathTex("w =", color=WHITE).scale(0.8)
-        weight_value = DecimalNumber(0, num_decimal_places=2, color=YELLOW).scale(0.8)
+        weight_value = GlyphCounter(0, num_decimal_places=2, color=YELLOW).scale(0.8)
         weight_value.next_to(weight_label, RIGHT, buff=0.15)
         weight_group = VGroup(weight_label, weight_value)
         weight_group.next_to(knob_circle, DOWN, buff=0.5)
@@ -246,7 +253,7 @@ class WeightsAsVolumeKnobs(Scene):
         
         # Output value display
         output_text = Text("Volume: ", font_size=22, color=WHITE)
-        output_value = DecimalNumber(0, num_decimal_places=1, color=YELLOW).scale(0.9)
+        output_value = GlyphCounter(0, num_decimal_places=1, color=YELLOW).scale(0.9)
         output_value.next_to(output_text, RIGHT, buff=0.1)
         output_display = VGroup(output_text, output_value)
         output_display.next_to(output_bars, UP, buff=0.3)
@@ -263,25 +270,25 @@ class WeightsAsVolumeKnobs(Scene):
         
         # Function to light up bars based on weight
         def light_up_bars(num_bars):
+            lit, unlit = output_bars[:num_bars], output_bars[num_bars:]
             animations = []
-            for i, bar in enumerate(output_bars):
-                if i < num_bars:
-                    animations.append(bar.animate.set_fill(GREEN, opacity=0.9).set_stroke(GREEN, width=3))
-                else:
-                    animations.append(bar.animate.set_fill(GRAY, opacity=0.3).set_stroke(GRAY, width=2))
+            if len(lit):
+                animations.append(lazy(lit).set_fill(GREEN, opacity=0.9).set_stroke(GREEN, width=3))
+            if len(unlit):
+                animations.append(lazy(unlit).set_fill(GRAY, opacity=0.3).set_stroke(GRAY, width=2))
             return animations
         
         # Rotate knob and show weight changing with bar visualization
         for angle, w, bars in [(PI/3, 0.5, 2), (2*PI/3, 1.0, 5), (PI, 1.5, 7), (4*PI/3, 2.0, 10)]:
             self.play(
                 Rotate(knob_pointer, angle - knob_pointer.get_angle(), about_point=knob_circle.get_center()),
-                weight_value.animate.set_value(w),
-                output_value.animate.set_value(w * 5),
+                weight_value.tracker.animate.set_value(w),
+                output_value.tracker.animate.set_value(w * 5),
                 *light_up_bars(bars),
                 run_time=0.8
             )
             self.wait(0.3)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         
         # ICE CREAM SALES EXAMPLE
         # Title for ice cream example
@@ -347,7 +354,7 @@ class WeightsAsVolumeKnobs(Scene):
         self.wait(8)
         
         # Clear for hot chocolate example
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(0.5)
         
         # HOT CHOCOLATE EXAMPLE
@@ -412,7 +419,7 @@ class WeightsAsVolumeKnobs(Scene):
         self.play(Create(trend_line2))
         
         # Clear for training section
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         
         # Create a simple weight adjustment visualization
         weight_line = NumberLine(
@@ -464,10 +471,10 @@ class WeightsAsVolumeKnobs(Scene):
         
         self.wait(0.5)
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(1)
 
-class BiasVisualization(Scene):
+class BiasVisualization(TaggedSceneMixin, Scene):
     def construct(self):
         # Title
         title = Text("Each Neuron has a bias", font_size=32)
@@ -633,7 +640,7 @@ class BiasVisualization(Scene):
         self.wait(3)
         
         # Clear for final comparison
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(self.fade_out_all())
         
         # Left side: Weight controls
         left_axes = Axes(
@@ -693,7 +700,7 @@ class BiasVisualization(Scene):
         final_message.to_edge(DOWN, buff=0.3)
         self.play(Write(final_message))
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(self.fade_out_all())
         self.wait(1)
 
 class ActivationFunctions(Scene):
@@ -868,7 +875,7 @@ class ActivationFunctions(Scene):
         self.play(Write(stay_quiet))
         
         # Clear for final part
-        self.play(*[FadeOut(mob) for mob in self.mobjects if mob != title])
+        self.play(BatchedFadeOut(*[mob for mob in self.mobjects if mob != title]))
         self.wait(0.5)
         
         # PART 4: The transformation - linear to meaningful
@@ -947,10 +954,10 @@ class ActivationFunctions(Scene):
         self.play(Write(final_message))
         self.wait(2.0)
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(1)
 
-class NeuronDecisionMaker(Scene):
+class NeuronDecisionMaker(SeededSceneMixin, PruneInvisibleMixin, Scene):
     def construct(self):
         # Title
         title = Text("A Neuron: A Tiny Decision-Maker", font_size=40, color=GOLD)
@@ -1438,7 +1445,7 @@ class NeuronStacking(Scene):
         self.wait(2)
         
         # Clear for non-linearity section
-        self.play(*[FadeOut(mob) for mob in self.mobjects if mob != title])
+        self.play(BatchedFadeOut(*[mob for mob in self.mobjects if mob != title]))
         self.wait(0.5)
         
         # PART 4: Combining creates non-linearity
@@ -1479,11 +1486,8 @@ class NeuronStacking(Scene):
         )
         axes_right.shift(RIGHT * 3.5 + DOWN * 0.5)
         
-        def sigmoid(x):
-            return 1 / (1 + np.exp(-x))
-        
-        nonlinear_curve = axes_right.plot(
-            lambda x: sigmoid(0.8*x + 0.5), 
+        nonlinear_curve = sigmoid.plot(
+            axes_right, weight=0.8, bias=0.5,
             color=RED, x_range=[-3, 3], stroke_width=4
         )
         nonlinear_label = Text("y = σ(z)", font_size=22, color=RED)
@@ -1526,7 +1530,7 @@ class NeuronStacking(Scene):
         self.wait(2)
         
         # Clear for final visualization
-        self.play(*[FadeOut(mob) for mob in self.mobjects if mob != title])
+        self.play(BatchedFadeOut(*[mob for mob in self.mobjects if mob != title]))
         self.wait(0.5)
         
         # PART 5: Final network visualization
@@ -1615,10 +1619,10 @@ class NeuronStacking(Scene):
         self.play(Write(final_message))
         self.wait(3)
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(1)
 
-class SmartThermostatExample(Scene):
+class SmartThermostatExample(RetimeMixin, Scene):
     def construct(self):
         # Title
         title = Text("Real World: Smart Thermostat", font_size=40, color=BLUE)
@@ -1808,7 +1812,7 @@ class SmartThermostatExample(Scene):
 
         self.wait(1.0)
         
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        self.play(BatchedFadeOut(*self.mobjects), run_time=0.8)
         self.wait(0.3)
 
 class IntroText(Scene):
@@ -1893,7 +1897,7 @@ class IntroNeuronOverview(Scene):
         self.wait(1)
         
         # Fade out everything
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(BatchedFadeOut(*self.mobjects))
         self.wait(0.5)
         
         # Final message
@@ -1939,7 +1943,7 @@ class KeyTakeaways(Scene):
         self.wait(1.5)
         
         # Fade out everything
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        self.play(BatchedFadeOut(*self.mobjects), run_time=0.8)
         self.wait(0.5)
         
         # PREVIEW - Next video teaser
@@ -2034,5 +2038,5 @@ class KeyTakeaways(Scene):
         self.wait(3)
         
         # Fade out
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        self.play(BatchedFadeOut(*self.mobjects), run_time=0.8)
         self.wait(0.3)
\ No newline at end of file
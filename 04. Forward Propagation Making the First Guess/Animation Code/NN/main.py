@@ -1,7 +1,14 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
 
-class ForwardPropagation(Scene):
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import BatchedAnimation, DirtyRegionMixin, ImageSequenceMixin, PruneInvisibleMixin, SeededSceneMixin, TaggedSceneMixin, lazy, tag
+from nnseries.activations import relu
+from nnseries.counter import GlyphCounter
+
+class ForwardPropagation(DirtyRegionMixin, PruneInvisibleMixin, TaggedSceneMixin, Scene):
     def construct(self):
         # Configuration
         NEURON_RADIUS = 0.35
@@ -33,12 +40,12 @@ class ForwardPropagation(Scene):
         input_start = subtitle.text.index("input")
         input_end = input_start + len("input")
         self.play(
-            subtitle[input_start:input_end].animate.scale(1.2).set_color(YELLOW_E),
+            lazy(subtitle[input_start:input_end]).scale(1.2).set_color(YELLOW_E),
             run_time=0.5
         )
         self.wait(0.8)
         self.play(
-            subtitle[input_start:input_end].animate.scale(1/1.2).set_color(YELLOW),
+            lazy(subtitle[input_start:input_end]).scale(1/1.2).set_color(YELLOW),
             run_time=0.5
         )
         self.wait(0.3)
@@ -47,12 +54,12 @@ class ForwardPropagation(Scene):
         hidden_start = subtitle.text.index("hidden")
         hidden_end = hidden_start + len("hidden")
         self.play(
-            subtitle[hidden_start:hidden_end].animate.scale(1.2).set_color(YELLOW_E),
+            lazy(subtitle[hidden_start:hidden_end]).scale(1.2).set_color(YELLOW_E),
             run_time=0.5
         )
         self.wait(0.8)
         self.play(
-            subtitle[hidden_start:hidden_end].animate.scale(1/1.2).set_color(YELLOW),
+            lazy(subtitle[hidden_start:hidden_end]).scale(1/1.2).set_color(YELLOW),
             run_time=0.5
         )
         self.wait(0.3)
@@ -61,12 +68,12 @@ class ForwardPropagation(Scene):
         output_start = subtitle.text.index("output")
         output_end = output_start + len("output")
         self.play(
-            subtitle[output_start:output_end].animate.scale(1.2).set_color(YELLOW_E),
+            lazy(subtitle[output_start:output_end]).scale(1.2).set_color(YELLOW_E),
             run_time=0.5
         )
         self.wait(0.8)
         self.play(
-            subtitle[output_start:output_end].animate.scale(1/1.2).set_color(YELLOW),
+            lazy(subtitle[output_start:output_end]).scale(1/1.2).set_color(YELLOW),
             run_time=0.5
         )
         self.wait(0.3)
@@ -261,7 +268,7 @@ class ForwardPropagation(Scene):
                     
                     # Animate dot moving from start to end
                     animations.append(
-                        dot.animate.move_to(end_n.get_center())
+                        lazy(dot).move_to(end_n.get_center())
                     )
             
             return dots, animations
@@ -272,11 +279,11 @@ class ForwardPropagation(Scene):
         
         # Pulse input neurons
         self.play(
-            *[neuron.animate.set_fill(INPUT_COLOR, opacity=1).scale(1.15) for neuron in input_neurons],
+            BatchedAnimation(*input_neurons, fill_color=INPUT_COLOR, fill_opacity=1, scale=1.15),
             run_time=0.4
         )
         self.play(
-            *[neuron.animate.set_fill(INPUT_COLOR, opacity=0.8).scale(1/1.15) for neuron in input_neurons],
+            BatchedAnimation(*input_neurons, fill_color=INPUT_COLOR, fill_opacity=0.8, scale=1/1.15),
             run_time=0.4
         )
         self.wait(0.3)
@@ -284,39 +291,39 @@ class ForwardPropagation(Scene):
         # Show flow to hidden layer 1
         self.play(
             FadeOut(flow_label1),
-            FadeIn(Text("Hidden Layer 1", font_size=24, color=HIDDEN_COLOR).to_edge(UP, buff=0.4))
+            FadeIn(tag(Text("Hidden Layer 1", font_size=24, color=HIDDEN_COLOR).to_edge(UP, buff=0.4), "layer_label"))
         )
         
         dots1, flow_anims1 = create_flow_animation(input_neurons, hidden1_neurons, input_to_hidden1)
         self.add(dots1)
         self.play(*flow_anims1, run_time=1.2)
         self.play(
-            *[neuron.animate.set_fill(HIDDEN_COLOR, opacity=1).scale(1.1) for neuron in hidden1_neurons],
+            BatchedAnimation(*hidden1_neurons, fill_color=HIDDEN_COLOR, fill_opacity=1, scale=1.1),
             FadeOut(dots1),
             run_time=0.3
         )
         self.play(
-            *[neuron.animate.set_fill(HIDDEN_COLOR, opacity=0.7).scale(1/1.1) for neuron in hidden1_neurons],
+            BatchedAnimation(*hidden1_neurons, fill_color=HIDDEN_COLOR, fill_opacity=0.7, scale=1/1.1),
             run_time=0.3
         )
         self.wait(0.3)
         
         # Flow to hidden layer 2
         self.play(
-            FadeOut(VGroup(*[mob for mob in self.mobjects if isinstance(mob, Text) and mob.text == "Hidden Layer 1"])),
-            FadeIn(Text("Hidden Layer 2", font_size=24, color=HIDDEN_COLOR).to_edge(UP, buff=0.4))
+            self.fade_out_tagged("layer_label"),
+            FadeIn(tag(Text("Hidden Layer 2", font_size=24, color=HIDDEN_COLOR).to_edge(UP, buff=0.4), "layer_label"))
         )
         
         dots2, flow_anims2 = create_flow_animation(hidden1_neurons, hidden2_neurons, hidden1_to_hidden2)
         self.add(dots2)
         self.play(*flow_anims2, run_time=1.2)
         self.play(
-            *[neuron.animate.set_fill(HIDDEN_COLOR, opacity=1).scale(1.1) for neuron in hidden2_neurons],
+            BatchedAnimation(*hidden2_neurons, fill_color=HIDDEN_COLOR, fill_opacity=1, scale=1.1),
             FadeOut(dots2),
             run_time=0.3
         )
         self.play(
-            *[neuron.animate.set_fill(HIDDEN_COLOR, opacity=0.7).scale(1/1.1) for neuron in hidden2_neurons],
+            BatchedAnimation(*hidden2_neurons, fill_color=HIDDEN_COLOR, fill_opacity=0.7, scale=1/1.1),
             run_time=0.3
         )
         
@@ -327,7 +334,7 @@ class ForwardPropagation(Scene):
             color=YELLOW
         ).to_edge(DOWN, buff=0.4)
         self.play(
-            FadeOut(VGroup(*[mob for mob in self.mobjects if isinstance(mob, Text) and mob.text == "Hidden Layer 2"])),
+            self.fade_out_tagged("layer_label"),
             FadeIn(finish_text)
         )
         
@@ -335,7 +342,7 @@ class ForwardPropagation(Scene):
         self.add(dots3)
         self.play(*flow_anims3, run_time=1.2)
         self.play(
-            output_neuron.animate.set_fill(OUTPUT_COLOR, opacity=1).scale(1.2),
+            lazy(output_neuron).set_fill(OUTPUT_COLOR, opacity=1).scale(1.2),
             FadeOut(dots3),
             run_time=0.4
         )
@@ -626,7 +633,7 @@ class LayerDeepDive(Scene):
         ).shift(RIGHT * 3 + DOWN * 0.5).scale(0.8)
         
         # ReLU function
-        relu_graph = axes.plot(lambda x: max(0, x), color=ACTIVATION_COLOR, stroke_width=4)
+        relu_graph = relu.plot(axes, color=ACTIVATION_COLOR, stroke_width=4)
         
         graph_label = Text("ReLU(z)", font_size=24, color=ACTIVATION_COLOR)
         graph_label.next_to(axes, UP, buff=0.2)
@@ -1252,7 +1259,7 @@ class DeepLearningAbstraction(Scene):
         self.play(Write(message2))
         self.wait(0.5)
 
-class RandomWeightsFirstGuess(Scene):
+class RandomWeightsFirstGuess(SeededSceneMixin, Scene):
     def construct(self):
         # Color scheme
         RANDOM_COLOR = "#95a5a6"  # Gray for random/untrained
@@ -1312,7 +1319,7 @@ class RandomWeightsFirstGuess(Scene):
         for i, inp in enumerate(input_layer):
             for j, hidden in enumerate(hidden_layer):
                 # Random weight value
-                weight = np.random.uniform(-1, 1)
+                weight = self.rng.uniform(-1, 1)
                 weight_values.append(weight)
                 
                 line = Line(
@@ -1326,7 +1333,7 @@ class RandomWeightsFirstGuess(Scene):
                 
                 # Add weight label (show only a few for clarity)
                 if j == 0 and i < 2:  # Only show weights to first hidden neuron for first two inputs
-                    weight_text = DecimalNumber(
+                    weight_text = GlyphCounter(
                         weight,
                         num_decimal_places=2,
                         font_size=14,
@@ -1337,7 +1344,7 @@ class RandomWeightsFirstGuess(Scene):
         
         # Hidden to output connections
         for hidden in hidden_layer:
-            weight = np.random.uniform(-1, 1)
+            weight = self.rng.uniform(-1, 1)
             weight_values.append(weight)
             
             line = Line(
@@ -1638,7 +1645,7 @@ class RandomWeightsFirstGuess(Scene):
         
         self.wait(0.5)
 
-class CakeBakingAnalogy(Scene):
+class CakeBakingAnalogy(ImageSequenceMixin, Scene):
     def construct(self):
         # Color scheme
         INGREDIENT_COLOR = "#f39c12"
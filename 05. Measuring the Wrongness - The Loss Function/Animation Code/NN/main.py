@@ -1,6 +1,17 @@
 from turtle import circle
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import MemoryProfileMixin, SeededSceneMixin, StaticLayerMixin, TaggedSceneMixin, shared_copy
+from nnseries.charts import BarChart
+from nnseries.gauge import Gauge
+from nnseries.losses import categorical_cross_entropy, mae, mse
+from nnseries.plotting import adaptive_samples, coords_to_points
+from nnseries.prototypes import prototype
+from nnseries.training import TrainingSimulation
 
 class LossFunctionIntro(Scene):
     def construct(self):
@@ -280,7 +291,7 @@ class LossFunctionIntro(Scene):
         self.play(FadeOut(VGroup(title, report_card, final_message)))
         self.wait()
 
-class LossFunctionBehavior(Scene):
+class LossFunctionBehavior(SeededSceneMixin, MemoryProfileMixin, Scene):
     def construct(self):
         # Part 1: Introduce the concept of multiple predictions
         self.introduce_multiple_predictions()
@@ -416,29 +427,18 @@ class LossFunctionBehavior(Scene):
         self.play(Create(axes), Write(x_label), Write(y_label))
         
         # Calculate errors and create bars
-        errors = [abs(pred - actual) for pred, actual in self.house_data]
-        bars = VGroup()
-        
-        for i, error in enumerate(errors):
-            bar_height = error / 60 * 4  # Scale to axes
-            bar = Rectangle(
-                width=0.6,
-                height=bar_height,
-                color=RED,
-                fill_opacity=0.7,
-                stroke_width=2
-            )
-            bar.move_to(axes.c2p(i + 1, 0), aligned_edge=DOWN)
-            bars.add(bar)
+        predicted, actual = np.array(self.house_data, dtype=float).T
+        errors = mae.per_sample(predicted, actual)
+        bars = BarChart(axes, errors, bar_width=0.66, color=RED, fill_opacity=0.7)
         
         # Animate bars appearing
-        self.play(LaggedStart(*[GrowFromEdge(bar, DOWN) for bar in bars], lag_ratio=0.08))
+        self.play(bars.grow(lag_ratio=0.08, run_time=1 + 0.08 * (len(errors) - 1)))
         
         error_labels = VGroup()
         # Label some bars with error values
         for i in [2, 7]:  # Show largest errors
-            error_label = Text(f"${errors[i]}k", font_size=12, color=RED)
-            error_label.next_to(bars[i], UP, buff=0.1)
+            error_label = Text(f"${errors[i]:.0f}k", font_size=12, color=RED)
+            error_label.next_to(bars.bars[i], UP, buff=0.1)
             self.play(FadeIn(error_label, scale=0.5), run_time=0.3)
             error_labels.add(error_label)
         
@@ -450,7 +450,7 @@ class LossFunctionBehavior(Scene):
         self.play(Write(avg_text))
         
         # Calculate average error
-        avg_error = sum(errors) / len(errors)
+        avg_error = mae(predicted, actual)
         
         # Show all bars moving towards average
         avg_line = DashedLine(
@@ -473,7 +473,7 @@ class LossFunctionBehavior(Scene):
         overall_loss_box = VGroup(
             RoundedRectangle(width=5, height=2, corner_radius=0.2, color=BLUE, fill_opacity=0.3),
             Text("Overall Loss", font_size=32, color=WHITE, weight=BOLD).shift(UP * 0.4),
-            Text(f"${avg_error**2:.0f}k", font_size=28, color=RED).shift(DOWN * 0.3)
+            Text(f"${mse(predicted, actual):.0f}k", font_size=28, color=RED).shift(DOWN * 0.3)
         ).shift(DOWN * 0.5)
         
         self.play(
@@ -597,6 +597,7 @@ class LossFunctionBehavior(Scene):
         
         self.play(FadeOut(summary))
     
+    @prototype
     def create_small_house(self):
         """Helper function to create a small house icon"""
         house = VGroup(
@@ -607,6 +608,7 @@ class LossFunctionBehavior(Scene):
         )
         return house
     
+    @prototype
     def create_loss_bar(self, height_ratio, color, label_text):
         """Helper function to create a loss bar visualization"""
         bar_group = VGroup(
@@ -794,23 +796,22 @@ class LossFunctionTypes(Scene):
         title.to_edge(UP)
         self.play(Write(title))
         
-        # House 1
-        house1 = VGroup(
-            self.create_house(),
-            Text("House 1", font_size=20, color=WHITE, weight=BOLD),
-            Text("Predicted: $280k", font_size=18, color=ORANGE),
-            Text("Actual: $300k", font_size=18, color=GREEN),
-            Text("Error: -$20k", font_size=18, color=RED)
-        ).arrange(DOWN, buff=0.2).shift(LEFT * 4 + UP * 0.5)
-        
-        # House 2
-        house2 = VGroup(
-            self.create_house(),
-            Text("House 2", font_size=20, color=WHITE, weight=BOLD),
-            Text("Predicted: $290k", font_size=18, color=ORANGE),
-            Text("Actual: $300k", font_size=18, color=GREEN),
-            Text("Error: -$10k", font_size=18, color=RED)
-        ).arrange(DOWN, buff=0.2).shift(RIGHT * 4 + UP * 0.5)
+        predicted = np.array([280, 290])
+        actual = np.array([300, 300])
+        errors = predicted - actual
+        squared = errors ** 2
+        
+        # One card per house
+        houses = []
+        for i, (shift, pred, act, error) in enumerate(zip([LEFT * 4, RIGHT * 4], predicted, actual, errors)):
+            houses.append(VGroup(
+                self.create_house(),
+                Text(f"House {i + 1}", font_size=20, color=WHITE, weight=BOLD),
+                Text(f"Predicted: ${pred}k", font_size=18, color=ORANGE),
+                Text(f"Actual: ${act}k", font_size=18, color=GREEN),
+                Text(f"Error: {'-' if error < 0 else ''}${abs(error)}k", font_size=18, color=RED)
+            ).arrange(DOWN, buff=0.2).shift(shift + UP * 0.5))
+        house1, house2 = houses
         
         self.play(FadeIn(house1, shift=RIGHT))
         self.wait()
@@ -818,11 +819,12 @@ class LossFunctionTypes(Scene):
         self.wait()
         
         # Calculate MSE
+        n = len(errors)
         calculation = VGroup(
             Text("Calculating MSE:", font_size=24, color=YELLOW, weight=BOLD),
-            MathTex(r"\text{MSE} = \frac{1}{2}[(-20)^2 + (-10)^2]", font_size=32),
-            MathTex(r"= \frac{1}{2}[400 + 100]", font_size=32),
-            MathTex(r"= \frac{500}{2} = ", r"250", font_size=32)
+            MathTex(r"\text{MSE} = \frac{1}{%d}[%s]" % (n, " + ".join(f"({e})^2" for e in errors)), font_size=32),
+            MathTex(r"= \frac{1}{%d}[%s]" % (n, " + ".join(str(s) for s in squared)), font_size=32),
+            MathTex(r"= \frac{%d}{%d} = " % (squared.sum(), n), f"{mse(predicted, actual):g}", font_size=32)
         ).arrange(DOWN, buff=0.4).shift(DOWN * 1.8)
         
         self.play(Write(calculation[0]))
@@ -865,11 +867,14 @@ class LossFunctionTypes(Scene):
         self.wait(4)
         
         # Network predictions (probabilities)
+        classes = ["Cat", "Dog"]
+        probabilities = np.array([0.9, 0.1])
+        target = classes.index("Dog")
         predictions = VGroup(
             Text("Network Predicts:", font_size=24, color=WHITE, weight=BOLD),
             VGroup(
-                self.create_probability_bar(0.9, "Cat", RED),
-                self.create_probability_bar(0.1, "Dog", GREEN)
+                self.create_probability_bar(probabilities[0], classes[0], RED),
+                self.create_probability_bar(probabilities[1], classes[1], GREEN)
             ).arrange(DOWN, buff=0.4)
         ).arrange(DOWN, buff=0.5).shift(RIGHT * 2.5)
         
@@ -877,9 +882,11 @@ class LossFunctionTypes(Scene):
         self.wait(8)
         
         # Show the problem
+        loss = categorical_cross_entropy(probabilities, target)
         problem = VGroup(
             Text("High confidence", font_size=20, color=RED),
-            Text("in WRONG  direction!", font_size=20, color=RED, weight=BOLD)
+            Text("in WRONG  direction!", font_size=20, color=RED, weight=BOLD),
+            MathTex(r"\text{Loss} = -\log(%.1f) = %.2f" % (probabilities[target], loss), font_size=28, color=RED)
         ).arrange(DOWN, buff=0.1).next_to(predictions, DOWN, buff=0.8)
         
         self.play(Write(problem))
@@ -925,6 +932,7 @@ class LossFunctionTypes(Scene):
         
         self.play(FadeOut(VGroup(title, message_box, message, note)))
     
+    @prototype
     def create_house(self):
         """Helper to create house icon"""
         house = VGroup(
@@ -935,6 +943,7 @@ class LossFunctionTypes(Scene):
         )
         return house
     
+    @prototype
     def create_probability_bar(self, probability, label, color):
         """Helper to create probability visualization"""
         bar_width = probability * 4
@@ -949,7 +958,7 @@ class LossFunctionTypes(Scene):
         
         return bar_group
 
-class LossReductionTraining(Scene):
+class LossReductionTraining(StaticLayerMixin, TaggedSceneMixin, Scene):
     def construct(self):
         # Part 1: What happens after calculating loss
         self.introduce_next_step()
@@ -1127,14 +1136,17 @@ class LossReductionTraining(Scene):
         title.to_edge(UP)
         self.play(Write(title))
         
+        # Train a small model in the background while the axes are drawn
+        training = TrainingSimulation(steps=1000).start()
+
         # Create axes for loss curve
         axes = Axes(
-            x_range=[0, 100, 20],
+            x_range=[0, 1000, 200],
             y_range=[0, 500, 100],
             x_length=9,
             y_length=5,
             axis_config={"color": GRAY, "include_tip": True},
-            x_axis_config={"numbers_to_include": [0, 20, 40, 60, 80, 100]},
+            x_axis_config={"numbers_to_include": [0, 200, 400, 600, 800, 1000]},
             y_axis_config={"numbers_to_include": [0, 100, 200, 300, 400, 500]}
         ).shift(DOWN * 0.5)
         
@@ -1144,22 +1156,50 @@ class LossReductionTraining(Scene):
         self.play(Create(axes), Write(x_label), Write(y_label))
         self.wait()
         
-        # Create loss curve (exponential decay)
-        def loss_func(x):
-            return 450 * np.exp(-0.03 * x) + 10
+        # Loss curve drawn from the training snapshots up to the current step
+        step = ValueTracker(0)
+
+        def draw_loss_curve():
+            steps, losses = training.curve(step.get_value())
+            curve = VMobject(color=RED, stroke_width=4)
+            if len(steps) < 2:
+                curve.set_points_as_corners(axes.c2p(steps, losses).T)
+                return curve
+            # Only as many corners as the curve's bends need, not one per step
+            _, points = adaptive_samples(
+                lambda xs: coords_to_points(axes, np.column_stack([xs, np.interp(xs, steps, losses)])),
+                steps[0], steps[-1], smooth=False, min_width=1,
+            )
+            curve.set_points_as_corners(points)
+            return curve
+        
+        loss_curve = always_redraw(draw_loss_curve)
+        self.add(loss_curve)
         
-        loss_curve = axes.plot(loss_func, x_range=[0, 100], color=RED, stroke_width=4)
+        # Live loss meter reading the same training run
+        current_loss = ValueTracker(training.snapshot(0)["loss"])
+        current_loss.add_updater(lambda tracker: tracker.set_value(training.snapshot(step.get_value())["loss"]))
+        loss_meter = Gauge(tracker=current_loss, value_range=(0, 500), color=RED).scale(0.5).to_corner(UR)
+        self.add(current_loss)
         
-        # Animate the curve being drawn
-        self.play(Create(loss_curve), run_time=3, rate_func=linear)
+        # Animate the curve being drawn, fading the meter in as it starts
+        self.play(
+            step.animate(run_time=3, rate_func=linear).set_value(training.steps),
+            FadeIn(loss_meter, run_time=0.5),
+        )
+        loss_curve.clear_updaters()
+        current_loss.clear_updaters()
         self.wait()
         
+        def loss_at(iteration):
+            return training.snapshot(iteration)["loss"]
+        
         # Add labels at key points
-        start_dot = Dot(axes.c2p(0, loss_func(0)), color=RED, radius=0.1)
+        start_dot = Dot(axes.c2p(0, loss_at(0)), color=RED, radius=0.1)
         start_label = Text("High Loss\n(Start)", font_size=18, color=RED)
         start_label.next_to(start_dot, UP + RIGHT, buff=0.2)
         
-        end_dot = Dot(axes.c2p(100, loss_func(100)), color=GREEN, radius=0.1)
+        end_dot = Dot(axes.c2p(training.steps, loss_at(training.steps)), color=GREEN, radius=0.1)
         end_label = Text("Low Loss\n(Trained)", font_size=18, color=GREEN)
         end_label.next_to(end_dot, RIGHT, buff=0.2)
         
@@ -1168,13 +1208,11 @@ class LossReductionTraining(Scene):
         self.play(FadeIn(end_dot), Write(end_label))
         self.wait()
         
-        # Show house price predictions along the curve
-        checkpoints = [(10, "$280k"), (30, "$290k"), (60, "$298k"), (90, "$300k")]
-        
-        for x, price in checkpoints:
-            y = loss_func(x)
-            point = Dot(axes.c2p(x, y), color=YELLOW, radius=0.08)
-            price_label = Text(price, font_size=14, color=YELLOW, weight=BOLD)
+        # Show the model's price prediction for a 2000 sq ft house along the curve
+        for iteration in [100, 300, 600, 900]:
+            snapshot = training.snapshot(iteration)
+            point = Dot(axes.c2p(iteration, snapshot["loss"]), color=YELLOW, radius=0.08)
+            price_label = Text(f"${snapshot['prediction']:.0f}k", font_size=14, color=YELLOW, weight=BOLD)
             price_label.next_to(point, DOWN, buff=0.15)
             
             self.play(FadeIn(point), Write(price_label), run_time=0.5)
@@ -1193,7 +1231,7 @@ class LossReductionTraining(Scene):
         self.wait()
         
         # Fade out remaining dots and labels
-        self.play(FadeOut(*[mob for mob in self.mobjects]))
+        self.play(self.fade_out_all())
     
     def show_training_purpose(self):
         """Show that reducing loss is the entire purpose"""
@@ -1218,6 +1256,7 @@ class LossReductionTraining(Scene):
         
         self.play(FadeOut(VGroup(title, result_box)))
     
+    @prototype
     def create_house(self):
         """Helper to create house icon"""
         house = VGroup(
@@ -1230,44 +1269,9 @@ class LossReductionTraining(Scene):
     
     def create_gauge(self, fill_ratio, color):
         """Helper to create a gauge/meter visualization"""
-        # Background arc
-        bg_arc = Arc(
-            radius=1.2,
-            start_angle=PI,
-            angle=PI,
-            color=GRAY,
-            stroke_width=8,
-            stroke_opacity=0.3
-        )
-        
-        # Filled arc
-        filled_arc = Arc(
-            radius=1.2,
-            start_angle=PI,
-            angle=PI * fill_ratio,
-            color=color,
-            stroke_width=8
-        )
-        
-        # Needle
-        needle_angle = PI - (PI * fill_ratio)
-        needle_end = 1.2 * np.array([np.cos(needle_angle), np.sin(needle_angle), 0])
-        needle = Arrow(
-            ORIGIN, needle_end,
-            color=color,
-            stroke_width=3,
-            buff=0,
-            max_tip_length_to_length_ratio=0.2
-        )
-        
-        # Center dot
-        center_dot = Dot(ORIGIN, radius=0.1, color=WHITE)
-        
-        gauge = VGroup(bg_arc, filled_arc, needle, center_dot)
-        
-        return gauge
+        return Gauge(fill_ratio, color=color)
 
-class GolfAnalogy(Scene):
+class GolfAnalogy(MemoryProfileMixin, Scene):
     def construct(self):
         # Part 1: Introduce golf analogy
         self.introduce_golf_analogy()
@@ -1352,7 +1356,7 @@ class GolfAnalogy(Scene):
         
         for i, (end_x, end_y, description, color, label) in enumerate(attempts):
             # Reset ball to start
-            ball_copy = ball.copy()
+            ball_copy = shared_copy(ball)
             self.add(ball_copy)
             
             end_pos = np.array([end_x, end_y, 0])
@@ -1,5 +1,21 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from nnseries import (
+    BatchedAnimation,
+    BatchedGrowArrow,
+    DirtyRegionMixin,
+    ImageSequenceMixin,
+    PruneInvisibleMixin,
+    RetimeMixin,
+    SeededSceneMixin,
+    StaticLayerMixin,
+)
+from nnseries.backprop import backprop, random_weights, signal_arrows
+from nnseries.plotting import axes_dots, plot
 
 class BackpropIntro(Scene):
     def construct(self):
@@ -296,7 +312,7 @@ class BackpropIntro(Scene):
         # Final wait
         self.wait(2)
 
-class GradientDescentWeights(Scene):
+class GradientDescentWeights(RetimeMixin, DirtyRegionMixin, Scene):
     def construct(self):
         # Color scheme
         WEIGHT_COLOR = BLUE
@@ -714,7 +730,7 @@ class GradientDescentWeights(Scene):
         
         self.wait()
 
-class LearningRateVisualization(Scene):
+class LearningRateVisualization(StaticLayerMixin, PruneInvisibleMixin, Scene):
     def construct(self):
         # Color scheme
         HIGH_LR_COLOR = RED
@@ -802,20 +818,23 @@ class LearningRateVisualization(Scene):
         axes_good.shift(RIGHT * 4 + DOWN * 0.5)
         
         # Loss curves (same for all)
-        loss_curve_high = axes_high.plot(
-            lambda x: min(x**2 + 0.5, 5.8),
+        loss_curve_high = plot(
+            axes_high,
+            lambda x: np.minimum(x**2 + 0.5, 5.8),
             color=HIGH_LR_COLOR,
             stroke_width=3
         )
         
-        loss_curve_low = axes_low.plot(
-            lambda x: min(x**2 + 0.5, 5.8),
+        loss_curve_low = plot(
+            axes_low,
+            lambda x: np.minimum(x**2 + 0.5, 5.8),
             color=LOW_LR_COLOR,
             stroke_width=3
         )
         
-        loss_curve_good = axes_good.plot(
-            lambda x: min(x**2 + 0.5, 5.8),
+        loss_curve_good = plot(
+            axes_good,
+            lambda x: np.minimum(x**2 + 0.5, 5.8),
             color=GOOD_LR_COLOR,
             stroke_width=3
         )
@@ -860,11 +879,8 @@ class LearningRateVisualization(Scene):
             positions_high.append(current_x)
         
         # Create dots and path
-        dots_high = VGroup()
-        for i, x in enumerate(positions_high):
-            y = x**2 + 0.5
-            dot = Dot(axes_high.c2p(x, y), color=HIGH_LR_COLOR, radius=0.06)
-            dots_high.add(dot)
+        xs = np.array(positions_high)
+        dots_high = axes_dots(axes_high, np.column_stack([xs, xs**2 + 0.5]), color=HIGH_LR_COLOR, radius=0.06)
         
         # Animate the chaotic path
         self.play(FadeIn(dots_high[0]))
@@ -919,11 +935,8 @@ class LearningRateVisualization(Scene):
             positions_low.append(current_x)
         
         # Create dots and path
-        dots_low = VGroup()
-        for i, x in enumerate(positions_low):
-            y = x**2 + 0.5
-            dot = Dot(axes_low.c2p(x, y), color=LOW_LR_COLOR, radius=0.05)
-            dots_low.add(dot)
+        xs = np.array(positions_low)
+        dots_low = axes_dots(axes_low, np.column_stack([xs, xs**2 + 0.5]), color=LOW_LR_COLOR, radius=0.05)
         
         # Animate the slow path
         self.play(FadeIn(dots_low[0]))
@@ -977,11 +990,8 @@ class LearningRateVisualization(Scene):
             positions_good.append(current_x)
         
         # Create dots and path
-        dots_good = VGroup()
-        for i, x in enumerate(positions_good):
-            y = x**2 + 0.5
-            dot = Dot(axes_good.c2p(x, y), color=GOOD_LR_COLOR, radius=0.06)
-            dots_good.add(dot)
+        xs = np.array(positions_good)
+        dots_good = axes_dots(axes_good, np.column_stack([xs, xs**2 + 0.5]), color=GOOD_LR_COLOR, radius=0.06)
         
         # Animate the smooth path
         self.play(FadeIn(dots_good[0]))
@@ -1141,7 +1151,7 @@ class LearningRateVisualization(Scene):
         
         self.wait()
 
-class CollectiveLearning(Scene):
+class CollectiveLearning(SeededSceneMixin, Scene):
     def construct(self):
         # Color scheme
         INPUT_COLOR = BLUE
@@ -1255,6 +1265,11 @@ class CollectiveLearning(Scene):
         )
         self.wait()
         
+        # A real backward pass for one house: deltas for every layer at once
+        weights = random_weights([3, 4, 3, 1], self.rng)
+        house = np.array([[0.8, 0.3, 0.6]])  # Size, location, rooms (scaled)
+        backward = backprop(weights, house, targets=[[1.0]])
+        
         # Error flows backward - layer by layer coordination
         flow_text = Text("Each layer receives signal from  the layer ahead", font_size=22, color=SIGNAL_COLOR)
         flow_text.to_edge(DOWN, buff=0.8)
@@ -1262,31 +1277,23 @@ class CollectiveLearning(Scene):
         self.wait()
         
         # Signal to hidden layer 2
-        signal_arrows_h2 = VGroup()
-        for h2 in hidden2_neurons:
-            arrow = Arrow(
-                output_neuron.get_left(),
-                h2.get_right(),
-                color=SIGNAL_COLOR,
-                stroke_width=2,
-                buff=0.25,
-                max_tip_length_to_length_ratio=0.15
-            )
-            signal_arrows_h2.add(arrow)
+        signal_arrows_h2 = signal_arrows(
+            [output_neuron], hidden2_neurons, backward.edge_strengths(2),
+            color=SIGNAL_COLOR, stroke_width=2, max_tip_length_to_length_ratio=0.15
+        )
         
         self.play(
-            *[GrowArrow(arrow) for arrow in signal_arrows_h2],
-            *[line.animate.set_color(SIGNAL_COLOR).set_stroke(opacity=0.6) for line in h2_to_output],
+            BatchedGrowArrow(*signal_arrows_h2),
+            BatchedAnimation(*h2_to_output, stroke_color=SIGNAL_COLOR, stroke_opacity=0.6),
             run_time=1
         )
         
         # Hidden layer 2 receives and processes
-        h2_sensitivities = [0.8, 0.5, 0.9]  # Different sensitivities
-        for i, (h2, sensitivity) in enumerate(zip(hidden2_neurons, h2_sensitivities)):
-            self.play(
-                h2.animate.set_fill(ERROR_COLOR, opacity=sensitivity),
-                run_time=0.3
-            )
+        h2_sensitivities = backward.sensitivities(2, low=0.4)
+        self.play(
+            BatchedAnimation(*hidden2_neurons, fill_color=ERROR_COLOR, fill_opacity=h2_sensitivities),
+            run_time=0.9
+        )
         self.wait(5)
         
         # Show sensitivity concept
@@ -1297,9 +1304,9 @@ class CollectiveLearning(Scene):
         
         # Highlight neurons with different sensitivities
         high_sens_label = Text("High", font_size=14, color=RED, weight=BOLD)
-        high_sens_label.next_to(hidden2_neurons[2], RIGHT + DOWN * 0.4, buff=0.1)
+        high_sens_label.next_to(hidden2_neurons[np.argmax(h2_sensitivities)], RIGHT + DOWN * 0.4, buff=0.1)
         low_sens_label = Text("Low", font_size=14, color=YELLOW)
-        low_sens_label.next_to(hidden2_neurons[1], RIGHT + DOWN * 0.4, buff=0.1)
+        low_sens_label.next_to(hidden2_neurons[np.argmin(h2_sensitivities)], RIGHT + DOWN * 0.4, buff=0.1)
         
         self.play(Write(high_sens_label), Write(low_sens_label))
         self.wait()
@@ -1307,61 +1314,41 @@ class CollectiveLearning(Scene):
         self.play(FadeOut(high_sens_label), FadeOut(low_sens_label))
         
         # Signal to hidden layer 1
-        signal_arrows_h1 = VGroup()
-        for h1 in hidden1_neurons:
-            for h2 in hidden2_neurons:
-                arrow = Arrow(
-                    h2.get_left(),
-                    h1.get_right(),
-                    color=SIGNAL_COLOR,
-                    stroke_width=1.5,
-                    buff=0.25,
-                    max_tip_length_to_length_ratio=0.09
-                )
-                signal_arrows_h1.add(arrow)
+        signal_arrows_h1 = signal_arrows(
+            hidden2_neurons, hidden1_neurons, backward.edge_strengths(1),
+            color=SIGNAL_COLOR, stroke_width=1.5, max_tip_length_to_length_ratio=0.09
+        )
         
         self.play(
-            *[GrowArrow(arrow) for arrow in signal_arrows_h1],
-            *[line.animate.set_color(SIGNAL_COLOR).set_stroke(opacity=0.6) for line in h1_to_h2],
+            BatchedGrowArrow(*signal_arrows_h1),
+            BatchedAnimation(*h1_to_h2, stroke_color=SIGNAL_COLOR, stroke_opacity=0.6),
             run_time=1.2
         )
         
         # Hidden layer 1 processes
-        h1_sensitivities = [0.6, 0.9, 0.4, 0.7]
-        for h1, sensitivity in zip(hidden1_neurons, h1_sensitivities):
-            self.play(
-                h1.animate.set_fill(ERROR_COLOR, opacity=sensitivity),
-                run_time=0.25
-            )
+        self.play(
+            BatchedAnimation(*hidden1_neurons, fill_color=ERROR_COLOR, fill_opacity=backward.sensitivities(1, low=0.4)),
+            run_time=1
+        )
         self.wait()
         
         # Signal to input layer
-        signal_arrows_input = VGroup()
-        for inp in input_neurons:
-            for h1 in hidden1_neurons:
-                arrow = Arrow(
-                    h1.get_left(),
-                    inp.get_right(),
-                    color=SIGNAL_COLOR,
-                    stroke_width=1.5,
-                    buff=0.25,
-                    max_tip_length_to_length_ratio=0.09
-                )
-                signal_arrows_input.add(arrow)
+        signal_arrows_input = signal_arrows(
+            hidden1_neurons, input_neurons, backward.edge_strengths(0),
+            color=SIGNAL_COLOR, stroke_width=1.5, max_tip_length_to_length_ratio=0.09
+        )
         
         self.play(
-            *[GrowArrow(arrow) for arrow in signal_arrows_input],
-            *[line.animate.set_color(SIGNAL_COLOR).set_stroke(opacity=0.6) for line in input_to_h1],
+            BatchedGrowArrow(*signal_arrows_input),
+            BatchedAnimation(*input_to_h1, stroke_color=SIGNAL_COLOR, stroke_opacity=0.6),
             run_time=1.2
         )
         
         # Input layer receives signals
-        input_sensitivities = [0.7, 0.8, 0.5]
-        for inp, sensitivity in zip(input_neurons, input_sensitivities):
-            self.play(
-                inp.animate.set_fill(ERROR_COLOR, opacity=sensitivity),
-                run_time=0.25
-            )
+        self.play(
+            BatchedAnimation(*input_neurons, fill_color=ERROR_COLOR, fill_opacity=backward.sensitivities(0, low=0.4)),
+            run_time=0.75
+        )
         self.wait(3)
         
         # Coordinated update message
@@ -1679,7 +1666,7 @@ class BackpropOpening(Scene):
         )
         self.wait()
 
-class BackpropTakeaways(Scene):
+class BackpropTakeaways(ImageSequenceMixin, Scene):
     def construct(self):
         # Title
         title = Text("Key Takeaways", font_size=42, color=BLUE, weight=BOLD)
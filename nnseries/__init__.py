@@ -0,0 +1,24 @@
+"""Shared helpers for the Mathemly neural network series animations.
+
+Each episode's ``main.py`` puts the repository root on ``sys.path`` and
+imports what it needs from here.
+"""
+
+from .animations import (
+    BatchedAnimation,
+    BatchedFadeIn,
+    BatchedFadeOut,
+    BatchedGrowArrow,
+)
+from .cow import is_shared, shared_copy
+from .dirty import DirtyRegionCamera, DirtyRegionMixin
+from .export import ImageSequenceMixin
+from .layers import StaticLayerMixin, StaticLayerRenderer
+from .lazy import LazyAnimate, lazy
+from .profiling import MemoryProfileMixin
+from .proxy import is_proxy, proxy_level
+from .pruning import PrunedMobject, PruneInvisibleMixin
+from .registry import MobjectRegistry, TaggedSceneMixin, get_role, get_tags, tag
+from .retime import RetimeMixin
+from .rng import SeededSceneMixin, box, cluster, disc, ring, scene_rng
+from .timeline import TimelineMixin
@@ -0,0 +1,24 @@
+"""Command-line tools: ``python -m nnseries <command> [args]``."""
+
+import sys
+
+from . import export, retime, storyboard, timeline
+
+COMMANDS = {
+    "timeline": timeline.main,
+    "retime": retime.main,
+    "storyboard": storyboard.main,
+    "export": export.main,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(f"usage: python -m nnseries {{{','.join(COMMANDS)}}} ...", file=sys.stderr)
+        return 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
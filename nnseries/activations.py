@@ -0,0 +1,171 @@
+"""Activation functions with their derivatives and cached curves.
+
+Episode 02's function demos and episode 03's ``NeuronStacking`` each defined
+their own ``sigmoid`` / ``tanh_fn`` / ``relu_fn`` / ``gaussian_fn`` and
+plotted them again for every highlighted region. Each activation here works
+on NumPy arrays:
+
+* ``act(z)`` / ``act.forward(z)`` is the activation of every entry;
+* ``act.derivative(z)`` is its slope at every entry;
+* ``act.plot(axes, x_range, derivative=False, weight=1, bias=0, **style)``
+  is the graph of ``act(weight * x + bias)`` (or of its derivative in ``x``).
+
+Plotting goes through ``nnseries.plotting.plot`` with adaptive sampling, and
+the sampled Bézier points are kept in ``CURVES``, keyed by activation,
+derivative, weight and bias, x-range, tolerance and the axes' geometry
+(origin and unit vectors). A second plot of the same curve on the same axes
+(or on identical axes) skips sampling and shares the cached points
+copy-on-write (see ``nnseries.cow``); style arguments are not part of the
+key.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .cow import share
+from .plotting import PLOT_TOLERANCE, SampledGraph, axes_transform, is_linear
+
+
+class Activation(ABC):
+    """Base class: subclasses implement ``forward`` and ``derivative``."""
+
+    name = ""
+
+    @abstractmethod
+    def forward(self, z):
+        """Activation of every entry of ``z``."""
+
+    @abstractmethod
+    def derivative(self, z):
+        """Slope of the activation at every entry of ``z``."""
+
+    def __call__(self, z):
+        return self.forward(z)
+
+    def plot(self, axes, x_range=None, derivative=False, weight=1.0, bias=0.0, tolerance=PLOT_TOLERANCE, **kwargs):
+        return ActivationGraph(
+            self, axes, x_range=x_range, derivative=derivative, weight=weight, bias=bias, tolerance=tolerance, **kwargs
+        )
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class Step(Activation):
+    """1 for ``z >= 0``, else 0."""
+
+    name = "Step"
+
+    def forward(self, z):
+        return np.where(np.asarray(z, dtype=float) >= 0, 1.0, 0.0)
+
+    def derivative(self, z):
+        return np.zeros_like(np.asarray(z, dtype=float))
+
+
+class Sigmoid(Activation):
+    name = "Sigmoid"
+
+    def forward(self, z):
+        with np.errstate(over="ignore"):
+            return 1 / (1 + np.exp(-np.asarray(z, dtype=float)))
+
+    def derivative(self, z):
+        s = self.forward(z)
+        return s * (1 - s)
+
+
+class Tanh(Activation):
+    name = "Tanh"
+
+    def forward(self, z):
+        return np.tanh(np.asarray(z, dtype=float))
+
+    def derivative(self, z):
+        return 1 - np.tanh(np.asarray(z, dtype=float)) ** 2
+
+
+class ReLU(Activation):
+    name = "ReLU"
+
+    def forward(self, z):
+        return np.maximum(0.0, np.asarray(z, dtype=float))
+
+    def derivative(self, z):
+        return np.where(np.asarray(z, dtype=float) > 0, 1.0, 0.0)
+
+
+class Gaussian(Activation):
+    name = "Gaussian"
+
+    def forward(self, z):
+        return np.exp(-np.asarray(z, dtype=float) ** 2)
+
+    def derivative(self, z):
+        z = np.asarray(z, dtype=float)
+        return -2 * z * np.exp(-z**2)
+
+
+step = Step()
+sigmoid = Sigmoid()
+tanh = Tanh()
+relu = ReLU()
+gaussian = Gaussian()
+
+ACTIVATIONS = {activation.name: activation for activation in (step, sigmoid, tanh, relu, gaussian)}
+
+CURVES = {}
+
+
+def geometry_key(axes):
+    """Hashable origin and unit vectors of linear ``axes`` (None otherwise)."""
+    if not is_linear(axes):
+        return None
+    origin, basis = axes_transform(axes)
+    return tuple(np.round(np.concatenate([origin, basis.ravel()]), 9))
+
+
+class ActivationGraph(SampledGraph):
+    """``SampledGraph`` of an activation whose points come from ``CURVES``."""
+
+    def __init__(self, activation, axes, x_range=None, derivative=False, weight=1.0, bias=0.0, **kwargs):
+        self.activation = activation
+        self.derivative = derivative
+        self.weight = weight
+        self.bias = bias
+        if derivative:
+            function = lambda x: weight * activation.derivative(weight * x + bias)
+        else:
+            function = lambda x: activation.forward(weight * x + bias)
+        super().__init__(axes, function, x_range=x_range, **kwargs)
+
+    def cache_key(self):
+        geometry = geometry_key(self.axes)
+        if geometry is None:
+            return None
+        return (
+            self.activation.name,
+            self.derivative,
+            self.weight,
+            self.bias,
+            self.t_min,
+            self.t_max,
+            self.t_step,
+            self.tolerance,
+            self.use_smoothing,
+            geometry,
+        )
+
+    def generate_points(self):
+        key = self.cache_key()
+        if key is None:
+            return super().generate_points()
+        if key not in CURVES:
+            super().generate_points()
+            buffer = np.array(self.points)
+            buffer.flags.writeable = False
+            CURVES[key] = (buffer, getattr(self, "samples", None))
+        buffer, self.samples = CURVES[key]
+        share(self, buffer)
+        return self
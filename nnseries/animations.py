@@ -0,0 +1,223 @@
+"""Batched animations for groups of similar mobjects.
+
+``self.play(*[FadeOut(mob) for mob in mobs])`` builds one Animation per
+mobject, each with its own starting copy and its own interpolate call per
+frame. ``BatchedAnimation`` instead stacks the points and colours of the
+whole group into a few arrays once, points every submobject at a slice of
+those arrays, and then updates all of them with one NumPy lerp per frame.
+"""
+
+import numpy as np
+from manim import ORIGIN, OUT, Animation, Group, ManimColor, VMobject, rotation_matrix
+
+
+def _anchor(mobject, about):
+    if about == "center":
+        return mobject.get_center()
+    if about == "start":
+        return mobject.get_start()
+    if about == "end":
+        return mobject.get_end()
+    return np.asarray(about, dtype=float)
+
+
+def _stack(arrays):
+    """Concatenate ``arrays`` and return (buffer, views into buffer)."""
+    buffer = np.concatenate(arrays, axis=0)
+    views = []
+    start = 0
+    for array in arrays:
+        end = start + len(array)
+        views.append(buffer[start:end])
+        start = end
+    return buffer, views
+
+
+class BatchedAnimation(Animation):
+    """Affine + style change applied to many mobjects with one array op per frame.
+
+    Every mobject is scaled by ``scale`` and rotated by ``angle`` about its own
+    anchor (``about`` is ``"center"``, ``"start"``, ``"end"`` or a point),
+    then shifted by ``shift``. ``fill_color`` / ``fill_opacity`` /
+    ``stroke_color`` / ``stroke_opacity`` set the target style; ``None``
+    leaves that channel alone. The opacities may also be sequences with one
+    value per mobject. With ``reverse=True`` the mobjects animate
+    *from* the described state to their current one (fade-ins, grow-ins).
+
+    Colours and opacities only apply to ``VMobject`` family members: an
+    ``ImageMobject`` (or other non-vectorized mobject) passed in is moved
+    and scaled but not faded, so fade it with its own ``FadeOut``.
+    ``lag_ratio`` is not supported: the whole group shares one alpha, which
+    is what makes the per-frame cost independent of the group size.
+
+    The mobjects stay where they are in the scene's draw order (and in
+    their parent groups); ones not yet in the scene are added on top, one by
+    one, as separate per-mobject animations would add them.
+    """
+
+    def __init__(
+        self,
+        *mobjects,
+        scale=1.0,
+        angle=0.0,
+        shift=ORIGIN,
+        about="center",
+        fill_color=None,
+        fill_opacity=None,
+        stroke_color=None,
+        stroke_opacity=None,
+        reverse=False,
+        **kwargs,
+    ):
+        if not mobjects:
+            raise ValueError("At least one mobject must be passed.")
+        self.members = list(mobjects)
+        self.scale_factor = scale
+        self.angle = angle
+        self.shift_vector = np.asarray(shift, dtype=float)
+        self.about = about
+        self.fill_color = fill_color
+        self.fill_opacity = fill_opacity
+        self.stroke_color = stroke_color
+        self.stroke_opacity = stroke_opacity
+        self.reverse = reverse
+        mobject = mobjects[0] if len(mobjects) == 1 else Group(*mobjects)
+        super().__init__(mobject, **kwargs)
+
+    def is_introducer(self):
+        # Several mobjects are wrapped in a Group, which the scene must never
+        # add: Scene.add would pull the members out of their parents and draw
+        # them above everything else. Reporting the batch as an introducer
+        # makes the scene skip it; _setup_scene adds missing members instead.
+        return self.introducer or len(self.members) > 1
+
+    def _setup_scene(self, scene):
+        if scene is None or len(self.members) == 1:
+            return super()._setup_scene(scene)
+        present = {id(mob) for mob in scene.get_mobject_family_members()}
+        missing = [member for member in self.members if id(member) not in present]
+        if missing:
+            scene.add(*missing)
+
+    def begin(self):
+        # Deliberately skips Animation.begin: no starting_mobject copy.
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+
+        self._point_subs = []
+        self._point_owners = []
+        for index, member in enumerate(self.members):
+            for sub in member.family_members_with_points():
+                self._point_subs.append(sub)
+                self._point_owners.append(index)
+        self._style_subs = []
+        self._style_owners = []
+        for sub, owner in zip(self._point_subs, self._point_owners):
+            if isinstance(sub, VMobject):
+                self._style_subs.append(sub)
+                self._style_owners.append(owner)
+
+        self._channels = []
+        if self._point_subs:
+            self._build_channels()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def _build_channels(self):
+        if self.scale_factor != 1 or self.angle != 0 or self.shift_vector.any():
+            buffer, counts = self._bind_points()
+            anchors = np.array([_anchor(member, self.about) for member in self.members])
+            point_anchors = np.repeat(anchors[self._point_owners], counts, axis=0)
+            matrix = self.scale_factor * rotation_matrix(self.angle, OUT)
+            end = (buffer - point_anchors) @ matrix.T + point_anchors + self.shift_vector
+            self._add_channel("points", self._point_subs, buffer, end)
+        self._add_rgba_channel("fill_rgbas", self.fill_color, self.fill_opacity)
+        self._add_rgba_channel("stroke_rgbas", self.stroke_color, self.stroke_opacity)
+
+    def _bind(self, attr, subs, arrays):
+        buffer, views = _stack(arrays)
+        for sub, view in zip(subs, views):
+            setattr(sub, attr, view)
+        return buffer
+
+    def _bind_points(self):
+        points = [sub.points for sub in self._point_subs]
+        return self._bind("points", self._point_subs, points), [len(p) for p in points]
+
+    def _bind_rgbas(self, attr):
+        getter = "get_fill_rgbas" if attr == "fill_rgbas" else "get_stroke_rgbas"
+        rgbas = [np.asarray(getattr(sub, getter)(), dtype=float) for sub in self._style_subs]
+        return self._bind(attr, self._style_subs, rgbas), [len(r) for r in rgbas]
+
+    def _add_channel(self, attr, subs, buffer, end):
+        start = buffer.copy()
+        self._channels.append((attr, subs, buffer, start, end - start))
+
+    def _add_rgba_channel(self, attr, color, opacity):
+        if not self._style_subs or (color is None and opacity is None):
+            return
+        buffer, counts = self._bind_rgbas(attr)
+        end = buffer.copy()
+        if color is not None:
+            end[:, :3] = ManimColor(color).to_rgb()
+        if opacity is not None:
+            if np.ndim(opacity):
+                opacity = np.repeat(np.asarray(opacity, dtype=float)[self._style_owners], counts)
+            end[:, 3] = opacity
+        self._add_channel(attr, self._style_subs, buffer, end)
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        if self.reverse:
+            alpha = 1 - alpha
+        for _, _, buffer, start, delta in self._channels:
+            np.multiply(delta, alpha, out=buffer)
+            buffer += start
+
+    def clean_up_from_scene(self, scene):
+        self._on_finish(scene)
+        if self.is_remover():
+            scene.remove(*self.members)
+        # Give every submobject back its own array so the shared buffers can
+        # be freed and later in-place edits do not leak between mobjects.
+        for attr, subs, _, _, _ in self._channels:
+            for sub in subs:
+                setattr(sub, attr, getattr(sub, attr).copy())
+        self._channels = []
+
+
+class BatchedFadeOut(BatchedAnimation):
+    def __init__(self, *mobjects, **kwargs):
+        super().__init__(
+            *mobjects, fill_opacity=0, stroke_opacity=0, remover=True, **kwargs
+        )
+
+    def clean_up_from_scene(self, scene):
+        # Like FadeOut, leave the removed mobjects in their original state.
+        self.reverse = not self.reverse
+        self.interpolate(1)
+        self.reverse = not self.reverse
+        super().clean_up_from_scene(scene)
+
+
+class BatchedFadeIn(BatchedAnimation):
+    def __init__(self, *mobjects, **kwargs):
+        super().__init__(
+            *mobjects,
+            fill_opacity=0,
+            stroke_opacity=0,
+            reverse=True,
+            introducer=True,
+            **kwargs,
+        )
+
+
+class BatchedGrowArrow(BatchedAnimation):
+    """Grow every arrow out of its start point, like ``GrowArrow``."""
+
+    def __init__(self, *arrows, **kwargs):
+        super().__init__(
+            *arrows, scale=0, about="start", reverse=True, introducer=True, **kwargs
+        )
@@ -0,0 +1,102 @@
+"""Backward pass for the network diagrams.
+
+``CollectiveLearning`` used hand-picked "sensitivities" for each layer and
+filled the neurons one ``play`` at a time. ``backprop`` runs a real forward
+and backward pass of a small fully connected network (sigmoid hidden layers,
+linear output) over a whole batch with one matrix product per layer, and
+``BackwardPass`` turns the resulting deltas into per-neuron opacities and
+per-connection signal strengths. With ``BatchedAnimation`` for the fills and
+``BatchedGrowArrow`` for ``signal_arrows``, each layer animates in one
+``play`` however wide the network is.
+
+Weights are one ``(n_out, n_in)`` matrix per layer transition, input layer
+first; deltas and activations are listed input layer first as well.
+"""
+
+import numpy as np
+from manim import YELLOW, Arrow, VGroup
+
+from .activations import sigmoid
+
+
+def random_weights(sizes, rng, scale=1.0):
+    """Weights for a network with layer ``sizes``, drawn N(0, scale / sqrt(n_in))."""
+    return [rng.normal(0, scale / np.sqrt(n_in), (n_out, n_in)) for n_in, n_out in zip(sizes, sizes[1:])]
+
+
+class BackwardPass:
+    """Activations and deltas of every layer for one batch.
+
+    ``deltas[l]`` is d(loss)/d(pre-activation) of layer ``l`` per sample; for
+    the input layer it is the gradient with respect to the inputs.
+    """
+
+    def __init__(self, weights, activations, deltas, error):
+        self.weights = weights
+        self.activations = activations
+        self.deltas = deltas
+        self.error = error
+
+    def neuron_signals(self, layer):
+        """Mean ``|delta|`` over the batch for each neuron of ``layer``."""
+        return np.abs(self.deltas[layer]).mean(axis=0)
+
+    def edge_signals(self, layer):
+        """Mean ``|w_ji * delta_j|`` for each connection from ``layer`` into
+        ``layer + 1``, shape ``(n_next, n_layer)``."""
+        incoming = np.abs(self.deltas[layer + 1]).mean(axis=0)
+        return np.abs(self.weights[layer]) * incoming[:, None]
+
+    def sensitivities(self, layer, low=0.3, high=0.9):
+        """Neuron signals of ``layer`` scaled to opacities in ``low``..``high``
+        (the strongest neuron in the layer gets ``high``)."""
+        signals = self.neuron_signals(layer)
+        return low + (high - low) * signals / max(signals.max(), 1e-12)
+
+    def edge_strengths(self, layer):
+        """``edge_signals`` scaled so the strongest connection is 1."""
+        signals = self.edge_signals(layer)
+        return signals / max(signals.max(), 1e-12)
+
+
+def backprop(weights, inputs, targets=None, error=None):
+    """Forward and backward pass over a batch of ``inputs`` (``(n, n_in)``).
+
+    The output error is ``error`` if given, else ``prediction - targets``
+    (the gradient of half the squared error).
+    """
+    activations = [np.atleast_2d(np.asarray(inputs, dtype=float))]
+    for index, matrix in enumerate(weights):
+        z = activations[-1] @ matrix.T
+        activations.append(z if index == len(weights) - 1 else sigmoid(z))
+
+    if error is None:
+        error = activations[-1] - np.asarray(targets, dtype=float).reshape(activations[-1].shape)
+    error = np.asarray(error, dtype=float).reshape(activations[-1].shape)
+
+    deltas = [error]
+    for index in range(len(weights) - 1, -1, -1):
+        delta = deltas[0] @ weights[index]
+        if index:
+            delta *= activations[index] * (1 - activations[index])
+        deltas.insert(0, delta)
+    return BackwardPass(weights, activations, deltas, error)
+
+
+def signal_arrows(sources, targets, strengths, color=YELLOW, min_opacity=0.25, **kwargs):
+    """Arrows from every neuron in ``sources`` (the layer ahead) back to every
+    neuron in ``targets``.
+
+    ``strengths`` is ``(len(sources), len(targets))`` in 0..1, as from
+    ``BackwardPass.edge_strengths``, and sets each arrow's opacity. Arrows
+    are ordered target-major, matching how the connection lines are built.
+    """
+    arrows = VGroup()
+    kwargs.setdefault("buff", 0.25)
+    for j, target in enumerate(targets):
+        for i, source in enumerate(sources):
+            arrow = Arrow(source.get_left(), target.get_right(), color=color, **kwargs)
+            opacity = min_opacity + (1 - min_opacity) * strengths[i, j]
+            arrow.set_stroke(opacity=opacity).set_fill(opacity=opacity)
+            arrows.add(arrow)
+    return arrows
@@ -0,0 +1,188 @@
+"""Bar charts whose heights and styles live in arrays.
+
+``show_error_aggregation`` built one ``Rectangle`` per error and grew each
+with its own ``GrowFromEdge``. ``BarChart`` keeps the values, fill colours
+and opacities of all bars in ``(n,)`` / ``(n, 4)`` arrays and writes every
+bar's corner points with one batched ``coords_to_points`` call, so changing or
+animating all heights is a few array operations however many bars there
+are (per-sample losses over a whole dataset, say):
+
+    chart = BarChart(axes, errors, color=RED)
+    self.play(chart.grow(lag_ratio=0.5))
+    self.play(chart.animate_to(new_errors, colors=GREEN))
+
+Bars sit on linear ``axes`` at x = 1, 2, ... (or ``positions``) with
+``bar_width`` in x units. ``chart.bars[i]`` is an ordinary ``VMobject`` for labels and
+``next_to``.
+"""
+
+import numpy as np
+from manim import RED, Animation, ManimColor, VGroup, VMobject
+
+from .plotting import coords_to_points
+
+RATE_SAMPLES = 1025
+
+
+def _rgbas(colors, opacities, count):
+    rgbas = np.empty((count, 4))
+    if isinstance(colors, (list, tuple, np.ndarray)) and not isinstance(colors, ManimColor):
+        rgbas[:, :3] = [ManimColor(color).to_rgb() for color in colors]
+    else:
+        rgbas[:, :3] = ManimColor(colors).to_rgb()
+    rgbas[:, 3] = opacities
+    return rgbas
+
+
+def rectangle_points(lower_left, lower_right, upper_right, upper_left):
+    """Closed cubic-Bézier outlines of ``n`` quads, shape ``(n * 16, 3)``."""
+    corners = np.stack([lower_left, lower_right, upper_right, upper_left, lower_left], axis=1)
+    start, end = corners[:, :-1], corners[:, 1:]
+    thirds = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+    segments = start[:, :, None] + thirds * (end - start)[:, :, None]
+    return segments.reshape(len(corners), 16, 3)
+
+
+class BarChart(VGroup):
+    """``n`` bars on ``axes`` with array-backed values and styles."""
+
+    def __init__(
+        self,
+        axes,
+        values,
+        positions=None,
+        bar_width=0.6,
+        color=RED,
+        fill_opacity=0.7,
+        stroke_width=2,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.values = np.array(values, dtype=float)
+        count = len(self.values)
+        self.positions = np.arange(1, count + 1, dtype=float) if positions is None else np.asarray(positions, dtype=float)
+        self.bar_width = bar_width
+        self.fill_rgbas = _rgbas(color, fill_opacity, count)
+        self.stroke_rgbas = _rgbas(color, 1.0, count)
+        self.bars = VGroup(*[VMobject(stroke_width=stroke_width) for _ in range(count)])
+        self.add(self.bars)
+        self.update_bars()
+
+    def __len__(self):
+        return len(self.values)
+
+    def bar_points(self, values):
+        left = self.positions - self.bar_width / 2
+        right = self.positions + self.bar_width / 2
+        zeros = np.zeros_like(values)
+        xs = np.stack([left, right, right, left])
+        ys = np.stack([zeros, zeros, values, values])
+        corners = coords_to_points(self.axes, np.column_stack([xs.ravel(), ys.ravel()]))
+        return rectangle_points(*corners.reshape(4, -1, 3))
+
+    def update_bars(self):
+        """Write the value and style arrays into the bars' shared buffers."""
+        count = len(self)
+        views = getattr(self, "_views", None)
+        if not views or len(views) != count or views[0][0].base is not self._points:
+            # First call, a new bar count, or a copy whose views were
+            # deep-copied away from its buffers.
+            self._points = np.zeros((count, 16, 3))
+            self._fill = np.zeros((count, 1, 4))
+            self._stroke = np.zeros((count, 1, 4))
+            self._views = list(zip(self._points, self._fill, self._stroke))
+        self._points[:] = self.bar_points(self.values)
+        self._fill[:, 0] = self.fill_rgbas
+        self._stroke[:, 0] = self.stroke_rgbas
+        # Each bar uses a view into the buffers; re-point any bar whose
+        # arrays were replaced (by set_fill, a Transform, a copy, ...).
+        for bar, (points, fill, stroke) in zip(self.bars, self._views):
+            if bar.points is not points:
+                bar.points = points
+            if bar.fill_rgbas is not fill:
+                bar.fill_rgbas = fill
+            if bar.stroke_rgbas is not stroke:
+                bar.stroke_rgbas = stroke
+        return self
+
+    def set_values(self, values):
+        self.values = np.array(values, dtype=float)
+        return self.update_bars()
+
+    def set_colors(self, colors, fill_opacity=None):
+        opacity = self.fill_rgbas[:, 3] if fill_opacity is None else fill_opacity
+        self.fill_rgbas = _rgbas(colors, opacity, len(self))
+        self.stroke_rgbas = _rgbas(colors, self.stroke_rgbas[:, 3], len(self))
+        return self.update_bars()
+
+    def set_fill_opacities(self, opacities):
+        self.fill_rgbas = self.fill_rgbas.copy()
+        self.fill_rgbas[:, 3] = opacities
+        return self.update_bars()
+
+    def animate_to(self, values=None, colors=None, fill_opacities=None, **kwargs):
+        return BarChartTransform(self, values, colors, fill_opacities, **kwargs)
+
+    def grow(self, **kwargs):
+        """Grow every bar up from zero, like ``GrowFromEdge(bar, DOWN)``."""
+        target = self.values.copy()
+        self.set_values(np.zeros_like(target))
+        kwargs.setdefault("introducer", True)
+        return BarChartTransform(self, target, **kwargs)
+
+
+class BarChartTransform(Animation):
+    """Interpolate a ``BarChart``'s value and fill arrays in one step per frame.
+
+    ``lag_ratio`` staggers the bars left to right as ``LaggedStart`` would,
+    computed as one vector of per-bar alphas (the rate function is
+    tabulated once and interpolated).
+    """
+
+    def __init__(self, chart, values=None, colors=None, fill_opacities=None, lag_ratio=0.0, **kwargs):
+        self.target_values = None if values is None else np.array(values, dtype=float)
+        self.target_colors = colors
+        self.target_opacities = fill_opacities
+        self.bar_lag = lag_ratio
+        super().__init__(chart, **kwargs)
+
+    def begin(self):
+        chart = self.mobject
+        count = len(chart)
+        self.start_values = chart.values.copy()
+        self.end_values = self.start_values if self.target_values is None else self.target_values
+        self.start_fill = chart.fill_rgbas.copy()
+        self.start_stroke = chart.stroke_rgbas.copy()
+        self.end_fill = self.start_fill.copy()
+        self.end_stroke = self.start_stroke.copy()
+        if self.target_colors is not None:
+            self.end_fill[:, :3] = _rgbas(self.target_colors, 0, count)[:, :3]
+            self.end_stroke[:, :3] = self.end_fill[:, :3]
+        if self.target_opacities is not None:
+            self.end_fill[:, 3] = self.target_opacities
+        span = 1 + self.bar_lag * max(count - 1, 0)
+        self.bar_offsets = self.bar_lag * np.arange(count) / span
+        self.bar_span = 1 / span
+        self.rate_grid = np.linspace(0, 1, RATE_SAMPLES)
+        self.rate_table = np.array([self.rate_func(t) for t in self.rate_grid])
+        # No starting copy of the chart (and its axes): the arrays above are
+        # the whole starting state.
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def interpolate_mobject(self, alpha):
+        if self.bar_lag:
+            local = np.clip((alpha - self.bar_offsets) / self.bar_span, 0, 1)
+            alphas = np.interp(local, self.rate_grid, self.rate_table)
+        else:
+            alphas = np.full(len(self.bar_offsets), self.rate_func(alpha))
+        chart = self.mobject
+        chart.values = self.start_values + alphas * (self.end_values - self.start_values)
+        chart.fill_rgbas = self.start_fill + alphas[:, None] * (self.end_fill - self.start_fill)
+        chart.stroke_rgbas = self.start_stroke + alphas[:, None] * (self.end_stroke - self.start_stroke)
+        chart.update_bars()
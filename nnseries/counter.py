@@ -0,0 +1,142 @@
+"""Numeric display built from cached digit glyphs.
+
+``DecimalNumber.set_value`` builds a whole new set of character mobjects
+(copied from manim's per-string cache), arranges them and re-applies the
+font size, for every value; ``ChangeDecimalToValue`` does that every frame.
+``GlyphCounter`` takes the outline of each character it needs (digits,
+sign, decimal point, comma) once per ``mob_class``, keeps one ``VMobject``
+slot per character position and, on a new value, copies the cached glyph
+points into the slots at precomputed offsets, laid out the way
+``DecimalNumber`` lays them out (left edge fixed, minus sign and comma
+dropped the same way).
+
+Like ``Gauge`` it follows a ``ValueTracker``, so a ticking counter is
+
+    counter = GlyphCounter(0, num_decimal_places=2, color=YELLOW)
+    self.play(counter.tracker.animate.set_value(1.5))
+
+and the slots can be moved and scaled like any mobject, but not rotated.
+"""
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, ORIGIN, UP, WHITE, MathTex, ValueTracker, VGroup, VMobject
+
+DIGIT_BUFF_PER_FONT_UNIT = 0.001
+
+_glyphs = {}
+
+
+def glyph(char, mob_class=MathTex):
+    """``(points, width, height)`` of ``char`` at the default font size, with
+    its lower-left corner at the origin. Built once per class and character."""
+    key = (mob_class, char)
+    if key not in _glyphs:
+        mob = mob_class(char)
+        members = mob.family_members_with_points()
+        points = np.concatenate([member.points for member in members]) if members else np.zeros((0, 3))
+        if len(points):
+            lower = points.min(axis=0)
+            size = points.max(axis=0) - lower
+            points = points - [lower[0], lower[1], 0]
+        else:
+            size = np.zeros(3)
+        points.flags.writeable = False
+        _glyphs[key] = (points, size[0], size[1])
+    return _glyphs[key]
+
+
+class GlyphCounter(VGroup):
+    """``DecimalNumber`` look-alike that redraws by copying glyph arrays."""
+
+    def __init__(
+        self,
+        number=0,
+        num_decimal_places=2,
+        include_sign=False,
+        group_with_commas=True,
+        font_size=DEFAULT_FONT_SIZE,
+        mob_class=MathTex,
+        color=WHITE,
+        tracker=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.tracker = tracker if tracker is not None else ValueTracker(number)
+        self.num_decimal_places = num_decimal_places
+        self.include_sign = include_sign
+        self.group_with_commas = group_with_commas
+        self.mob_class = mob_class
+        self.glyph_scale = font_size / DEFAULT_FONT_SIZE
+        self._digit_color = color
+
+        # Invisible segment from the lower-left corner up to digit height (so
+        # it stays inside the number's bounds); the counter reads its position
+        # and scale back from it on every redraw.
+        self.digit_height = glyph("0", mob_class)[2] * self.glyph_scale
+        self.anchor = VMobject(stroke_width=0, fill_opacity=0)
+        self.anchor.set_points_as_corners([ORIGIN, self.digit_height * UP])
+        self.slots = VGroup()
+        self.add(self.anchor, self.slots)
+        self._shown = None
+
+        self.update_number()
+        self.add_updater(lambda counter: counter.update_number())
+
+    @property
+    def number(self):
+        return self.tracker.get_value()
+
+    def get_value(self):
+        return self.tracker.get_value()
+
+    def set_value(self, number):
+        self.tracker.set_value(number)
+        return self.update_number()
+
+    def num_string(self, number):
+        sign = "+" if self.include_sign else ""
+        commas = "," if self.group_with_commas else ""
+        string = f"{number:{sign}{commas}.{self.num_decimal_places}f}"
+        if string.startswith("-") and np.round(number, self.num_decimal_places) == 0:
+            string = ("+" if self.include_sign else "") + string[1:]
+        return string
+
+    def _layout(self, string):
+        """Glyph points and their offsets (at the default font size) for ``string``."""
+        digit_height = glyph("0", self.mob_class)[2]
+        buff = DIGIT_BUFF_PER_FONT_UNIT * DEFAULT_FONT_SIZE
+        glyphs, offsets = [], []
+        x = 0.0
+        for index, char in enumerate(string):
+            points, width, height = glyph(char, self.mob_class)
+            y = 0.0
+            if char == "-" and index + 1 < len(string):
+                y = digit_height / 2 - height
+            elif char == ",":
+                y = -height / 2
+            glyphs.append(points)
+            offsets.append((x, y))
+            x += width + buff
+        return glyphs, offsets
+
+    def _add_slot(self):
+        slot = VMobject(fill_color=self._digit_color, fill_opacity=1, stroke_width=0)
+        if self.slots:
+            slot.match_style(self.slots[-1])
+        self.slots.add(slot)
+
+    def update_number(self):
+        string = self.num_string(self.get_value())
+        if string == self._shown:
+            return self
+        start, end = self.anchor.get_start(), self.anchor.get_end()
+        scale = np.linalg.norm(end - start) / self.digit_height * self.glyph_scale
+        glyphs, offsets = self._layout(string)
+        while len(self.slots) < len(glyphs):
+            self._add_slot()
+        for slot, points, (x, y) in zip(self.slots, glyphs, offsets):
+            slot.points = start + scale * (points + [x, y, 0])
+        for slot in self.slots[len(glyphs):]:
+            slot.points = np.zeros((0, 3))
+        self._shown = string
+        return self
@@ -0,0 +1,115 @@
+"""Copy-on-write point arrays.
+
+``mob.copy()`` deep-copies every point array in the family, even when the
+copy is only going to be moved or recoloured. ``shared_copy(mob)`` returns a
+copy whose submobjects point at the *same* point buffers as the original,
+wrapped in read-only ``SharedPoints`` views. The first geometric change to
+either side (``shift``, ``scale``, ``rotate``, item assignment, ...) gives
+that mobject its own private array and leaves the others untouched; style
+changes never touch the points at all.
+
+In-place writes manim makes through ``mob.points += v`` or
+``mob.points[i] = v`` are caught by the view, which copies the buffer and
+rebinds ``mob.points`` to the copy before writing. A plain ``.copy()`` of a
+mobject holding shared views gets ordinary private arrays, as before.
+"""
+
+import weakref
+
+import numpy as np
+
+EMPTY_POINTS = np.zeros((0, 3))
+
+
+class SharedPoints(np.ndarray):
+    """Read-only view of a shared point buffer, owned by one mobject."""
+
+    def __array_finalize__(self, obj):
+        self._owner = None
+
+    def _private(self):
+        """Give the owner its own writable copy and return it (None if the
+        view has no owner, or the owner no longer uses this view)."""
+        owner = self._owner() if self._owner is not None else None
+        if owner is None or owner.points is not self:
+            return None
+        owner.points = np.array(self, dtype=self.dtype)
+        return owner.points
+
+    def __setitem__(self, index, value):
+        if not self.flags.writeable:
+            target = self._private()
+            if target is not None:
+                target[index] = value
+                return
+        super().__setitem__(index, value)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        inputs = tuple(x.view(np.ndarray) if isinstance(x, SharedPoints) else x for x in inputs)
+        if out is not None:
+            targets = []
+            for array in out:
+                if isinstance(array, SharedPoints):
+                    if not array.flags.writeable:
+                        private = array._private()
+                        array = private if private is not None else np.array(array)
+                    else:
+                        array = array.view(np.ndarray)
+                targets.append(array)
+            kwargs["out"] = tuple(targets)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        # ``a += b`` rebinds ``a`` to what we return, so an in-place op on a
+        # shared view hands back the private copy it wrote into.
+        return result
+
+    def __deepcopy__(self, memo):
+        return np.array(self, dtype=self.dtype)
+
+    def __reduce__(self):
+        return np.array(self, dtype=self.dtype).__reduce__()
+
+
+def share(mobject, buffer):
+    """Point ``mobject`` at a read-only view of ``buffer``."""
+    view = buffer.view(SharedPoints)
+    view.flags.writeable = False
+    view._owner = weakref.ref(mobject)
+    mobject.points = view
+    return view
+
+
+def _buffer(points):
+    if isinstance(points, SharedPoints) and not points.flags.writeable:
+        return points.view(np.ndarray)
+    points = np.asarray(points)
+    points.flags.writeable = False
+    return points
+
+
+def shared_copy(mobject):
+    """``mobject.copy()`` that shares point buffers copy-on-write."""
+    family = mobject.get_family()
+    held = [mob.points for mob in family]
+    for mob in family:
+        mob.points = EMPTY_POINTS
+    try:
+        duplicate = mobject.copy()
+    finally:
+        for mob, points in zip(family, held):
+            mob.points = points
+    for original, clone, points in zip(family, duplicate.get_family(), held):
+        if not len(points):
+            clone.points = np.array(points)
+            continue
+        buffer = _buffer(points)
+        share(original, buffer)
+        share(clone, buffer)
+    return duplicate
+
+
+def is_shared(mobject):
+    """True if any family member still uses a shared point buffer."""
+    return any(
+        isinstance(mob.points, SharedPoints) and not mob.points.flags.writeable
+        for mob in mobject.get_family()
+    )
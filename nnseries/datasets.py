@@ -0,0 +1,149 @@
+"""Synthetic classification datasets for the boundary scenes.
+
+The "inner blue cluster / outer red ring" data used to be rebuilt in each
+scene from loops of scalar ``np.random`` calls. Every generator here
+returns ``(points, labels)``: an ``(n, 3)`` float array (z is 0 for the 2D
+sets) and an ``(n,)`` int array of class labels, in class order. Results
+are memoized on the arguments and ``seed`` and returned read-only, so asking
+for the same dataset again is a dictionary hit; ``.copy()`` before
+modifying one.
+
+Pass ``seed=self.seed`` from a ``SeededSceneMixin`` scene to tie the data to
+the scene and the series seed. Scenes that called ``np.random.seed(n)``
+themselves pass ``seed=n, legacy=True`` instead: ``rings``, ``wavy_halves``
+and ``shells`` then draw from ``np.random.RandomState(n)`` in the order the
+original loops did, so those scenes keep their exact layouts.
+"""
+
+import functools
+
+import numpy as np
+
+from .rng import _points, cluster, disc, ring
+
+CACHE_SIZE = 128
+
+
+def _memoized(function):
+    cached = functools.lru_cache(maxsize=CACHE_SIZE)(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        args = tuple(tuple(a) if isinstance(a, list) else a for a in args)
+        kwargs = {k: tuple(v) if isinstance(v, list) else v for k, v in kwargs.items()}
+        return cached(*args, **kwargs)
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+def _labelled(*classes):
+    points = np.concatenate(classes)
+    labels = np.repeat(np.arange(len(classes)), [len(c) for c in classes])
+    points.setflags(write=False)
+    labels.setflags(write=False)
+    return points, labels
+
+
+def _rng(seed, legacy):
+    return np.random.RandomState(seed) if legacy else np.random.default_rng(seed)
+
+
+def _per_class(value, count):
+    return tuple(value) if isinstance(value, tuple) else (value,) * count
+
+
+@_memoized
+def rings(counts=(20, 40), radii=(0.3, 1.5), noise=0.0, spaced=True, seed=0, legacy=False):
+    """Concentric noisy rings; class ``i`` is the ring of radius ``radii[i]``.
+
+    ``noise`` may be one value or one per ring. With ``spaced`` the angles are
+    evenly spaced, otherwise uniformly random.
+    """
+    rng = _rng(seed, legacy)
+    noises = _per_class(noise, len(counts))
+    classes = []
+    for count, radius, sigma in zip(counts, radii, noises):
+        angles = None if spaced else rng.uniform(0, 2 * np.pi, count)
+        classes.append(ring(rng, count, radius, noise=sigma, angles=angles))
+    return _labelled(*classes)
+
+
+@_memoized
+def disc_and_ring(counts=(20, 20), inner_radius=1.0, outer_radius=2.0, noise=0.1, seed=0):
+    """Class 0 fills a disc, class 1 is a noisy ring around it."""
+    rng = np.random.default_rng(seed)
+    inner = disc(rng, counts[0], inner_radius)
+    outer = ring(rng, counts[1], outer_radius, noise=noise, angles=rng.uniform(0, 2 * np.pi, counts[1]))
+    return _labelled(inner, outer)
+
+
+@_memoized
+def moons(counts=(50, 50), noise=0.1, seed=0):
+    """Two interleaving half circles of radius 1."""
+    rng = np.random.default_rng(seed)
+    upper = np.linspace(0, np.pi, counts[0])
+    lower = np.linspace(0, np.pi, counts[1])
+    first = ring(rng, counts[0], 1.0, noise=noise, angles=upper)
+    second = ring(rng, counts[1], 1.0, noise=noise, center=(1.0, 0.5), angles=lower + np.pi)
+    return _labelled(first, second)
+
+
+@_memoized
+def spirals(count=100, arms=2, turns=1.5, radius=2.0, noise=0.05, seed=0):
+    """``arms`` interleaved spirals of ``count`` points each; class = arm."""
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0.05, 1, count)
+    classes = []
+    for arm in range(arms):
+        angles = 2 * np.pi * (turns * t + arm / arms)
+        xy = (radius * t)[:, None] * np.column_stack([np.cos(angles), np.sin(angles)])
+        xy += noise * rng.standard_normal((count, 2))
+        points = np.zeros((count, 3))
+        points[:, :2] = xy
+        classes.append(points)
+    return _labelled(*classes)
+
+
+@_memoized
+def wavy_halves(count=600, radius=3.0, amplitude=0.7, frequency=1.5, seed=0, legacy=False):
+    """Points filling a disc, split by ``y = amplitude * sin(frequency * x)``.
+
+    Class 0 is below the wave, class 1 above it.
+    """
+    rng = _rng(seed, legacy)
+    if legacy:
+        # Uniform points in the bounding square, kept if inside the disc.
+        kept = []
+        while sum(len(xy) for xy in kept) < count:
+            xy = rng.uniform(-radius, radius, (count, 2))
+            kept.append(xy[(xy**2).sum(axis=1) <= radius**2])
+        points = _points(np.concatenate(kept)[:count])
+    else:
+        points = disc(rng, count, radius)
+    below = points[:, 1] < amplitude * np.sin(frequency * points[:, 0])
+    return _labelled(points[below], points[~below])
+
+
+@_memoized
+def shells(counts=(20, 30), spread=0.5, radius=2.0, wave=1.0, noise=0.3, seed=0, legacy=False):
+    """3D: a Gaussian blob inside a noisy ring that waves ``wave * sin(2a)`` in z."""
+    rng = _rng(seed, legacy)
+    inner = cluster(rng, counts[0], spread=spread, dims=3)
+    angles = np.linspace(0, 2 * np.pi, counts[1])
+    outer = ring(rng, counts[1], radius, angles=angles)
+    outer += noise * rng.standard_normal((counts[1], 3))
+    outer[:, 2] += wave * np.sin(2 * angles)
+    return _labelled(inner, outer)
+
+
+def split(points, labels, classes=None):
+    """Points per class, in label order: ``inner, outer = split(*rings(...))``.
+
+    ``classes`` lists the labels to return (default: those present), so a
+    class with no points still gets its own, empty, array.
+    """
+    if classes is None:
+        classes = np.unique(labels)
+    return [points[labels == label] for label in classes]
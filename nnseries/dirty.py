@@ -0,0 +1,272 @@
+"""Dirty-rectangle rendering for frames where only a small area changes.
+
+Stock Cairo rendering redraws, every frame, the first animated mobject and
+*everything drawn after it* (to keep the draw order right), on top of a
+full-frame copy of the static image. In scenes such as
+``WeightsAsVolumeKnobs`` (one ticking ``DecimalNumber``) or
+``GradientDescentWeights`` (one moving dot) that is most of the scene.
+
+``DirtyRegionMixin`` swaps in ``DirtyRegionCamera``. For every play the
+scene hands the camera a draw plan: the mobjects in draw order, split into
+moving roots (animated or updated mobjects) and static ones with
+precomputed bounding boxes. The first frame of a play is drawn normally.
+After that, each frame only
+
+1. takes the union of the moving mobjects' boxes now and on the previous
+   frame,
+2. resets that rectangle to the background, and
+3. redraws, clipped to it and in draw order, the moving mobjects plus the
+   static mobjects whose boxes intersect it.
+
+Pixels outside the rectangle are kept from the previous frame. The
+rectangle is rounded out to whole pixels, and both the reset and the clip
+use those pixels, so no pixel is reset without being fully redrawn. Only 2D
+scenes (the plain ``Camera``) are supported.
+
+With ``NNSERIES_DIRTY_CHECK=1`` (or ``dirty_check = True`` on the scene)
+the last frame of every play is also drawn in full into a scratch buffer
+and compared with the incremental one; a difference of more than
+``DIRTY_CHECK_TOLERANCE`` colour levels is logged as a warning.
+"""
+
+import os
+
+import numpy as np
+from manim import Camera, Mobject, VMobject, config, logger
+
+# Extra margin around bounding boxes, in frame units, for antialiasing.
+BOX_PADDING = 0.05
+DIRTY_CHECK_ENV = "NNSERIES_DIRTY_CHECK"
+DIRTY_CHECK_TOLERANCE = 2
+
+
+def _slot_members(kind, mobject):
+    # A static slot stands for that one mobject (its submobjects get their
+    # own slots); a moving slot stands for its whole, possibly changing, family.
+    if kind == "static":
+        return [mobject]
+    return mobject.family_members_with_points()
+
+
+def _box(members, line_width_multiple):
+    if not members:
+        return None
+    points = np.concatenate([mob.points for mob in members])
+    stroke = max(
+        (mob.get_stroke_width() for mob in members if isinstance(mob, VMobject)),
+        default=0,
+    )
+    pad = BOX_PADDING + stroke * line_width_multiple
+    return np.array([
+        points[:, 0].min() - pad,
+        points[:, 1].min() - pad,
+        points[:, 0].max() + pad,
+        points[:, 1].max() + pad,
+    ])
+
+
+def _union(first, second):
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return np.array([
+        min(first[0], second[0]),
+        min(first[1], second[1]),
+        max(first[2], second[2]),
+        max(first[3], second[3]),
+    ])
+
+
+class DirtyRegionCamera(Camera):
+    def __init__(self, *args, **kwargs):
+        # ``Camera.__init__`` calls ``reset``, which needs the plan state.
+        self.end_dirty_plan()
+        self._check_array = None
+        super().__init__(*args, **kwargs)
+
+    def start_dirty_plan(self, slots):
+        """``slots`` is a draw-ordered list of ("moving" | "static", mobject)."""
+        self._slots = slots
+        self._moving = [i for i, (kind, _) in enumerate(slots) if kind == "moving"]
+        self._static = np.array(
+            [i for i, (kind, _) in enumerate(slots) if kind == "static"], dtype=int
+        )
+        self._static_boxes = np.array(
+            [_box([slots[i][1]], self.cairo_line_width_multiple) for i in self._static]
+        ).reshape(-1, 4)
+        self._frame_valid = False
+        self._previous_box = None
+
+    def end_dirty_plan(self):
+        self._slots = None
+        self.check_frame = False
+        self._frame_valid = False
+        self._previous_box = None
+
+    def reset(self):
+        if self._slots is None or not self._frame_valid:
+            super().reset()
+        return self
+
+    def set_frame_to_background(self, background):
+        if self._slots is None or not self._frame_valid:
+            super().set_frame_to_background(background)
+
+    def _moving_box(self):
+        box = None
+        for index in self._moving:
+            members = self._slots[index][1].family_members_with_points()
+            box = _union(box, _box(members, self.cairo_line_width_multiple))
+        return box
+
+    def _pixel_bounds(self, box):
+        fx = self.frame_center[0] - self.frame_width / 2
+        fy = self.frame_center[1] + self.frame_height / 2
+        sx = self.pixel_width / self.frame_width
+        sy = self.pixel_height / self.frame_height
+        x0 = int(np.clip(np.floor((box[0] - fx) * sx), 0, self.pixel_width))
+        x1 = int(np.clip(np.ceil((box[2] - fx) * sx), 0, self.pixel_width))
+        y0 = int(np.clip(np.floor((fy - box[3]) * sy), 0, self.pixel_height))
+        y1 = int(np.clip(np.ceil((fy - box[1]) * sy), 0, self.pixel_height))
+        return x0, x1, y0, y1
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if self._slots is None:
+            return super().capture_mobjects(mobjects, **kwargs)
+        current_box = self._moving_box()
+        if not self._frame_valid:
+            super().capture_mobjects(mobjects, **kwargs)
+            self._frame_valid = True
+            self._previous_box = current_box
+            return
+        box = _union(current_box, self._previous_box)
+        self._previous_box = current_box
+        if box is None:
+            return
+
+        hits = self._static[
+            (self._static_boxes[:, 0] <= box[2])
+            & (self._static_boxes[:, 2] >= box[0])
+            & (self._static_boxes[:, 1] <= box[3])
+            & (self._static_boxes[:, 3] >= box[1])
+        ]
+        to_draw = []
+        for index in sorted([*self._moving, *hits.tolist()]):
+            to_draw.extend(_slot_members(*self._slots[index]))
+        if any(self.type_or_raise(mob) not in (VMobject, Mobject) for mob in to_draw):
+            # Only Cairo drawing honours the clip (plain Mobjects draw
+            # nothing); redraw the whole frame for images and point clouds.
+            super().reset()
+            super().capture_mobjects(mobjects, **kwargs)
+            return
+
+        x0, x1, y0, y1 = self._pixel_bounds(box)
+        self.pixel_array[y0:y1, x0:x1] = self.background[y0:y1, x0:x1]
+        ctx = self.get_cairo_context(self.pixel_array)
+        ctx.save()
+        # Clip to exactly the pixels just reset, in device space: a clip edge
+        # inside a pixel is antialiased, and a reset pixel redrawn at partial
+        # coverage would keep a dim seam after the moving mobject has passed.
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.set_matrix(matrix)
+        ctx.clip()
+        try:
+            super().capture_mobjects(to_draw, include_submobjects=False)
+        finally:
+            ctx.restore()
+        if self.check_frame:
+            difference = self.full_redraw_difference(mobjects, **kwargs)
+            if difference > DIRTY_CHECK_TOLERANCE:
+                logger.warning(
+                    "Dirty-region frame differs from a full redraw by up to %d colour levels", difference
+                )
+
+    def full_redraw_difference(self, mobjects, **kwargs):
+        """Largest per-channel difference between the current frame and
+        ``mobjects`` drawn in full on the background."""
+        frame = self.pixel_array
+        if self._check_array is None or self._check_array.shape != frame.shape:
+            self._check_array = np.empty_like(frame)
+        self._check_array[:] = self.background
+        self.pixel_array = self._check_array
+        try:
+            super().capture_mobjects(mobjects, **kwargs)
+        finally:
+            self.pixel_array = frame
+        return int(np.abs(self._check_array.astype(int) - frame.astype(int)).max())
+
+
+class DirtyRegionMixin:
+    dirty_check = False
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", DirtyRegionCamera)
+        self.dirty_check = self.dirty_check or os.environ.get(DIRTY_CHECK_ENV, "") not in ("", "0")
+        super().__init__(*args, **kwargs)
+
+    def update_to_time(self, t):
+        super().update_to_time(t)
+        camera = self.renderer.camera
+        if self.dirty_check and isinstance(camera, DirtyRegionCamera):
+            # Frames are drawn at 0, 1/fps, ... up to just before the duration.
+            camera.check_frame = bool(t + 1 / config.frame_rate >= self.duration - 1e-9)
+
+    def _moving_ids(self, animations):
+        moving = set()
+
+        def visit(animation):
+            moving.update(id(mob) for mob in animation.mobject.get_family())
+            for sub in getattr(animation, "animations", ()):
+                visit(sub)
+
+        for animation in animations:
+            visit(animation)
+        for mob in self.get_mobject_family_members():
+            if mob.updaters:
+                moving.update(id(sub) for sub in mob.get_family())
+        for mob in self.foreground_mobjects:
+            moving.update(id(sub) for sub in mob.get_family())
+        return moving
+
+    def _draw_slots(self, moving_ids):
+        slots = []
+        seen = set()
+
+        def visit(mob):
+            if id(mob) in seen:
+                return
+            seen.add(id(mob))
+            if id(mob) in moving_ids:
+                slots.append(("moving", mob))
+                return
+            if len(mob.points):
+                slots.append(("static", mob))
+            for sub in mob.submobjects:
+                visit(sub)
+
+        for mob in [*self.mobjects, *self.foreground_mobjects]:
+            visit(mob)
+        return slots
+
+    def get_moving_and_static_mobjects(self, animations):
+        camera = self.renderer.camera
+        if not isinstance(camera, DirtyRegionCamera):
+            return super().get_moving_and_static_mobjects(animations)
+        slots = self._draw_slots(self._moving_ids(animations))
+        camera.start_dirty_plan(slots)
+        # Hand the renderer every mobject in draw order for the first frame;
+        # the camera keeps its own frame after that, so the renderer's
+        # full-frame static image is not needed.
+        everything = [mob for slot in slots for mob in _slot_members(*slot)]
+        return everything, []
+
+    def play(self, *args, **kwargs):
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            camera = self.renderer.camera
+            if isinstance(camera, DirtyRegionCamera):
+                camera.end_dirty_plan()
@@ -0,0 +1,258 @@
+"""Write scenes out as PNG or EXR image sequences, encoded by a process pool.
+
+Post-production takes frame sequences rather than MP4s for scenes such as
+``CakeBakingAnalogy`` or ``BackpropTakeaways``. Manim's own ``--format png``
+compresses and writes every frame in the render loop, and at 1280x720 PNG
+compression costs more than drawing the frame. With ``ImageSequenceMixin``
+the renderer's frames go into a bounded queue instead; ``workers`` processes
+encode and write them, so the main process only rasterizes and blocks only
+when the encoders fall ``queue_size`` frames behind. Held frames (``wait``)
+are encoded once and the same bytes written for every repeat.
+
+Export is off by default. Enable it with ``NNSERIES_EXPORT=png`` (or
+``exr``) in the environment or ``export_format = "png"`` on the scene
+class; ``NNSERIES_EXPORT_COMPRESSION`` (PNG zlib level 0-9),
+``NNSERIES_EXPORT_WORKERS`` and ``NNSERIES_EXPORT_DIR`` (default
+``sequences``) likewise fill in the matching ``export_*`` class attributes.
+An attribute the scene class (or the CLI) sets itself takes priority over
+the environment. Frames
+land in ``<dir>/<Scene>/<Scene>_00000.png``; manim's own movie or PNG
+output is skipped for the exported scene, and so is its partial-movie cache,
+so every frame is drawn.
+
+EXR frames are linear-light float32 RGBA and need ``imageio`` with an EXR
+plugin (e.g. ``pip install imageio[freeimage]``).
+
+``python -m nnseries export <episode main.py>... [-s Scene]`` renders
+scenes this way without adding the mixin to them.
+"""
+
+import argparse
+import importlib.util
+import io
+import multiprocessing
+import os
+import queue
+from pathlib import Path
+
+import numpy as np
+from manim import logger, tempconfig
+from PIL import Image
+
+from .timeline import select_scenes, with_mixin, working_directory
+
+EXPORT_ENV = "NNSERIES_EXPORT"
+COMPRESSION_ENV = "NNSERIES_EXPORT_COMPRESSION"
+WORKERS_ENV = "NNSERIES_EXPORT_WORKERS"
+DIR_ENV = "NNSERIES_EXPORT_DIR"
+FORMATS = ("png", "exr")
+DEFAULT_DIR = "sequences"
+# Frames waiting for an encoder; a 1080p RGBA frame is about 8 MB.
+QUEUE_SIZE = 16
+PUT_TIMEOUT = 1.0
+
+
+def srgb_to_linear(channels):
+    channels = channels / 255.0
+    return np.where(channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+
+
+def encode_frame(frame, fmt, compression, path):
+    """Bytes of ``frame`` as a ``fmt`` file."""
+    if fmt == "png":
+        buffer = io.BytesIO()
+        Image.fromarray(frame).save(buffer, format="PNG", compress_level=compression)
+        return buffer.getvalue()
+    import imageio.v3 as iio
+
+    pixels = np.empty(frame.shape, dtype=np.float32)
+    pixels[..., :3] = srgb_to_linear(frame[..., :3])
+    pixels[..., 3] = frame[..., 3] / 255.0
+    return iio.imwrite("<bytes>", pixels, extension=path.suffix)
+
+
+def encode_frames(frames, errors, directory, prefix, fmt, compression):
+    """Worker loop: ``(index, repeat, frame)`` items until ``None``."""
+    directory = Path(directory)
+    while True:
+        item = frames.get()
+        if item is None:
+            return
+        index, repeat, frame = item
+        try:
+            first = directory / f"{prefix}{index:05d}.{fmt}"
+            data = encode_frame(frame, fmt, compression, first)
+            for offset in range(repeat):
+                (directory / f"{prefix}{index + offset:05d}.{fmt}").write_bytes(data)
+        except Exception as error:
+            errors.put(f"frame {index}: {error!r}")
+
+
+class ImageSequencePool:
+    """Encoder processes fed from a bounded queue of frames."""
+
+    def __init__(self, directory, prefix, fmt="png", compression=6, workers=None, queue_size=QUEUE_SIZE):
+        if fmt not in FORMATS:
+            raise ValueError(f"export format must be one of {FORMATS}, not {fmt!r}")
+        if not 0 <= compression <= 9:
+            raise ValueError(f"PNG compression must be a zlib level from 0 to 9, not {compression}")
+        if fmt == "exr" and importlib.util.find_spec("imageio") is None:
+            raise ImportError("EXR export needs imageio with an EXR plugin: pip install imageio[freeimage]")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.format = fmt
+        self.frame_count = 0
+        workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        context = multiprocessing.get_context()
+        self.frames = context.Queue(maxsize=queue_size)
+        self.errors = context.Queue()
+        self.workers = [
+            context.Process(
+                target=encode_frames,
+                args=(self.frames, self.errors, str(self.directory), prefix, fmt, compression),
+                daemon=True,
+            )
+            for _ in range(workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def _put(self, item):
+        while True:
+            try:
+                self.frames.put(item, timeout=PUT_TIMEOUT)
+                return
+            except queue.Full:
+                if not all(worker.is_alive() for worker in self.workers):
+                    raise RuntimeError("an image sequence encoder exited early")
+
+    def put(self, frame, repeat=1):
+        if repeat <= 0:
+            return
+        self._put((self.frame_count, repeat, np.ascontiguousarray(frame)))
+        self.frame_count += repeat
+
+    def close(self):
+        """Wait for every queued frame to be written; raise if any failed."""
+        for _ in self.workers:
+            self._put(None)
+        for worker in self.workers:
+            worker.join()
+        failures = []
+        while True:
+            try:
+                failures.append(self.errors.get_nowait())
+            except queue.Empty:
+                break
+        if failures:
+            raise RuntimeError(f"{len(failures)} frames failed to export, first: {failures[0]}")
+        return self.frame_count
+
+
+class ImageSequenceWriter:
+    """Stands in for the renderer's ``SceneFileWriter``: frames go to an
+    ``ImageSequencePool`` and nothing else is encoded or cached."""
+
+    def __init__(self, file_writer, pool):
+        self.file_writer = file_writer
+        self.pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self.file_writer, name)
+
+    def is_already_cached(self, *args, **kwargs):
+        return False
+
+    def begin_animation(self, *args, **kwargs):
+        pass
+
+    def end_animation(self, *args, **kwargs):
+        pass
+
+    def write_frame(self, frame, *args, repeat=1, num_frames=None, **kwargs):
+        self.pool.put(frame, repeat if num_frames is None else num_frames)
+
+    def finish(self):
+        count = self.pool.close()
+        logger.info("%d %s frames ready at %s", count, self.pool.format, self.pool.directory)
+
+
+class ImageSequenceMixin:
+    export_format = None
+    export_compression = 6
+    export_workers = None
+    export_queue_size = QUEUE_SIZE
+    export_dir = DEFAULT_DIR
+
+    def __init__(self, *args, **kwargs):
+        self.export_format = self._export_setting("export_format", EXPORT_ENV)
+        self.export_compression = self._export_setting("export_compression", COMPRESSION_ENV, int)
+        self.export_workers = self._export_setting("export_workers", WORKERS_ENV, int)
+        self.export_dir = self._export_setting("export_dir", DIR_ENV)
+        super().__init__(*args, **kwargs)
+        if self.export_format and self.export_format != "0":
+            name = type(self).__name__
+            pool = ImageSequencePool(
+                Path(self.export_dir) / name,
+                f"{name}_",
+                fmt=self.export_format,
+                compression=self.export_compression,
+                workers=self.export_workers,
+                queue_size=self.export_queue_size,
+            )
+            self.renderer.file_writer = ImageSequenceWriter(self.renderer.file_writer, pool)
+
+    def _export_setting(self, name, env, convert=str):
+        """The class attribute ``name`` if a class in front of the mixin sets
+        it, else ``$env`` if set, else the mixin's default."""
+        for cls in type(self).__mro__:
+            if cls is ImageSequenceMixin:
+                break
+            if name in vars(cls):
+                return getattr(self, name)
+        if os.environ.get(env):
+            return convert(os.environ[env])
+        return getattr(self, name)
+
+
+def export_scene(scene_class, fmt="png", compression=6, workers=None, directory=DEFAULT_DIR, quality="high_quality"):
+    """Render ``scene_class`` to an image sequence and return the frame count."""
+    if not issubclass(scene_class, ImageSequenceMixin):
+        scene_class = with_mixin(ImageSequenceMixin, scene_class)
+    exporting = type(scene_class.__name__, (scene_class,), {
+        "__module__": scene_class.__module__,
+        "export_format": fmt,
+        "export_compression": compression,
+        "export_workers": workers,
+        "export_dir": str(directory),
+    })
+    with tempconfig({"quality": quality, "disable_caching": True}):
+        scene = exporting()
+        scene.render()
+    return scene.renderer.file_writer.pool.frame_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nnseries export", description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="episode main.py files")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="only these scenes (repeatable)")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="png")
+    parser.add_argument("-c", "--compression", type=int, default=6, choices=range(10), metavar="0-9", help="PNG zlib level")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="encoder processes (default: CPUs - 1)")
+    parser.add_argument("-o", "--output", default=DEFAULT_DIR, help="output directory")
+    parser.add_argument("--quality", default="high_quality", help="manim quality preset, e.g. medium_quality")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output).resolve()
+    failed = 0
+    for path, scene_class in select_scenes(args.paths, args.scene):
+        try:
+            with working_directory(path):
+                count = export_scene(scene_class, args.format, args.compression, args.workers, output, args.quality)
+        except Exception as error:
+            failed += 1
+            logger.error("%s (%s): %s", scene_class.__name__, path, error)
+            continue
+        print(f"{count:6d} frames  {scene_class.__name__}")
+    return 1 if failed else 0
@@ -0,0 +1,107 @@
+"""Gauge / meter mobject driven by a ``ValueTracker``.
+
+``LossReductionTraining.create_gauge`` built a new set of arcs, an arrow and
+a dot for every reading, so showing a different value meant building
+another gauge and transforming to it. ``Gauge`` keeps one set of
+submobjects and, from an updater, recomputes the filled arc's Bézier points
+and rotates the needle's stored points in place from its tracker's value,
+a handful of array operations per frame:
+
+    meter = Gauge(value=0.8, color=RED)
+    self.play(meter.tracker.animate.set_value(0.2))
+
+Pass ``tracker=`` to share a tracker that something else drives (e.g. the
+loss of a ``TrainingSimulation``). The gauge can be moved and scaled like
+any mobject, but not rotated.
+"""
+
+import numpy as np
+from manim import GRAY, ORIGIN, OUT, PI, RED, RIGHT, WHITE, Arc, Arrow, Dot, ValueTracker, VGroup, VMobject, rotation_matrix
+
+ARC_SEGMENTS = 16
+
+
+def arc_points(angles, radius):
+    """Cubic Bézier points of the arc through consecutive ``angles``."""
+    start, end = angles[:-1], angles[1:]
+    handle = 4 / 3 * np.tan((end - start) / 4)
+    points = np.zeros((len(start), 4, 3))
+    points[:, 0, :2] = np.column_stack([np.cos(start), np.sin(start)])
+    points[:, 3, :2] = np.column_stack([np.cos(end), np.sin(end)])
+    points[:, 1, :2] = points[:, 0, :2] + handle[:, None] * np.column_stack([-np.sin(start), np.cos(start)])
+    points[:, 2, :2] = points[:, 3, :2] - handle[:, None] * np.column_stack([-np.sin(end), np.cos(end)])
+    return radius * points.reshape(-1, 3)
+
+
+class Gauge(VGroup):
+    """Half-circle meter: the arc fills clockwise from the left and the needle
+    points at the current reading.
+
+    ``value_range`` maps the tracker's value onto the dial; values outside it
+    are clamped.
+    """
+
+    def __init__(
+        self,
+        value=0.0,
+        value_range=(0, 1),
+        radius=1.2,
+        color=RED,
+        stroke_width=8,
+        tracker=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.tracker = tracker if tracker is not None else ValueTracker(value)
+        self.value_range = value_range
+        self.radius = radius
+
+        self.background = Arc(
+            radius=radius,
+            start_angle=PI,
+            angle=-PI,
+            color=GRAY,
+            stroke_width=stroke_width,
+            stroke_opacity=0.3,
+        )
+        self.filled = VMobject(color=color, stroke_width=stroke_width)
+        self.needle = Arrow(
+            ORIGIN, radius * RIGHT,
+            color=color,
+            stroke_width=3,
+            buff=0,
+            max_tip_length_to_length_ratio=0.2,
+        )
+        self.hub = Dot(ORIGIN, radius=0.1, color=WHITE)
+        self.add(self.background, self.filled, self.needle, self.hub)
+
+        # Needle geometry pointing along +x about the hub, rotated per frame.
+        self._needle_members = self.needle.family_members_with_points()
+        self._needle_points = [mob.points.copy() for mob in self._needle_members]
+        self._sweep = np.linspace(0, 1, ARC_SEGMENTS + 1)
+
+        self.update_reading()
+        self.add_updater(lambda gauge: gauge.update_reading())
+
+    def get_value(self):
+        return self.tracker.get_value()
+
+    def set_value(self, value):
+        self.tracker.set_value(value)
+        return self.update_reading()
+
+    def get_fraction(self):
+        low, high = self.value_range
+        return float(np.clip((self.get_value() - low) / (high - low), 0, 1))
+
+    def update_reading(self):
+        pivot = self.hub.get_center()
+        scale = np.linalg.norm(self.background.get_start() - pivot) / self.radius
+        sweep = PI * self.get_fraction()
+
+        self.filled.points = arc_points(PI - sweep * self._sweep, self.radius * scale) + pivot
+
+        rotation = scale * rotation_matrix(PI - sweep, OUT)
+        for mob, points in zip(self._needle_members, self._needle_points):
+            mob.points = points @ rotation.T + pivot
+        return self
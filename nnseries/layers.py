@@ -0,0 +1,109 @@
+"""Keep the static layer's bitmap across ``play`` calls.
+
+For every ``play`` the Cairo renderer draws the mobjects that do not move
+(axes, tick labels, titles, network skeletons) into a static image and
+composites the moving ones over it each frame. That static image is thrown
+away after the play, so in ``LearningRateVisualization`` (three ``Axes`` and
+their loss curves) or ``LossReductionTraining.show_training_progress`` the
+same axes are rasterized again for every marker that moves.
+
+``StaticLayerMixin`` gives the scene a ``StaticLayerRenderer``, which keys
+the static image on the static mobjects, a checksum of their points and
+style, and the camera frame. A play whose static layer matches a cached one
+reuses that bitmap; moving, restyling, adding or removing any static
+mobject changes the key, so the layer is drawn again. The renderer uses the
+camera class the scene would have used (``ThreeDCamera`` for a
+``ThreeDScene``, ``MovingCamera`` for a ``MovingCameraScene``, ...).
+"""
+
+import inspect
+import zlib
+
+import numpy as np
+from manim import Camera, RendererType, VMobject, config
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Static layers alternate between a few states (e.g. with and without a
+# marker that only moves every other play); full frames are a few MB each.
+CACHE_SIZE = 4
+
+
+def _state_arrays(mobject):
+    yield mobject.points
+    if isinstance(mobject, VMobject):
+        yield mobject.fill_rgbas
+        yield mobject.stroke_rgbas
+        yield mobject.background_stroke_rgbas
+        yield np.array(
+            [mobject.stroke_width, mobject.background_stroke_width, mobject.z_index],
+            dtype=float,
+        )
+    elif isinstance(mobject, AbstractImageMobject):
+        yield mobject.get_pixel_array()
+
+
+def layer_key(camera, mobjects):
+    """Hashable key that changes when anything drawn in the layer changes."""
+    checksum = 0
+    for mob in mobjects:
+        for array in _state_arrays(mob):
+            checksum = zlib.crc32(np.ascontiguousarray(array), checksum)
+    frame = (
+        tuple(np.round(camera.frame_center, 6)),
+        camera.frame_width,
+        camera.frame_height,
+        str(camera.background_color),
+        camera.background_opacity,
+    )
+    return tuple(id(mob) for mob in mobjects), checksum, frame
+
+
+class StaticLayerRenderer(CairoRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_layers = {}
+        self.static_hits = 0
+        self.static_misses = 0
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if not static_mobjects:
+            return super().save_static_frame_data(scene, static_mobjects)
+        key = layer_key(self.camera, static_mobjects)
+        cached = self.static_layers.pop(key, None)
+        if cached is None:
+            self.static_misses += 1
+            cached = super().save_static_frame_data(scene, static_mobjects)
+        else:
+            self.static_hits += 1
+            self.static_image = cached
+        # Re-insert so the dict stays in least-recently-used order.
+        self.static_layers[key] = cached
+        while len(self.static_layers) > CACHE_SIZE:
+            del self.static_layers[next(iter(self.static_layers))]
+        return cached
+
+
+def default_camera_class(scene_class):
+    """The ``camera_class`` default of the first ``__init__`` in
+    ``scene_class``'s MRO that declares one (``Scene``'s is ``Camera``)."""
+    for cls in scene_class.__mro__:
+        init = vars(cls).get("__init__")
+        if init is None:
+            continue
+        parameter = inspect.signature(init).parameters.get("camera_class")
+        if parameter is not None and parameter.default is not inspect.Parameter.empty:
+            return parameter.default
+    return Camera
+
+
+class StaticLayerMixin:
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("renderer") is None and config.renderer == RendererType.CAIRO:
+            # The renderer is built before the scene's own __init__ runs, so
+            # take the camera class it would have passed, not plain Camera.
+            kwargs["renderer"] = StaticLayerRenderer(
+                camera_class=kwargs.get("camera_class") or default_camera_class(type(self)),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(*args, **kwargs)
@@ -0,0 +1,226 @@
+"""``.animate`` replacement that builds its target as arrays, not as a copy.
+
+``mob.animate.scale(1.2).set_color(RED)`` deep-copies ``mob`` to build the
+target, and the resulting Transform copies it again as the starting state.
+``lazy(mob).scale(1.2).set_color(RED)`` only records the chain. When it is
+played, affine and style-only chains are applied directly to stacked point
+and rgba arrays, so no mobject is copied. Any other chain falls back to the
+regular ``mob.animate`` path with the same calls.
+"""
+
+import numpy as np
+from manim import OUT, ManimColor, Mobject, ValueTracker, VMobject, rotation_matrix
+
+from .animations import BatchedAnimation
+
+AFFINE_METHODS = {"shift", "scale", "rotate", "move_to", "set_value"}
+STYLE_METHODS = {"set_fill", "set_stroke", "set_color", "set_opacity"}
+ALLOWED_KWARGS = {
+    "shift": set(),
+    "scale": {"about_point", "about_edge"},
+    "rotate": {"axis", "about_point"},
+    "move_to": set(),
+    "set_value": set(),
+    "set_fill": {"color", "opacity"},
+    "set_stroke": {"color", "width", "opacity"},
+    "set_color": {"color"},
+    "set_opacity": {"opacity"},
+}
+
+
+def _critical_point(points, direction):
+    lower = points.min(axis=0)
+    upper = points.max(axis=0)
+    direction = np.sign(direction)
+    return np.where(direction > 0, upper, np.where(direction < 0, lower, (lower + upper) / 2))
+
+
+def _about_point(points, kwargs):
+    if kwargs.get("about_point") is not None:
+        return np.asarray(kwargs["about_point"], dtype=float)
+    edge = kwargs.get("about_edge")
+    return _critical_point(points, np.zeros(3) if edge is None else np.asarray(edge))
+
+
+def _is_single_color(color):
+    return color is None or not isinstance(color, (list, tuple))
+
+
+class LazyAnimate(BatchedAnimation):
+    """Animation built from a recorded chain of mobject method calls."""
+
+    def __init__(self, mobject, **kwargs):
+        self.calls = []
+        self._fallback = None
+        self._widths = None
+        super().__init__(mobject, **kwargs)
+
+    def _record(self, name, args, kwargs):
+        self.calls.append((name, args, kwargs))
+        return self
+
+    def shift(self, *vectors):
+        return self._record("shift", vectors, {})
+
+    def scale(self, scale_factor, **kwargs):
+        return self._record("scale", (scale_factor,), kwargs)
+
+    def rotate(self, angle, axis=OUT, **kwargs):
+        return self._record("rotate", (angle,), {"axis": axis, **kwargs})
+
+    def move_to(self, point_or_mobject, **kwargs):
+        return self._record("move_to", (point_or_mobject,), kwargs)
+
+    def set_value(self, value):
+        return self._record("set_value", (value,), {})
+
+    def set_fill(self, color=None, opacity=None, **kwargs):
+        return self._record("set_fill", (), {"color": color, "opacity": opacity, **kwargs})
+
+    def set_stroke(self, color=None, width=None, opacity=None, **kwargs):
+        return self._record(
+            "set_stroke", (), {"color": color, "width": width, "opacity": opacity, **kwargs}
+        )
+
+    def set_color(self, color, **kwargs):
+        return self._record("set_color", (), {"color": color, **kwargs})
+
+    def set_opacity(self, opacity, **kwargs):
+        return self._record("set_opacity", (), {"opacity": opacity, **kwargs})
+
+    def _is_vectorizable(self):
+        family = self.mobject.get_family()
+        for name, _, kwargs in self.calls:
+            if set(kwargs) - ALLOWED_KWARGS[name]:
+                return False
+            if not _is_single_color(kwargs.get("color")):
+                return False
+            if name == "set_value":
+                if type(self.mobject) is not ValueTracker:
+                    return False
+                continue
+            if name == "move_to" and kwargs:
+                return False
+            for sub in family:
+                base = VMobject if isinstance(sub, VMobject) else Mobject
+                # Subclasses such as Arrow or DecimalNumber override these
+                # methods with extra behaviour the array path cannot mimic.
+                if getattr(type(sub), name) is not getattr(base, name):
+                    return False
+        return True
+
+    def begin(self):
+        if not self._is_vectorizable():
+            builder = self.mobject.animate
+            for name, args, kwargs in self.calls:
+                builder = getattr(builder, name)(*args, **kwargs)
+            self._fallback = builder.build()
+            self._fallback.run_time = self.run_time
+            self._fallback.rate_func = self.rate_func
+            self._fallback.begin()
+            return
+        super().begin()
+
+    def _build_channels(self):
+        names = {name for name, _, _ in self.calls}
+        points = fill = stroke = None
+        if names & AFFINE_METHODS:
+            points, _ = self._bind_points()
+            points_end = points.copy()
+        if self._style_subs and names & STYLE_METHODS:
+            fill, _ = self._bind_rgbas("fill_rgbas")
+            fill_end = fill.copy()
+            stroke, _ = self._bind_rgbas("stroke_rgbas")
+            stroke_end = stroke.copy()
+            widths = np.array([sub.get_stroke_width() for sub in self._style_subs], dtype=float)
+            widths_end = widths.copy()
+
+        for name, args, kwargs in self.calls:
+            if name == "shift":
+                points_end += np.sum(args, axis=0)
+            elif name == "scale":
+                about = _about_point(points_end, kwargs)
+                points_end[:] = about + args[0] * (points_end - about)
+            elif name == "rotate":
+                about = _about_point(points_end, kwargs)
+                matrix = rotation_matrix(args[0], kwargs.get("axis", OUT))
+                points_end[:] = (points_end - about) @ matrix.T + about
+            elif name == "move_to":
+                target = args[0]
+                if isinstance(target, Mobject):
+                    target = target.get_center()
+                points_end += np.asarray(target, dtype=float) - _critical_point(points_end, np.zeros(3))
+            elif name == "set_value":
+                points_end[0, 0] = args[0]
+            elif fill is None:
+                # Style call on a mobject without VMobject members: nothing to do.
+                continue
+            else:
+                color = kwargs.get("color")
+                opacity = kwargs.get("opacity")
+                rgb = None if color is None else ManimColor(color).to_rgb()
+                targets = {
+                    "set_fill": (fill_end,),
+                    "set_stroke": (stroke_end,),
+                    "set_color": (fill_end, stroke_end),
+                    "set_opacity": (fill_end, stroke_end),
+                }[name]
+                for end in targets:
+                    if rgb is not None:
+                        end[:, :3] = rgb
+                    if opacity is not None:
+                        end[:, 3] = opacity
+                if name == "set_stroke" and kwargs.get("width") is not None:
+                    widths_end[:] = kwargs["width"]
+
+        if points is not None:
+            self._add_channel("points", self._point_subs, points, points_end)
+        if fill is not None:
+            self._add_channel("fill_rgbas", self._style_subs, fill, fill_end)
+            self._add_channel("stroke_rgbas", self._style_subs, stroke, stroke_end)
+            if not np.array_equal(widths, widths_end):
+                self._widths = (widths, widths_end - widths)
+
+    def interpolate(self, alpha):
+        if self._fallback is not None:
+            self._fallback.interpolate(alpha)
+            return
+        super().interpolate(alpha)
+        if self._widths is not None:
+            # Stroke width is a scalar attribute per submobject, so this one
+            # channel is a Python loop; the chains used here touch few of them.
+            start, delta = self._widths
+            values = start + self.rate_func(alpha) * delta
+            for sub, width in zip(self._style_subs, values):
+                sub.stroke_width = width
+
+    def update_mobjects(self, dt):
+        if self._fallback is not None:
+            self._fallback.update_mobjects(dt)
+            return
+        super().update_mobjects(dt)
+
+    def finish(self):
+        if self._fallback is not None:
+            self._fallback.finish()
+            return
+        super().finish()
+        # Keep scalar style attributes (fill_opacity, stroke_width, ...) in
+        # sync with the arrays. These calls are idempotent on the end state.
+        for name, args, kwargs in self.calls:
+            if name in STYLE_METHODS:
+                getattr(self.mobject, name)(*args, **kwargs)
+
+    def clean_up_from_scene(self, scene):
+        if self._fallback is not None:
+            self._fallback.clean_up_from_scene(scene)
+            return
+        super().clean_up_from_scene(scene)
+
+
+def lazy(mobject, **kwargs):
+    """Start a lazily-built ``.animate`` chain: ``lazy(mob).scale(2).set_color(RED)``.
+
+    Keyword arguments are animation arguments, as in ``mob.animate(run_time=2)``.
+    """
+    return LazyAnimate(mobject, **kwargs)
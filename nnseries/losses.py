@@ -0,0 +1,154 @@
+"""Loss functions over whole batches, with their gradients.
+
+The episode 05 scenes computed errors with list comprehensions over
+``(predicted, actual)`` tuples and typed the MSE and cross-entropy results
+in as literals. Each loss here works on NumPy arrays of any batch size:
+
+* ``loss(predictions, targets)`` is the mean loss over the batch (a float);
+* ``loss.per_sample(...)`` is the loss of each sample;
+* ``loss.contributions(...)`` is each sample's share of the mean, summing to
+  ``loss(...)``, ready to bind to bar heights;
+* ``loss.gradient(...)`` is d(mean loss)/d(predictions), the same shape as
+  ``predictions``.
+
+Regression losses take predictions and targets of the same shape; extra
+trailing axes are averaged per sample. ``binary_cross_entropy`` takes the
+probability of class 1 and 0/1 targets; ``categorical_cross_entropy`` takes
+``(n, classes)`` probabilities and either class indices or one-hot rows.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+EPSILON = 1e-12
+
+
+def _arrays(predictions, targets):
+    predictions = np.asarray(predictions, dtype=float)
+    targets = np.broadcast_to(np.asarray(targets, dtype=float), predictions.shape)
+    return predictions, targets
+
+
+def _per_sample_mean(values):
+    values = np.atleast_1d(values)
+    return values.reshape(len(values), -1).mean(axis=1)
+
+
+class Loss(ABC):
+    """Base class: subclasses implement ``per_sample`` and ``gradient``."""
+
+    name = ""
+
+    @abstractmethod
+    def per_sample(self, predictions, targets):
+        """Loss of each sample, shape ``(n,)``."""
+
+    @abstractmethod
+    def gradient(self, predictions, targets):
+        """d(mean loss)/d(predictions), shaped like ``predictions``."""
+
+    def __call__(self, predictions, targets):
+        return float(np.mean(self.per_sample(predictions, targets)))
+
+    def contributions(self, predictions, targets):
+        losses = self.per_sample(predictions, targets)
+        return losses / len(losses)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class MeanSquaredError(Loss):
+    name = "MSE"
+
+    def per_sample(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        return _per_sample_mean((predictions - targets) ** 2)
+
+    def gradient(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        return 2 * (predictions - targets) / predictions.size
+
+
+class MeanAbsoluteError(Loss):
+    name = "MAE"
+
+    def per_sample(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        return _per_sample_mean(np.abs(predictions - targets))
+
+    def gradient(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        return np.sign(predictions - targets) / predictions.size
+
+
+class HuberLoss(Loss):
+    """Squared for errors up to ``delta``, linear beyond it."""
+
+    name = "Huber"
+
+    def __init__(self, delta=1.0):
+        self.delta = delta
+
+    def per_sample(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        error = np.abs(predictions - targets)
+        quadratic = np.minimum(error, self.delta)
+        return _per_sample_mean(0.5 * quadratic ** 2 + self.delta * (error - quadratic))
+
+    def gradient(self, predictions, targets):
+        predictions, targets = _arrays(predictions, targets)
+        return np.clip(predictions - targets, -self.delta, self.delta) / predictions.size
+
+
+class BinaryCrossEntropy(Loss):
+    name = "Binary cross-entropy"
+
+    def per_sample(self, predictions, targets):
+        p, y = _arrays(predictions, targets)
+        p = np.clip(p, EPSILON, 1 - EPSILON)
+        return _per_sample_mean(-(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+    def gradient(self, predictions, targets):
+        p, y = _arrays(predictions, targets)
+        p = np.clip(p, EPSILON, 1 - EPSILON)
+        return (p - y) / (p * (1 - p)) / p.size
+
+
+class CategoricalCrossEntropy(Loss):
+    name = "Cross-entropy"
+
+    @staticmethod
+    def _one_hot(probabilities, targets):
+        targets = np.asarray(targets)
+        if targets.ndim == 1 and len(probabilities) == 1 and targets.size == probabilities.shape[1] > 1:
+            # One sample's one-hot row, not one class index per sample.
+            targets = targets[None, :]
+        if targets.shape == probabilities.shape:
+            return targets.astype(float)
+        one_hot = np.zeros_like(probabilities)
+        one_hot[np.arange(len(probabilities)), targets.astype(int)] = 1.0
+        return one_hot
+
+    def _inputs(self, predictions, targets):
+        probabilities = np.atleast_2d(np.asarray(predictions, dtype=float))
+        one_hot = self._one_hot(probabilities, np.atleast_1d(targets))
+        return np.clip(probabilities, EPSILON, 1.0), one_hot
+
+    def per_sample(self, predictions, targets):
+        probabilities, one_hot = self._inputs(predictions, targets)
+        return -np.sum(one_hot * np.log(probabilities), axis=1)
+
+    def gradient(self, predictions, targets):
+        probabilities, one_hot = self._inputs(predictions, targets)
+        return (-one_hot / probabilities / len(probabilities)).reshape(np.shape(predictions))
+
+
+mse = MeanSquaredError()
+mae = MeanAbsoluteError()
+huber = HuberLoss()
+binary_cross_entropy = BinaryCrossEntropy()
+categorical_cross_entropy = CategoricalCrossEntropy()
+
+LOSSES = {loss.name: loss for loss in (mse, mae, huber, binary_cross_entropy, categorical_cross_entropy)}
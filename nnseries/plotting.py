@@ -0,0 +1,200 @@
+"""Batched coordinate transforms and plotting for ``Axes``.
+
+Scenes place points with ``axes.c2p(x, y)`` inside comprehensions, and
+``axes.plot`` calls the function and ``c2p`` once per sample and then smooths
+the curve with ``make_smooth``, which re-splits the path into subpaths with
+one ``np.allclose`` per Bézier segment. Both are Python loops over points.
+
+For linear axes ``c2p`` is an affine map, so three ``c2p`` calls give the
+whole transform and ``coords_to_points`` converts an ``(n, 2)`` array in one
+matrix product. ``plot`` evaluates a NumPy function on the whole sample
+array at once (falling back to one call per sample if the function only
+takes scalars, e.g. ``lambda x: max(0, x)``) and writes the smooth Bézier
+points of the single path directly:
+
+    dots = axes_dots(axes, coords, color=BLUE)
+    curve = plot(axes, lambda x: 1 / (1 + np.exp(-x)), x_range=[-6, 6])
+
+``plot`` returns a ``ParametricFunction`` like ``axes.plot`` does, with
+``underlying_function`` set, so ``axes.i2gp``, ``get_area`` and friends still
+work. Non-linear (e.g. logarithmic) axes and ``discontinuities=`` take
+manim's own per-sample path.
+
+Uniform samples spend as many points on a sigmoid's flat tails as on its
+steep middle and still cut the corner of a ReLU. ``plot(..., tolerance=t)``
+starts from a coarse grid and bisects only the intervals where the drawn
+path strays more than ``t`` scene units from the function (measured across
+the path at each interval's midpoint, for both the chord and the smoothed
+Bézier), so flat stretches keep a few long segments and kinks get short
+ones. ``adaptive_samples`` does the same for any ``x -> point`` map, e.g.
+a tabulated loss curve.
+"""
+
+import numpy as np
+from manim import Dot, ParametricFunction, VGroup, VMobject
+from manim.mobject.graphing.scale import LinearBase
+from manim.utils.bezier import get_smooth_cubic_bezier_handle_points
+
+
+def is_linear(axes):
+    return all(isinstance(axis.scaling, LinearBase) for axis in axes.get_axes())
+
+
+def axes_transform(axes):
+    """``(origin, basis)`` with ``axes.c2p(*c) == origin + c @ basis`` on
+    linear axes; ``basis`` has one row per axis."""
+    dimension = len(axes.get_axes())
+    origin = np.asarray(axes.c2p(*np.zeros(dimension)), dtype=float)
+    basis = np.array([np.asarray(axes.c2p(*unit), dtype=float) - origin for unit in np.eye(dimension)])
+    return origin, basis
+
+
+def coords_to_points(axes, coords):
+    """Scene points, shape ``(n, 3)``, for axis coordinates of shape
+    ``(n, k)`` with ``k`` up to the number of axes (missing ones are 0)."""
+    coords = np.atleast_2d(np.asarray(coords, dtype=float))
+    if not is_linear(axes):
+        return np.array([axes.c2p(*row) for row in coords], dtype=float).reshape(-1, 3)
+    origin, basis = axes_transform(axes)
+    return origin + coords @ basis[: coords.shape[1]]
+
+
+def axes_dots(axes, coords, **kwargs):
+    """``VGroup(*[Dot(axes.c2p(x, y), **kwargs) for x, y in coords])``, built
+    from one ``Dot`` and copies of it."""
+    template = Dot(**kwargs)
+    centre = template.get_center()
+    dots = VGroup()
+    for point in coords_to_points(axes, coords):
+        dot = template.copy()
+        dot.points = template.points + (point - centre)
+        dots.add(dot)
+    return dots
+
+
+PLOT_TOLERANCE = 0.004
+ADAPTIVE_START = 9
+ADAPTIVE_MAX_SAMPLES = 4097
+# Where each interval is checked, and the cubic Bézier weights there.
+PROBES = np.array([0.25, 0.5, 0.75])
+PROBE_WEIGHTS = np.stack([(1 - PROBES) ** 3, 3 * (1 - PROBES) ** 2 * PROBES, 3 * (1 - PROBES) * PROBES**2, PROBES**3], axis=1)
+
+
+def _across(direction, offset):
+    """Length of the part of ``offset`` perpendicular to ``direction``."""
+    length = np.linalg.norm(direction, axis=1)
+    cross = np.linalg.norm(np.cross(direction, offset), axis=1)
+    return np.where(length > 0, cross / np.where(length > 0, length, 1), np.linalg.norm(offset, axis=1))
+
+
+def adaptive_samples(
+    points_at,
+    x_min,
+    x_max,
+    tolerance=PLOT_TOLERANCE,
+    smooth=True,
+    start=ADAPTIVE_START,
+    min_width=None,
+):
+    """Sample positions ``xs`` and scene points ``points_at(xs)`` whose path
+    (smoothed, or straight segments) is within ``tolerance`` of the curve.
+
+    Intervals narrower than ``min_width`` are never split, which bounds the
+    work at jumps (default: the range over ``ADAPTIVE_MAX_SAMPLES``).
+    """
+    if min_width is None:
+        min_width = (x_max - x_min) / ADAPTIVE_MAX_SAMPLES
+    xs = np.linspace(x_min, x_max, start)
+    points = points_at(xs)
+    while len(xs) < ADAPTIVE_MAX_SAMPLES:
+        path = bezier_path(points, smooth=smooth).reshape(-1, 1, 4, 3)
+        chords = path[:, 0, 3] - path[:, 0, 0]
+        probes = xs[:-1, None] + PROBES * (xs[1:] - xs[:-1])[:, None]
+        true = points_at(probes.ravel()).reshape(len(chords), len(PROBES), 3)
+        drawn = np.einsum("pk,nikd->npd", PROBE_WEIGHTS, path)
+        offsets = (true - drawn).reshape(-1, 3)
+        error = _across(np.repeat(chords, len(PROBES), axis=0), offsets).reshape(len(chords), -1).max(axis=1)
+        split = (error > tolerance) & (xs[1:] - xs[:-1] > min_width)
+        if not split.any():
+            break
+        at = np.flatnonzero(split) + 1
+        xs = np.insert(xs, at, probes[split, len(PROBES) // 2])
+        points = np.insert(points, at, true[split, len(PROBES) // 2], axis=0)
+    return xs, points
+
+
+def evaluate(function, xs):
+    """``function`` on every entry of ``xs``, in one call if it takes arrays."""
+    try:
+        with np.errstate(all="ignore"):
+            ys = np.asarray(function(xs), dtype=float)
+        return np.broadcast_to(ys, xs.shape).copy()
+    except (TypeError, ValueError):
+        return np.array([function(x) for x in xs], dtype=float)
+
+
+def bezier_path(anchors, smooth=True):
+    """Cubic Bézier points of one open path through ``anchors``: smoothed the
+    way ``make_smooth`` does it, or straight segments."""
+    anchors = np.asarray(anchors, dtype=float)
+    start, end = anchors[:-1], anchors[1:]
+    if smooth and len(anchors) > 2:
+        first, second = get_smooth_cubic_bezier_handle_points(anchors)
+    else:
+        first, second = start + (end - start) / 3, start + 2 * (end - start) / 3
+    return np.stack([start, first, second, end], axis=1).reshape(-1, 3)
+
+
+def smooth_curve(anchors, **kwargs):
+    """``VMobject(**kwargs).set_points_smoothly(anchors)`` without the
+    per-segment subpath split."""
+    curve = VMobject(**kwargs)
+    curve.points = bezier_path(anchors)
+    return curve
+
+
+class SampledGraph(ParametricFunction):
+    """``axes.plot`` graph whose samples are computed as one array."""
+
+    def __init__(self, axes, function, x_range=None, tolerance=None, **kwargs):
+        t_range = np.array(axes.x_range, dtype=float)
+        if x_range is not None:
+            t_range[: len(x_range)] = x_range
+        if x_range is None or len(x_range) < 3:
+            t_range[2] /= axes.num_sampled_graph_points_per_tick
+        self.axes = axes
+        self.underlying_function = function
+        self.tolerance = tolerance
+        super().__init__(
+            lambda t: axes.c2p(t, function(t)),
+            t_range=t_range,
+            scaling=axes.x_axis.scaling,
+            **kwargs,
+        )
+
+    def sample_xs(self):
+        return np.append(np.arange(self.t_min, self.t_max, self.t_step), self.t_max)
+
+    def generate_points(self):
+        if self.discontinuities is not None or not is_linear(self.axes):
+            return super().generate_points()
+        if self.tolerance is None:
+            xs = self.sample_xs()
+            anchors = self.points_at(xs)
+        else:
+            xs, anchors = adaptive_samples(
+                self.points_at, self.t_min, self.t_max, self.tolerance, smooth=self.use_smoothing
+            )
+        self.samples = xs
+        self.points = bezier_path(anchors, smooth=self.use_smoothing)
+        return self
+
+    def points_at(self, xs):
+        ys = evaluate(self.underlying_function, xs)
+        return coords_to_points(self.axes, np.column_stack([xs, ys]))
+
+
+def plot(axes, function, x_range=None, tolerance=None, **kwargs):
+    """``axes.plot(function, x_range, **kwargs)`` with batched sampling;
+    ``tolerance`` (scene units) switches to adaptive sampling."""
+    return SampledGraph(axes, function, x_range=x_range, tolerance=tolerance, **kwargs)
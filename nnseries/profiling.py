@@ -0,0 +1,99 @@
+"""Per-``play`` memory report for long scenes.
+
+Scenes such as ``LossFunctionBehavior`` or ``GolfAnalogy`` keep adding
+mobjects across sections and rarely remove them, so later frames keep
+processing objects that are no longer visible. ``MemoryProfileMixin`` logs,
+after every ``play``/``wait``:
+
+* the number of live mobjects in the scene (whole families),
+* the bytes held by their point arrays,
+* how many of them are fully transparent but still in the scene,
+* how many mobjects that call added,
+
+and warns at the end of the scene if the mobject count never went down.
+
+Profiling is off by default. Enable it with ``NNSERIES_MEMORY_PROFILE=1`` in
+the environment or ``memory_profile = True`` on the scene class. Set
+``NNSERIES_MEMORY_PROFILE=trace`` to also record Python allocations per call
+with ``tracemalloc``.
+"""
+
+import json
+import os
+import tracemalloc
+
+from manim import VMobject, logger
+
+PROFILE_ENV = "NNSERIES_MEMORY_PROFILE"
+
+
+def is_invisible(mobject):
+    if not isinstance(mobject, VMobject):
+        return False
+    return (
+        not mobject.get_fill_rgbas()[:, 3].any()
+        and not mobject.get_stroke_rgbas()[:, 3].any()
+        and not mobject.get_stroke_rgbas(background=True)[:, 3].any()
+    )
+
+
+def snapshot(scene):
+    """Return (ids of live mobjects, point bytes, invisible count) for ``scene``."""
+    family = scene.get_mobject_family_members()
+    ids = {id(mob) for mob in family}
+    point_bytes = sum(mob.points.nbytes for mob in family)
+    invisible = sum(1 for mob in family if len(mob.points) and is_invisible(mob))
+    return ids, point_bytes, invisible
+
+
+class MemoryProfileMixin:
+    memory_profile = False
+
+    def __init__(self, *args, **kwargs):
+        mode = os.environ.get(PROFILE_ENV, "")
+        self.memory_profile = self.memory_profile or mode not in ("", "0")
+        self.memory_trace = mode == "trace"
+        self.memory_log = []
+        super().__init__(*args, **kwargs)
+
+    def play(self, *args, **kwargs):
+        if not self.memory_profile:
+            return super().play(*args, **kwargs)
+
+        before, _, _ = snapshot(self)
+        if self.memory_trace:
+            tracemalloc.start()
+        super().play(*args, **kwargs)
+        record = {"play": len(self.memory_log)}
+        if self.memory_trace:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            record["allocated_kib"] = round(current / 1024, 1)
+            record["peak_kib"] = round(peak / 1024, 1)
+
+        after, point_bytes, invisible = snapshot(self)
+        record.update(
+            mobjects=len(after),
+            point_kib=round(point_bytes / 1024, 1),
+            invisible=invisible,
+            created=len(after - before),
+        )
+        self.memory_log.append(record)
+        logger.info("memory %s", json.dumps(record))
+
+    def tear_down(self):
+        super().tear_down()
+        if not self.memory_profile or len(self.memory_log) < 3:
+            return
+        counts = [record["mobjects"] for record in self.memory_log]
+        only_grows = all(b >= a for a, b in zip(counts, counts[1:]))
+        if only_grows and counts[-1] > counts[0]:
+            logger.warning(
+                "%s: mobject count only grows (%d -> %d over %d plays); "
+                "%d mobjects are invisible at the end",
+                type(self).__name__,
+                counts[0],
+                counts[-1],
+                len(counts),
+                self.memory_log[-1]["invisible"],
+            )
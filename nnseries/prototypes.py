@@ -0,0 +1,62 @@
+"""Build icon helpers once and hand out cheap instances.
+
+Helpers such as ``create_small_house``, ``create_gauge`` or
+``create_loss_bar`` rebuild their polygons, arcs and ``Text`` labels on
+every call, even when called ten times in a row with the same arguments.
+Decorating one with ``@prototype`` builds the mobject the first time a given
+set of arguments is seen and keeps it as a prototype. Every call, including
+the first, returns a ``shared_copy`` of it: the instance shares the
+prototype's point buffers copy-on-write (see ``nnseries.cow``), so placing
+many instances costs one build plus one cheap copy and transform each.
+
+Prototypes are kept per object (``self.prototype_pool``, one per scene
+instance), so a helper that also reads ``self`` (colours, ``self.rng``)
+never hands one scene, or one instance, a mobject built for another.
+Arguments must be hashable. Calls with unhashable arguments build a fresh
+mobject, as before.
+"""
+
+import functools
+
+from .cow import shared_copy
+
+
+class PrototypePool:
+    """Prototype mobjects keyed by ``(helper, args, kwargs)``."""
+
+    def __init__(self):
+        self.prototypes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def instance(self, key, build):
+        """Shared copy of the prototype for ``key``, calling ``build()`` to
+        make it the first time."""
+        try:
+            hash(key)
+        except TypeError:
+            return build()
+        if key in self.prototypes:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.prototypes[key] = build()
+        return shared_copy(self.prototypes[key])
+
+    def clear(self):
+        self.prototypes.clear()
+
+
+def prototype(method):
+    """Decorator for scene helper methods whose result depends only on their
+    arguments and on state of ``self`` that does not change while it runs."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        pool = self.__dict__.get("prototype_pool")
+        if pool is None:
+            pool = self.prototype_pool = PrototypePool()
+        key = (method, args, tuple(sorted(kwargs.items())))
+        return pool.instance(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
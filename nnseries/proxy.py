@@ -0,0 +1,64 @@
+"""Proxy (preview) renders with decimated geometry.
+
+``-ql`` lowers the output resolution and frame rate, but every ``Surface``
+still has its full mesh, every curve its full sample count and every data
+cloud all of its dots, so the Python side of a preview costs as much as a
+final render. Scenes opt in by routing those counts through the helpers
+below; ``NNSERIES_PROXY`` then scales all of them at once::
+
+    NNSERIES_PROXY=4 manim -pql main.py NonLinear3D
+
+A level of ``N`` keeps roughly ``1/N`` of the curve samples, dots and mesh
+faces per axis (so surfaces shrink by about ``N**2``). Unset, ``0`` or ``1``
+means full quality; the helpers then return their input unchanged. Text is
+left alone: ``Text`` is already rendered once per string and cached by
+manimpango, so it is not where preview time goes.
+"""
+
+import math
+import os
+
+PROXY_ENV = "NNSERIES_PROXY"
+
+
+def proxy_level():
+    """Current decimation level (1.0 when proxy mode is off)."""
+    value = os.environ.get(PROXY_ENV, "")
+    try:
+        level = float(value) if value else 1.0
+    except ValueError:
+        raise ValueError(f"{PROXY_ENV} must be a number, got {value!r}") from None
+    return max(level, 1.0)
+
+
+def is_proxy():
+    return proxy_level() > 1
+
+
+def samples(count, minimum=8):
+    """Number of samples to use for a curve drawn with ``count`` samples."""
+    level = proxy_level()
+    if level == 1:
+        return count
+    return max(min(minimum, count), math.ceil(count / level))
+
+
+def resolution(value, minimum=4):
+    """Decimate a ``Surface``/``Sphere`` resolution (an int or a pair)."""
+    if isinstance(value, (tuple, list)):
+        return tuple(samples(v, minimum) for v in value)
+    return samples(value, minimum)
+
+
+def subsample(items, minimum=3):
+    """Keep an evenly spaced subset of ``items`` (dots, data points, ...).
+
+    Items are dropped after they are generated, so seeded random layouts
+    keep the same positions for the dots that remain.
+    """
+    level = proxy_level()
+    if level == 1 or len(items) <= minimum:
+        return items
+    keep = max(minimum, math.ceil(len(items) / level))
+    step = len(items) / keep
+    return [items[int(i * step)] for i in range(keep)]
@@ -0,0 +1,99 @@
+"""Drop fully transparent mobjects from the render list between plays.
+
+Mobjects faded to zero opacity with ``.animate.set_opacity(0)`` (or kept
+around after fading for later reuse) stay in ``self.mobjects`` and the
+camera still walks their families every frame. With
+``PruneInvisibleMixin`` the scene checks its top-level mobjects after each
+``play`` and removes those whose whole family has zero fill and stroke
+opacity and no updaters. A ``PrunedMobject`` handle remembers where each
+one sat in the draw order. A pruned mobject goes back into that slot when
+it is animated again (e.g. faded back in), and also whenever it is found
+visible again (or given an updater): before every ``play``/``wait``, which
+catches a direct ``set_opacity``/``set_fill``, and after the scene's
+updaters run on each frame, which catches one revealed by another
+mobject's updater.
+"""
+
+from dataclasses import dataclass
+
+from manim import Mobject
+
+from .profiling import is_invisible
+
+
+@dataclass
+class PrunedMobject:
+    mobject: Mobject
+    index: int
+
+
+def _animated_mobjects(args):
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            yield from _animated_mobjects(arg)
+        elif getattr(arg, "mobject", None) is not None:
+            yield arg.mobject
+
+
+class PruneInvisibleMixin:
+    def __init__(self, *args, **kwargs):
+        self.pruned = {}
+        super().__init__(*args, **kwargs)
+
+    def add(self, *mobjects):
+        for mob in mobjects:
+            self.pruned.pop(id(mob), None)
+        return super().add(*mobjects)
+
+    def play(self, *args, **kwargs):
+        if self.pruned:
+            self.restore_pruned(*_animated_mobjects(args))
+            self.restore_visible()
+        super().play(*args, **kwargs)
+        self.prune_invisible()
+
+    def update_mobjects(self, dt):
+        super().update_mobjects(dt)
+        if self.pruned:
+            self.restore_visible()
+
+    def is_prunable(self, mobject):
+        if mobject in self.foreground_mobjects:
+            return False
+        family = mobject.get_family()
+        if any(mob.updaters for mob in family):
+            return False
+        drawn = [mob for mob in family if len(mob.points)]
+        return bool(drawn) and all(is_invisible(mob) for mob in drawn)
+
+    def prune_invisible(self):
+        """Remove invisible top-level mobjects; returns how many were pruned."""
+        pruned = [
+            (index, mob)
+            for index, mob in enumerate(self.mobjects)
+            if self.is_prunable(mob)
+        ]
+        for index, mob in pruned:
+            self.pruned[id(mob)] = PrunedMobject(mob, index)
+        if pruned:
+            self.remove(*[mob for _, mob in pruned])
+        return len(pruned)
+
+    def restore_visible(self):
+        """Put back pruned mobjects that are no longer prunable."""
+        visible = [handle.mobject for handle in self.pruned.values() if not self.is_prunable(handle.mobject)]
+        if visible:
+            self.restore_pruned(*visible)
+
+    def restore_pruned(self, *mobjects):
+        """Put pruned mobjects (or pruned members of their families) back."""
+        handles = {}
+        for mobject in mobjects:
+            for mob in mobject.get_family():
+                handle = self.pruned.get(id(mob))
+                if handle is not None:
+                    handles[id(handle.mobject)] = handle
+        for handle in sorted(handles.values(), key=lambda h: h.index):
+            self.add(handle.mobject)
+            self.mobjects.remove(handle.mobject)
+            self.mobjects.insert(min(handle.index, len(self.mobjects)), handle.mobject)
@@ -0,0 +1,189 @@
+"""Scene-level index of mobjects by tag, type and role.
+
+Scenes used to find things again by scanning ``self.mobjects``, e.g.
+``[mob for mob in self.mobjects if isinstance(mob, Text) and mob.text == ...]``.
+``TaggedSceneMixin`` keeps an index that is updated on every ``add`` /
+``remove`` so those lookups become dictionary hits, and nested submobjects
+are found as well as top-level ones.
+"""
+
+from manim import Mobject
+
+from .animations import BatchedFadeOut
+
+TAGS_ATTR = "_nnseries_tags"
+ROLE_ATTR = "_nnseries_role"
+
+
+def tag(mobject, *tags, role=None):
+    """Attach tags (and optionally a role) to a mobject and return it.
+
+    Tags live on the mobject itself, so a mobject can be tagged before it is
+    added to any scene and keeps its tags when copied.
+    """
+    current = getattr(mobject, TAGS_ATTR, frozenset())
+    setattr(mobject, TAGS_ATTR, current | frozenset(tags))
+    if role is not None:
+        setattr(mobject, ROLE_ATTR, role)
+    return mobject
+
+
+def get_tags(mobject):
+    return getattr(mobject, TAGS_ATTR, frozenset())
+
+
+def get_role(mobject):
+    return getattr(mobject, ROLE_ATTR, None)
+
+
+class MobjectRegistry:
+    """Maps ("tag", name), ("role", name) and ("type", cls) keys to mobjects.
+
+    Each bucket is an insertion-ordered dict keyed by ``id(mobject)`` so
+    registering, unregistering and looking up are all O(1) per mobject.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._keys_by_id = {}
+
+    def __len__(self):
+        return len(self._keys_by_id)
+
+    def __contains__(self, mobject):
+        return id(mobject) in self._keys_by_id
+
+    def _keys_for(self, mobject):
+        keys = [("tag", name) for name in get_tags(mobject)]
+        role = get_role(mobject)
+        if role is not None:
+            keys.append(("role", role))
+        for cls in type(mobject).__mro__:
+            keys.append(("type", cls))
+            if cls is Mobject:
+                break
+        return keys
+
+    def _register_one(self, mobject):
+        key_id = id(mobject)
+        if key_id in self._keys_by_id:
+            return
+        keys = self._keys_for(mobject)
+        self._keys_by_id[key_id] = keys
+        for key in keys:
+            self._buckets.setdefault(key, {})[key_id] = mobject
+
+    def _unregister_one(self, mobject):
+        keys = self._keys_by_id.pop(id(mobject), ())
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(id(mobject), None)
+            if not bucket:
+                del self._buckets[key]
+
+    def register(self, mobject):
+        """Index ``mobject`` and every member of its family."""
+        for mob in mobject.get_family():
+            self._register_one(mob)
+
+    def unregister(self, mobject):
+        for mob in mobject.get_family():
+            self._unregister_one(mob)
+
+    def reindex(self, mobject):
+        """Refresh the keys of a single mobject after its tags changed."""
+        if mobject in self:
+            self._unregister_one(mobject)
+            self._register_one(mobject)
+
+    def clear(self):
+        self._buckets.clear()
+        self._keys_by_id.clear()
+
+    def _lookup(self, key):
+        return list(self._buckets.get(key, {}).values())
+
+    def tagged(self, name):
+        return self._lookup(("tag", name))
+
+    def with_role(self, name):
+        return self._lookup(("role", name))
+
+    def of_type(self, cls):
+        return self._lookup(("type", cls))
+
+
+class TaggedSceneMixin:
+    """Mix into a ``Scene`` subclass to keep ``self.registry`` in sync.
+
+    Usage::
+
+        class ForwardPropagation(TaggedSceneMixin, Scene):
+            def construct(self):
+                label = tag(Text("Hidden Layer 1"), "layer_label")
+                ...
+                self.play(self.fade_out_tagged("layer_label"))
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.registry = MobjectRegistry()
+        super().__init__(*args, **kwargs)
+
+    def add(self, *mobjects):
+        super().add(*mobjects)
+        for mob in mobjects:
+            self.registry.register(mob)
+        return self
+
+    def remove(self, *mobjects):
+        super().remove(*mobjects)
+        for mob in mobjects:
+            self.registry.unregister(mob)
+        return self
+
+    def clear(self):
+        super().clear()
+        self.registry.clear()
+        return self
+
+    def tag(self, mobject, *tags, role=None):
+        tag(mobject, *tags, role=role)
+        self.registry.reindex(mobject)
+        return mobject
+
+    def tagged(self, name):
+        return self.registry.tagged(name)
+
+    def with_role(self, name):
+        return self.registry.with_role(name)
+
+    def of_type(self, cls):
+        return self.registry.of_type(cls)
+
+    def fade_out_tagged(self, *names, **kwargs):
+        """One batched fade-out over everything carrying any of ``names``."""
+        mobjects = {}
+        for name in names:
+            for mob in self.registry.tagged(name):
+                mobjects[id(mob)] = mob
+        # Drop members whose ancestor is already being faded out, otherwise
+        # the same points would be interpolated twice.
+        nested = {
+            id(sub)
+            for mob in mobjects.values()
+            for sub in mob.get_family()[1:]
+        }
+        targets = [mob for key, mob in mobjects.items() if key not in nested]
+        if not targets:
+            raise ValueError(f"No mobjects in the scene are tagged {names}")
+        return BatchedFadeOut(*targets, **kwargs)
+
+    def fade_out_all(self, *keep, **kwargs):
+        """One batched fade-out over every top-level mobject except ``keep``."""
+        keep_ids = {id(mob) for mob in keep}
+        return BatchedFadeOut(
+            *[mob for mob in self.mobjects if id(mob) not in keep_ids],
+            **kwargs,
+        )
@@ -0,0 +1,199 @@
+"""Retime scenes to a voice-over cue sheet.
+
+Holds such as ``self.wait(5)`` are tuned by hand to the narration, so every
+re-record meant editing waits and re-rendering. A cue sheet gives, per
+scene, the time at which some of its ``play``/``wait`` calls (numbered as
+in the dry-run timeline, see ``nnseries.timeline``) should start::
+
+    {"GradientDescentWeights": {"cues": [[3, 4.2], [9, 15.0]], "end": 31.5}}
+
+or, as CSV, ``scene,event,start`` rows (``end`` as the event for the end
+of the scene). Between two cues the waits are stretched or shrunk to make
+up the difference; if that would squeeze them below ``MIN_WAIT_FACTOR`` of
+their length, every run_time in that stretch is scaled instead. Calls after
+the last cue keep their timing.
+
+``python -m nnseries retime cues.json <episode main.py>...`` dry-runs the
+scenes, writes ``<Scene>.timing.json`` (the per-call factors) into the
+output directory, and lists the scenes whose timing changed since the last
+run; ``--render`` re-renders just those. Scenes apply the factors when they
+include ``RetimeMixin`` and ``NNSERIES_RETIME`` points at that directory.
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from manim import Wait, logger
+
+from .timeline import dry_run, load_scenes, working_directory
+
+RETIME_ENV = "NNSERIES_RETIME"
+MIN_WAIT_FACTOR = 0.1
+
+
+def load_cue_sheet(path):
+    """Return ``{scene: {"cues": [(event, start), ...], "end": float | None}}``."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        sheet = {}
+        with path.open(newline="") as handle:
+            for row in csv.DictReader(handle):
+                entry = sheet.setdefault(row["scene"], {"cues": [], "end": None})
+                if row["event"].strip() == "end":
+                    entry["end"] = float(row["start"])
+                else:
+                    entry["cues"].append((int(row["event"]), float(row["start"])))
+    else:
+        sheet = {
+            scene: {
+                "cues": [(int(event), float(start)) for event, start in entry.get("cues", [])],
+                "end": entry.get("end"),
+            }
+            for scene, entry in json.loads(path.read_text()).items()
+        }
+    for entry in sheet.values():
+        entry["cues"].sort()
+    return sheet
+
+
+def retime_factors(events, cues, end=None):
+    """Per-event duration factors that make ``events`` hit ``cues``.
+
+    ``events`` are timeline events (``kind`` and ``duration``); ``cues`` are
+    ``(event index, start time)`` pairs and ``end`` the optional scene end.
+    """
+    anchors = [(0, 0.0)]
+    for index, start in cues:
+        if index == 0:
+            if start:
+                raise ValueError("The first call always starts at 0; cue a later one")
+            continue
+        anchors.append((index, start))
+    if end is not None:
+        anchors.append((len(events), float(end)))
+
+    factors = {}
+    for (first, start), (last, stop) in zip(anchors, anchors[1:]):
+        if last > len(events):
+            raise ValueError(f"Cue for call {last}, but the scene only has {len(events)}")
+        segment = events[first:last]
+        target = stop - start
+        if target < 0:
+            raise ValueError(f"Cues for calls {first} and {last} are out of order")
+        total = sum(event["duration"] for event in segment)
+        waits = sum(event["duration"] for event in segment if event["kind"] == "wait")
+        if waits and (waits + target - total) / waits >= MIN_WAIT_FACTOR:
+            wait_factor = (waits + target - total) / waits
+            for offset, event in enumerate(segment):
+                if event["kind"] == "wait":
+                    factors[first + offset] = wait_factor
+        elif total:
+            for offset in range(len(segment)):
+                factors[first + offset] = target / total
+    return {index: round(factor, 6) for index, factor in factors.items() if round(factor, 6) != 1}
+
+
+class RetimeMixin:
+    """Scale each play/wait's run_time by its factor from the timing file.
+
+    ``retime_factors`` maps the index of a ``play``/``wait`` call to a
+    factor. When left as ``None`` it is read from
+    ``$NNSERIES_RETIME/<Scene>.timing.json``; without that file nothing
+    changes.
+    """
+
+    retime_factors = None
+
+    def __init__(self, *args, **kwargs):
+        if self.retime_factors is None:
+            self.retime_factors = read_factors(type(self).__name__)
+        self.retime_index = 0
+        super().__init__(*args, **kwargs)
+
+    def compile_animations(self, *args, **kwargs):
+        animations = super().compile_animations(*args, **kwargs)
+        factor = self.retime_factors.get(self.retime_index, 1)
+        self.retime_index += 1
+        if factor != 1:
+            for animation in animations:
+                animation.run_time *= factor
+                # A lone Wait's length comes from its own ``duration``, set
+                # from run_time once in Wait.__init__.
+                if isinstance(animation, Wait):
+                    animation.duration *= factor
+        return animations
+
+
+def read_factors(scene_name, directory=None):
+    directory = directory or os.environ.get(RETIME_ENV)
+    if not directory:
+        return {}
+    path = Path(directory) / f"{scene_name}.timing.json"
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {int(index): factor for index, factor in data["factors"].items()}
+
+
+def with_factors(scene_class, factors):
+    """``scene_class`` retimed by ``factors`` regardless of the environment."""
+    bases = (scene_class,) if issubclass(scene_class, RetimeMixin) else (RetimeMixin, scene_class)
+    return type(scene_class.__name__, bases, {
+        "__module__": scene_class.__module__,
+        "retime_factors": dict(factors),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nnseries retime", description=__doc__.splitlines()[0])
+    parser.add_argument("cues", help="cue sheet (.json or .csv)")
+    parser.add_argument("paths", nargs="+", help="episode main.py files")
+    parser.add_argument("-o", "--output", default="retime", help="directory for <Scene>.timing.json")
+    parser.add_argument("--render", action="store_true", help="re-render scenes whose timing changed")
+    parser.add_argument("--quality", default="-qh", help="manim quality flag for --render")
+    args = parser.parse_args(argv)
+
+    sheet = load_cue_sheet(args.cues)
+    output = Path(args.output).resolve()
+    output.mkdir(parents=True, exist_ok=True)
+    changed = []
+    for path in args.paths:
+        for scene_class in load_scenes(path):
+            name = scene_class.__name__
+            if name not in sheet:
+                continue
+            with working_directory(path):
+                original = dry_run(with_factors(scene_class, {}))
+                factors = retime_factors(original["events"], sheet[name]["cues"], sheet[name]["end"])
+                retimed = dry_run(with_factors(scene_class, factors))
+            timing = {
+                "scene": name,
+                "factors": {str(index): factor for index, factor in sorted(factors.items())},
+                "original_duration": original["duration"],
+                "duration": retimed["duration"],
+            }
+            target = output / f"{name}.timing.json"
+            previous = json.loads(target.read_text()) if target.exists() else {"factors": {}}
+            target.write_text(json.dumps(timing, indent=2))
+            status = "changed" if previous["factors"] != timing["factors"] else "unchanged"
+            print(f"{original['duration']:8.2f}s -> {retimed['duration']:8.2f}s  {status:9s}  {name}")
+            if status == "changed":
+                changed.append((path, name))
+
+    if args.render:
+        environment = dict(os.environ, **{RETIME_ENV: str(output)})
+        for path, name in changed:
+            logger.info("Re-rendering %s", name)
+            subprocess.run(
+                [sys.executable, "-m", "manim", args.quality, Path(path).name, name],
+                cwd=Path(path).resolve().parent,
+                env=environment,
+                check=True,
+            )
+    return 0
+
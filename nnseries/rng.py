@@ -0,0 +1,94 @@
+"""Per-scene random number generators.
+
+Scenes used ``np.random.seed(n)`` with ad hoc seeds, or no seed at all, so
+unseeded scenes drew different points on every render (defeating manim's
+partial-movie cache) and parallel renders were not reproducible.
+``SeededSceneMixin`` gives each scene ``self.rng``, a ``np.random.Generator``
+derived from the scene's class name and the series seed, and also seeds the
+global ``random``/``np.random`` state from it for code that still uses them.
+Change the series seed with ``NNSERIES_SEED`` to re-roll every scene at once.
+
+The samplers return ``(n, 3)`` point arrays, ready for ``Dot``/``Dot3D``.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+SEED_ENV = "NNSERIES_SEED"
+SERIES_SEED = 2025
+
+
+def series_seed():
+    return int(os.environ.get(SEED_ENV, SERIES_SEED))
+
+
+def scene_seed(name, stream=""):
+    """32-bit seed for ``name`` (and an optional sub-stream) under the series seed."""
+    digest = hashlib.sha256(f"{name}/{stream}".encode()).digest()
+    sequence = np.random.SeedSequence([series_seed(), int.from_bytes(digest[:8], "little")])
+    return int(sequence.generate_state(1)[0])
+
+
+def scene_rng(name, stream=""):
+    """Generator for ``name``; separate streams do not shift each other's draws."""
+    return np.random.default_rng(scene_seed(name, stream))
+
+
+def _points(xy, z=None):
+    points = np.zeros((len(xy), 3))
+    points[:, :2] = xy
+    if z is not None:
+        points[:, 2] = z
+    return points
+
+
+def ring(rng, n, radius, noise=0.0, center=(0, 0), angles=None):
+    """``n`` points around a circle, evenly spaced unless ``angles`` is given,
+    with Gaussian ``noise`` added to x and y."""
+    if angles is None:
+        angles = np.linspace(0, 2 * np.pi, n)
+    xy = radius * np.column_stack([np.cos(angles), np.sin(angles)])
+    xy += np.asarray(center, dtype=float)
+    if noise:
+        xy += noise * rng.standard_normal((n, 2))
+    return _points(xy)
+
+
+def cluster(rng, n, center=(0, 0), spread=1.0, dims=2):
+    """Gaussian blob; ``dims=3`` spreads it in z as well."""
+    offset = np.zeros(dims)
+    center = np.asarray(center, dtype=float)[:dims]
+    offset[:len(center)] = center
+    samples = offset + spread * rng.standard_normal((n, dims))
+    return _points(samples[:, :2], samples[:, 2] if dims == 3 else None)
+
+
+def disc(rng, n, radius, center=(0, 0)):
+    """Points uniformly distributed over a disc."""
+    r = radius * np.sqrt(rng.random(n))
+    theta = rng.uniform(0, 2 * np.pi, n)
+    xy = np.column_stack([r * np.cos(theta), r * np.sin(theta)])
+    return _points(xy + np.asarray(center, dtype=float))
+
+
+def box(rng, n, low, high):
+    """Points uniformly distributed over the rectangle ``low``..``high`` (x, y)."""
+    return _points(rng.uniform(low, high, (n, 2)))
+
+
+class SeededSceneMixin:
+    """Give the scene ``self.rng`` (and its seed, ``self.seed``) and seed the
+    global RNGs per scene."""
+
+    def __init__(self, *args, **kwargs):
+        name = type(self).__name__
+        kwargs.setdefault("random_seed", scene_seed(name, "global"))
+        self.seed = scene_seed(name)
+        self.rng = scene_rng(name)
+        super().__init__(*args, **kwargs)
+
+    def rng_stream(self, stream):
+        """Independent generator for one part of the scene."""
+        return scene_rng(type(self).__name__, stream)
@@ -0,0 +1,115 @@
+"""Storyboard contact sheets without rendering the video.
+
+Thumbnails and key-frame storyboards (e.g. the end of every ``play`` in
+``BackpropIntro`` or ``DeepLearningAbstraction``) used to come from scrubbing
+a full render. ``python -m nnseries storyboard`` runs each scene in dry-run
+mode (see ``nnseries.timeline``), rasterizes a single frame at the end of
+every ``play`` call, or only at the end of each section with
+``--sections``, and tiles them into ``<Scene>.storyboard.png``::
+
+    python -m nnseries storyboard "06. Backpropogation/Animation Code/NN/main.py" -s BackpropIntro
+    python -m nnseries storyboard */"Animation Code"/NN/main.py --width 320 --columns 6
+
+Frames are drawn at the thumbnail size, so a whole episode takes a small
+fraction of a render.
+"""
+
+import argparse
+from pathlib import Path
+
+from manim import logger
+from PIL import Image, ImageDraw
+
+from .timeline import TimelineMixin, run_dry, select_scenes, working_directory
+
+LABEL_HEIGHT = 18
+
+
+class StoryboardMixin(TimelineMixin):
+    """Keep one frame per ``play`` (or per section) in ``self.storyboard``.
+
+    Each entry is ``(label, PIL image)``.
+    """
+
+    storyboard_sections = False
+
+    def __init__(self, *args, **kwargs):
+        self.storyboard = []
+        super().__init__(*args, **kwargs)
+
+    def capture_storyboard_frame(self, label):
+        self.renderer.update_frame(self)
+        self.storyboard.append((label, self.renderer.camera.get_image()))
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        event = self.timeline[-1]
+        if not self.storyboard_sections and event["kind"] == "play":
+            end = event["start"] + event["duration"]
+            self.capture_storyboard_frame(f"#{event['index']}  {end:.1f}s")
+
+    def next_section(self, *args, **kwargs):
+        if self.storyboard_sections and self.timeline:
+            self.capture_storyboard_frame(self.timeline_sections[-1]["name"])
+        super().next_section(*args, **kwargs)
+
+    def tear_down(self):
+        if self.storyboard_sections:
+            self.capture_storyboard_frame(self.timeline_sections[-1]["name"])
+        super().tear_down()
+
+
+def contact_sheet(frames, columns=4):
+    """Tile ``(label, image)`` pairs into one labelled PNG-ready image."""
+    width, height = frames[0][1].size
+    rows = -(-len(frames) // columns)
+    sheet = Image.new("RGB", (columns * width, rows * (height + LABEL_HEIGHT)), "white")
+    draw = ImageDraw.Draw(sheet)
+    for index, (label, image) in enumerate(frames):
+        x = (index % columns) * width
+        y = (index // columns) * (height + LABEL_HEIGHT)
+        sheet.paste(image.convert("RGB"), (x, y))
+        draw.text((x + 4, y + height + 3), label, fill="black")
+    return sheet
+
+
+def storyboard(scene_class, width=480, sections=False):
+    """Dry-run ``scene_class`` and return its ``(label, image)`` frames."""
+    mixin = type("StoryboardMixin", (StoryboardMixin,), {"storyboard_sections": sections})
+    scene = run_dry(
+        scene_class,
+        mixin,
+        pixel_width=width,
+        pixel_height=round(width * 9 / 16),
+    )
+    return scene.storyboard
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nnseries storyboard", description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="episode main.py files")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="only these scenes (repeatable)")
+    parser.add_argument("-o", "--output", default="storyboards", help="output directory")
+    parser.add_argument("--sections", action="store_true", help="one frame per section instead of per play")
+    parser.add_argument("--width", type=int, default=480, help="thumbnail width in pixels")
+    parser.add_argument("--columns", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    for path, scene_class in select_scenes(args.paths, args.scene):
+        name = scene_class.__name__
+        try:
+            with working_directory(path):
+                frames = storyboard(scene_class, args.width, args.sections)
+        except Exception as error:
+            failed += 1
+            logger.error("%s (%s): %s", name, path, error)
+            continue
+        if not frames:
+            continue
+        target = output / f"{name}.storyboard.png"
+        contact_sheet(frames, args.columns).save(target)
+        print(f"{len(frames):4d} frames  {target}")
+    return 1 if failed else 0
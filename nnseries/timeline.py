@@ -0,0 +1,173 @@
+"""Dry-run timelines: every play/wait of a scene with its start and duration.
+
+Scenes are timed against the voice-over, and so far the only way to check
+a timing was to render the scene. ``python -m nnseries timeline`` runs each
+scene's ``construct`` with animations skipped (no frames are rasterized and
+nothing is encoded), records every ``play``/``wait`` and ``next_section``
+call, and writes one ``<Scene>.timeline.json`` per scene::
+
+    python -m nnseries timeline "04. Forward Propagation Making the First Guess/Animation Code/NN/main.py"
+    python -m nnseries timeline */"Animation Code"/NN/main.py -s GolfAnalogy -o timelines
+
+Each file looks like::
+
+    {"scene": "GolfAnalogy", "duration": 41.5,
+     "sections": [{"name": "unnamed", "start": 0.0}],
+     "events": [{"index": 0, "kind": "play", "start": 0.0, "duration": 1.0,
+                 "animations": ["Write(Text('Golf'))"]}, ...]}
+
+Scenes that use ``MathTex``/``Tex`` still need LaTeX, since the mobjects are
+built as usual.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+from manim import Scene, Wait, logger, tempconfig
+
+
+class TimelineMixin:
+    """Record every ``play``/``wait`` and section marker in ``self.timeline``.
+
+    With ``dry_run=True`` animations are skipped and no frame is drawn: the
+    static layer is left empty, frozen waits are not captured and
+    ``play_internal`` only advances the animations to their end state.
+    """
+
+    def __init__(self, *args, dry_run=False, **kwargs):
+        self.timeline = []
+        self.timeline_sections = [{"name": "unnamed", "start": 0.0}]
+        self.timeline_dry_run = dry_run
+        if dry_run:
+            kwargs["skip_animations"] = True
+        super().__init__(*args, **kwargs)
+        self.skip_animation_preview = self.skip_animation_preview or dry_run
+
+    def get_moving_and_static_mobjects(self, animations):
+        moving, static = super().get_moving_and_static_mobjects(animations)
+        if self.timeline_dry_run:
+            return moving, []
+        return moving, static
+
+    def is_current_animation_frozen_frame(self):
+        return not self.timeline_dry_run and super().is_current_animation_frozen_frame()
+
+    def play(self, *args, **kwargs):
+        start = self.renderer.time
+        super().play(*args, **kwargs)
+        animations = self.animations or []
+        kind = "wait" if animations and all(isinstance(a, Wait) for a in animations) else "play"
+        self.timeline.append({
+            "index": len(self.timeline),
+            "kind": kind,
+            "start": round(start, 4),
+            "duration": round(self.renderer.time - start, 4),
+            "section": self.timeline_sections[-1]["name"],
+            "animations": [str(animation) for animation in animations if kind == "play"],
+        })
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        self.timeline_sections.append({"name": name, "start": round(self.renderer.time, 4)})
+        super().next_section(name, *args, **kwargs)
+
+    def get_timeline(self):
+        return {
+            "scene": type(self).__name__,
+            "duration": round(self.renderer.time, 4),
+            "sections": self.timeline_sections,
+            "events": self.timeline,
+        }
+
+
+def load_scenes(path):
+    """Import an episode's ``main.py`` and return its Scene classes in file order."""
+    path = Path(path).resolve()
+    name = "nnseries_episode_" + str(abs(hash(str(path))))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, Scene)
+        and value.__module__ == name
+    ]
+
+
+def with_mixin(mixin, scene_class):
+    """``scene_class`` with ``mixin`` in front, keeping the scene's name."""
+    return type(scene_class.__name__, (mixin, scene_class), {"__module__": scene_class.__module__})
+
+
+def run_dry(scene_class, mixin=TimelineMixin, **options):
+    """Render ``scene_class`` with ``mixin`` in dry-run mode and return the scene.
+
+    ``options`` are extra config values (e.g. a smaller ``pixel_width``).
+    """
+    with tempconfig({
+        "dry_run": True,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        **options,
+    }):
+        scene = with_mixin(mixin, scene_class)(dry_run=True)
+        scene.render()
+    return scene
+
+
+def dry_run(scene_class):
+    """Run ``construct`` without rasterizing and return the timeline dict."""
+    return run_dry(scene_class).get_timeline()
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    """Run from the episode's NN folder, as ``manim`` would, so assets resolve."""
+    previous = os.getcwd()
+    os.chdir(Path(path).resolve().parent)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def select_scenes(paths, names):
+    """Yield ``(path, scene class)`` for the scenes in ``paths`` (all if ``names`` is empty)."""
+    for path in paths:
+        for scene_class in load_scenes(path):
+            if not names or scene_class.__name__ in names:
+                yield path, scene_class
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nnseries timeline", description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="episode main.py files")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="only these scenes (repeatable)")
+    parser.add_argument("-o", "--output", default="timelines", help="output directory")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    for path, scene_class in select_scenes(args.paths, args.scene):
+        try:
+            with working_directory(path):
+                timeline = dry_run(scene_class)
+        except Exception as error:
+            failed += 1
+            logger.error("%s (%s): %s", scene_class.__name__, path, error)
+            continue
+        timeline["source"] = str(path)
+        target = output / f"{scene_class.__name__}.timeline.json"
+        target.write_text(json.dumps(timeline, indent=2))
+        print(f"{timeline['duration']:8.2f}s  {len(timeline['events']):4d} events  {scene_class.__name__}")
+    return 1 if failed else 0
+
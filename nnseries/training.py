@@ -0,0 +1,125 @@
+"""A real (tiny) training run to drive the training-progress animations.
+
+``LossReductionTraining.show_training_progress`` used to plot a made-up
+``450 * exp(-0.03 x) + 10`` curve with hand-written price checkpoints.
+``TrainingSimulation`` instead runs gradient descent on a synthetic
+house-price dataset in a background thread and publishes one snapshot per
+step (step, loss, prediction for a query house) into a ``SnapshotRing``.
+The scene reads from the ring whenever a frame needs it, typically through
+a ``ValueTracker`` animated over the step range, so thousands of steps map
+onto however many seconds of video the ``play`` lasts, independent of the
+frame rate, and the training never waits on rendering.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from .losses import mse
+
+SNAPSHOT_FIELDS = ("step", "loss", "prediction")
+
+
+def house_prices(count=200, seed=0):
+    """Sizes in square feet and prices in $k: roughly ``50 + 0.125 * size``."""
+    rng = np.random.default_rng(seed)
+    sizes = rng.uniform(800, 3200, count)
+    prices = 50 + 0.125 * sizes + rng.normal(0, 15, count)
+    return sizes, prices
+
+
+class SnapshotRing:
+    """Fixed-size single-producer ring of snapshot rows.
+
+    The producer writes a row and only then bumps ``written``, so a reader
+    that checks ``written`` first never sees a half-written row; no lock is
+    needed with one writer. Rows older than ``capacity`` steps are
+    overwritten.
+    """
+
+    def __init__(self, capacity, fields=SNAPSHOT_FIELDS):
+        self.fields = fields
+        self.capacity = capacity
+        self.rows = np.zeros((capacity, len(fields)))
+        self.written = 0
+
+    def push(self, *values):
+        self.rows[self.written % self.capacity] = values
+        self.written += 1
+
+    def oldest(self):
+        return max(0, self.written - self.capacity)
+
+    def at(self, index):
+        """Row ``index`` (clamped to what is still held), or None if not written yet."""
+        written = self.written
+        if index >= written:
+            return None
+        index = max(index, written - self.capacity)
+        return self.rows[index % self.capacity].copy()
+
+    def history(self, stop=None):
+        """Rows from the oldest held one up to (not including) ``stop``, in order."""
+        written = self.written
+        stop = written if stop is None else min(stop, written)
+        indices = np.arange(max(0, written - self.capacity), stop)
+        return self.rows[indices % self.capacity]
+
+
+class TrainingSimulation:
+    """Linear regression of price on size, trained by full-batch gradient descent.
+
+    ``query`` is the house size whose predicted price each snapshot records.
+    The reported loss is the root mean squared error in $k.
+    """
+
+    def __init__(self, sizes=None, prices=None, query=2000, steps=1000, learning_rate=0.005, capacity=None):
+        if sizes is None:
+            sizes, prices = house_prices()
+        self.mean, self.std = sizes.mean(), sizes.std()
+        self.features = (sizes - self.mean) / self.std
+        self.targets = prices
+        self.query = (query - self.mean) / self.std
+        self.steps = steps
+        self.learning_rate = learning_rate
+        self.ring = SnapshotRing(capacity or steps + 1)
+        self._thread = None
+
+    def _run(self):
+        weight = bias = 0.0
+        x, y = self.features, self.targets
+        for step in range(self.steps + 1):
+            predictions = weight * x + bias
+            self.ring.push(step, np.sqrt(mse(predictions, y)), weight * self.query + bias)
+            gradient = mse.gradient(predictions, y)
+            weight -= self.learning_rate * np.sum(gradient * x)
+            bias -= self.learning_rate * np.sum(gradient)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self):
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def snapshot(self, step, timeout=10.0):
+        """Snapshot for ``step`` as a dict, waiting for the trainer if needed."""
+        step = int(round(step))
+        deadline = time.monotonic() + timeout
+        row = self.ring.at(step)
+        while row is None:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Training has not reached step {step}")
+            time.sleep(0.001)
+            row = self.ring.at(step)
+        return {field: float(value) for field, value in zip(self.ring.fields, row)}
+
+    def curve(self, step):
+        """``(steps, losses)`` arrays for every held step up to ``step``."""
+        self.snapshot(step)
+        rows = self.ring.history(int(round(step)) + 1)
+        return rows[:, 0], rows[:, 1]